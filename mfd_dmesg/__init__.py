@@ -3,5 +3,16 @@
 """Module for MFD Dmesg."""
 
 from .base import Dmesg
+from .buffer import DmesgBuffer
+from .capabilities import DmesgCapabilities
+from .async_dmesg import AsyncDmesg, AsyncDmesgFollower
+from .digest import DmesgDigest
 from .constants import OSPackageInfo, FAILS, INVALID_MODULE_ERRORS, KNOWN_ERRORS
 from .enums import DmesgLevelOptions
+from .fleet import DmesgFleet, FleetResult
+from .follow import DmesgFollower
+from .records import DmesgRecord
+from .replay import RecordingConnection, ReplayConnection
+from .ring import DmesgRingBuffer
+from .snapshot import DmesgSnapshot
+from .templates import MessageTemplate
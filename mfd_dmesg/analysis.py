@@ -0,0 +1,238 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Analysis of dmesg records, shared by Dmesg and DmesgSnapshot, without any remote execution."""
+
+import logging
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Pattern, Tuple, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from mfd_dmesg.constants import (
+    OSPackageInfo,
+    VERIFY_LOG_BAD_WORDS,
+    VERIFY_LOG_EXPECTED_LOGS,
+    VERIFY_LOG_FREEBSD_BAD_WORDS,
+    VERIFY_LOG_KNOWN_ERRORS,
+)
+from mfd_dmesg.exceptions import BadWordInLog
+from mfd_dmesg.matcher import compile_patterns, get_whitelist_matcher, scan
+from mfd_dmesg.records import DmesgRecord, parse_records
+from mfd_dmesg.templates import mine_templates
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+# literal part of OS_PACKAGE_RE used to preselect lines, case insensitive
+OS_PACKAGE_KEYWORD = "package was successfully loaded"
+OS_PACKAGE_RE = re.compile(
+    ".+: The (?P<package_name>.+) package was successfully loaded: "
+    "(?P<package_file>.+) version (?P<package_version>.+)",
+    flags=re.IGNORECASE,
+)
+
+
+def find_buffer_size_data(
+    records: Iterable[DmesgRecord], driver_name: str, driver_interface_number: str
+) -> List[re.Match]:
+    """
+    Find driver buffer size information.
+
+    :param records: dmesg records
+    :param driver_name: name of the driver
+    :param driver_interface_number: driver interface number
+    :return: list of buffer size match objects
+    """
+    buffer_size_regex = re.compile(
+        rf"{driver_name}{driver_interface_number}: "
+        r"using (?P<tx>\d*) tx descriptors and (?P<rx>\d*) rx descriptors$",
+        re.IGNORECASE,
+    )
+    return [match for match in (buffer_size_regex.match(record.message) for record in records) if match]
+
+
+def find_os_package_info(records: Iterable[DmesgRecord]) -> Optional[OSPackageInfo]:
+    """
+    Find loaded OS package information.
+
+    :param records: dmesg records
+    :return: OSPackageInfo of first loaded package or None when not found
+    """
+    for record in records:
+        match = OS_PACKAGE_RE.match(record.text)
+        if match:
+            package_name = match.group("package_name")
+            package_file = match.group("package_file")
+            package_version = match.group("package_version")
+            return OSPackageInfo(package_name, package_file, package_version)
+    return None
+
+
+def filter_error_records(
+    records: Iterable[DmesgRecord],
+    extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None,
+    keyword_required: bool = False,
+) -> List[DmesgRecord]:
+    """
+    Drop records which are not errors or are known to be benign.
+
+    :param records: dmesg records to be classified
+    :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
+    :param keyword_required: consider only lines containing word error, used when records are not filtered by level
+    :return: list of records which are considered errors
+    """
+    whitelist = get_whitelist_matcher(extra_whitelist)
+    errors = []
+    for record in records:
+        error = record.text
+        if keyword_required and "error" not in error.lower():
+            continue
+        if whitelist.search(error):
+            logger.log(
+                level=log_levels.MODULE_DEBUG,
+                msg=f'Ignored error "{error}" in dmesg because it is known to be benign',
+            )
+        else:
+            errors.append(record)
+    return errors
+
+
+def filter_errors(
+    records: Iterable[DmesgRecord],
+    extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None,
+    keyword_required: bool = False,
+) -> List[str]:
+    """
+    Drop records which are not errors or are known to be benign, see filter_error_records.
+
+    :param records: dmesg records to be classified
+    :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
+    :param keyword_required: consider only lines containing word error, used when records are not filtered by level
+    :return: list of lines which are considered errors
+    """
+    return [record.text for record in filter_error_records(records, extra_whitelist, keyword_required)]
+
+
+def verification_result(errors: List[DmesgRecord], aggregate: bool = False) -> dict:
+    """
+    Build result of verify_messages.
+
+    :param errors: records considered errors
+    :param aggregate: collapse messages which differ only in variable tokens into templates
+    :return: dictionary indicating success or failure and the error messages if present,
+             with list of MessageTemplate under "templates" key when aggregate is set
+    """
+    result = {"successful": not errors, "error": ""}
+    if aggregate:
+        templates = mine_templates(errors)
+        result["templates"] = templates
+        result["error"] = "\n".join(str(template) for template in templates).strip()
+    elif errors:
+        result["error"] = "\n".join(record.text for record in errors).strip()
+    return result
+
+
+def find_errors(records: Iterable[DmesgRecord], error_list: list) -> Tuple[bool, List[str]]:
+    """
+    Look for user defined errors.
+
+    :param records: dmesg records
+    :param error_list: list of errors to be looked out in the dmesg log
+    :return: tuple indicating success or failure and the list of error messages if present,
+             line is reported once per matching entry of error_list
+    """
+    detected_fails_list = list()
+    pattern_sets = {"error": compile_patterns(error_list, literal=True)}
+    occurrences = Counter(error_list)
+    for hit in scan((record.text for record in records), pattern_sets):
+        for fail in hit.categories["error"]:
+            logger.log(
+                level=log_levels.MODULE_DEBUG,
+                msg=f"User defined error present:\n{hit.line}",
+            )
+            detected_fails_list.extend([hit.line] * occurrences[fail])
+
+    if detected_fails_list:
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Error(s) present in dmesg logs:\n{detected_fails_list}")
+        return (False, detected_fails_list)
+    logger.log(level=log_levels.MODULE_DEBUG, msg="Not found any user defined errors in dmesg log.")
+    return (True, detected_fails_list)
+
+
+def find_str(records: List[DmesgRecord], lookout_str: str, service_name: Optional[str] = None) -> bool:
+    """
+    Look for user specified string.
+
+    :param records: dmesg records
+    :param lookout_str: user specified string to be searched in the dmesg logs
+    :param service_name: service the records were limited to, used for logging only
+    :return: True if string is present in any record, False otherwise
+    """
+    if not records:
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"No logs found for service {service_name} in dmesg")
+        return False
+    for record in records:
+        if lookout_str in record.text:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Log found in dmesg")
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Line: {record.text}")
+            return True
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"User specified {lookout_str} not present in dmesg log")
+    return False
+
+
+def verify_linux_log(log: str) -> str:
+    """
+    Check driver log for bad words.
+
+    :param log: dmesg output limited to the driver
+    :return: empty string if no errors found, whole log otherwise
+    :raise BadWordInLog: Bad (ie. non-inclusive, offensive etc.) word found in log
+    """
+    if not log:
+        return ""
+
+    # Look for bad words and whether they constitute error in log:)
+    pattern_sets = {
+        "known": compile_patterns(VERIFY_LOG_KNOWN_ERRORS + VERIFY_LOG_EXPECTED_LOGS, literal=True),
+        "bad_word": compile_patterns(VERIFY_LOG_BAD_WORDS, literal=True, ignore_case=True),
+    }
+    for hit in scan((record.text for record in parse_records(log)), pattern_sets):
+        if "known" in hit.categories:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Error log line: '{hit.line}'.")
+            continue
+
+        word = hit.categories["bad_word"][0]
+        msg = f"Word '{word}' found in log line: '{hit.line}'"
+        if VERIFY_LOG_BAD_WORDS[word]:
+            raise BadWordInLog(msg)
+        # Return the whole log if something bad was found
+        logger.log(level=log_levels.MODULE_DEBUG, msg=msg)
+        return log
+    # Everything is ok
+    return ""
+
+
+def verify_freebsd_log(log: str, driver: str) -> str:
+    """
+    Check lines of the driver for bad words.
+
+    :param log: whole dmesg output
+    :param driver: Name of the driver such as ix
+    :return: empty string if no errors found, whole log otherwise
+    """
+    if not log:
+        return ""
+
+    # Look for bad words in log:)
+    pattern_sets = {"bad_word": compile_patterns(VERIFY_LOG_FREEBSD_BAD_WORDS, literal=True, ignore_case=True)}
+
+    # Find lines that starts with service name and contain fail or hang keyword
+    driver_lines = (record.text for record in parse_records(log) if record.text.startswith(driver))
+    for hit in scan(driver_lines, pattern_sets):
+        # Return the whole log if something bad was found
+        word = hit.categories["bad_word"][0]
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Word '{word}' found in log line: {hit.line}")
+        return log
+    # Everything is ok
+    return ""
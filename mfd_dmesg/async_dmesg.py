@@ -0,0 +1,384 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Asyncio API for Dmesg."""
+
+import asyncio
+import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple, Union, TYPE_CHECKING
+
+from mfd_dmesg.base import Dmesg
+from mfd_dmesg.capabilities import DmesgCapabilities
+from mfd_dmesg.buffer import DmesgBuffer
+from mfd_dmesg.constants import OSPackageInfo
+from mfd_dmesg.digest import DmesgDigest
+from mfd_dmesg.enums import DmesgLevelOptions
+from mfd_dmesg.follow import DmesgFollower
+from mfd_dmesg.records import DmesgRecord
+from mfd_dmesg.snapshot import DmesgSnapshot
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+DEFAULT_MAX_WORKERS = 64
+_default_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    """Get thread pool shared by all AsyncDmesg objects which were not given own executor."""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="async-dmesg")
+    return _default_executor
+
+
+async def _offload(executor: ThreadPoolExecutor, function: Callable, timeout: Optional[float]) -> Any:
+    """
+    Run blocking function in the executor.
+
+    :param executor: thread pool to run the function in
+    :param function: function without arguments
+    :param timeout: time in seconds to wait for the result, wait indefinitely when None
+    :return: result of the function
+    :raises asyncio.TimeoutError: when function did not finish in time
+    """
+    future = asyncio.get_running_loop().run_in_executor(executor, function)
+    return await asyncio.wait_for(future, timeout=timeout)
+
+
+class AsyncDmesgFollower:
+    """Asynchronous iterator over lines of DmesgFollower."""
+
+    def __init__(self, follower: DmesgFollower, executor: ThreadPoolExecutor, poll_interval: float = 0.5):
+        """
+        Initialize follower.
+
+        :param follower: started DmesgFollower
+        :param executor: thread pool used to wait for lines
+        :param poll_interval: maximum time in seconds single wait for a line blocks a worker thread
+        """
+        self._follower = follower
+        self._executor = executor
+        self._poll_interval = poll_interval
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Get next line.
+
+        :param timeout: time in seconds to wait for the line, wait until line arrives when None
+        :return: next line or None when timeout expired or stream ended
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            wait_time = self._poll_interval if deadline is None else min(self._poll_interval, deadline - loop.time())
+            line = await _offload(self._executor, functools.partial(self._follower.get, max(wait_time, 0)), None)
+            if line is not None or not self._follower.running:
+                return line
+            if deadline is not None and loop.time() >= deadline:
+                return None
+
+    async def stop(self) -> None:
+        """Stop remote process."""
+        await _offload(self._executor, self._follower.stop, None)
+
+    def __aiter__(self) -> "AsyncDmesgFollower":
+        return self
+
+    async def __anext__(self) -> str:
+        line = await self.get()
+        if line is None:
+            raise StopAsyncIteration
+        return line
+
+    async def __aenter__(self) -> "AsyncDmesgFollower":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+
+class AsyncDmesg:
+    """
+    Coroutine based API mirroring Dmesg.
+
+    Blocking Dmesg calls are offloaded to a bounded thread pool shared by all instances,
+    so many hosts can be monitored from one event loop.
+    Calls on the same host are serialized, every call accepts timeout in seconds.
+    Cancelling a coroutine returns control immediately, the remote command already sent is left to finish.
+    """
+
+    def __init__(self, dmesg: Dmesg, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Initialize object.
+
+        :param dmesg: Dmesg object for the host
+        :param executor: thread pool for blocking calls, shared default pool when None
+        """
+        self.dmesg = dmesg
+        self._executor = executor or _get_default_executor()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def create(
+        cls,
+        *,
+        connection: "Connection",
+        cache_ttl: Optional[float] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        timeout: Optional[float] = None,
+    ) -> "AsyncDmesg":
+        """
+        Create Dmesg object without blocking event loop.
+
+        :param connection: mfd_connect object for remote connection handling
+        :param cache_ttl: cache_ttl passed to Dmesg
+        :param executor: thread pool for blocking calls, shared default pool when None
+        :param timeout: time in seconds to wait for Dmesg initialization
+        :return: AsyncDmesg object
+        """
+        executor = executor or _get_default_executor()
+        dmesg = await _offload(executor, functools.partial(Dmesg, connection=connection, cache_ttl=cache_ttl), timeout)
+        return cls(dmesg, executor=executor)
+
+    async def _run_locked(self, function: Callable) -> Any:
+        """
+        Run blocking function in thread pool, one at a time per host.
+
+        Host stays locked until the function really finishes, even if awaiting coroutine was cancelled.
+
+        :param function: function without arguments
+        :return: result of the function
+        """
+        await self._lock.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, function)
+        except BaseException:
+            self._lock.release()
+            raise
+        future.add_done_callback(lambda _: self._lock.release())
+        return await asyncio.shield(future)
+
+    async def _call(self, method: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Call blocking Dmesg method in thread pool.
+
+        :param method: bound Dmesg method
+        :param args: positional arguments of the method
+        :param timeout: time in seconds to wait for the result, including waiting for other calls on the host
+        :param kwargs: keyword arguments of the method
+        :return: result of the method
+        :raises asyncio.TimeoutError: when method did not finish in time
+        """
+        return await asyncio.wait_for(self._run_locked(functools.partial(method, *args, **kwargs)), timeout=timeout)
+
+    async def check_if_available(self, timeout: Optional[float] = None) -> None:
+        """Coroutine version of Dmesg.check_if_available."""
+        return await self._call(self.dmesg.check_if_available, timeout=timeout)
+
+    async def get_version(self, timeout: Optional[float] = None) -> str:
+        """Coroutine version of Dmesg.get_version."""
+        return await self._call(self.dmesg.get_version, timeout=timeout)
+
+    async def probe_capabilities(self, timeout: Optional[float] = None) -> DmesgCapabilities:
+        """Coroutine version of Dmesg.probe_capabilities."""
+        return await self._call(self.dmesg.probe_capabilities, timeout=timeout)
+
+    async def get_messages(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        since: Optional[Union[float, datetime.datetime]] = None,
+        until: Optional[Union[float, datetime.datetime]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Coroutine version of Dmesg.get_messages."""
+        return await self._call(
+            self.dmesg.get_messages, level=level, service_name=service_name, since=since, until=until, timeout=timeout
+        )
+
+    async def get_records(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        since: Optional[Union[float, datetime.datetime]] = None,
+        until: Optional[Union[float, datetime.datetime]] = None,
+        structured: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[DmesgRecord]:
+        """Coroutine version of Dmesg.get_records."""
+        return await self._call(
+            self.dmesg.get_records,
+            level=level,
+            service_name=service_name,
+            since=since,
+            until=until,
+            structured=structured,
+            timeout=timeout,
+        )
+
+    async def snapshot(
+        self, service_name: str = None, indexed: bool = False, timeout: Optional[float] = None
+    ) -> DmesgSnapshot:
+        """Coroutine version of Dmesg.snapshot, queries of returned snapshot are local and do not block."""
+        return await self._call(self.dmesg.snapshot, service_name=service_name, indexed=indexed, timeout=timeout)
+
+    async def get_buffer(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        timeout: Optional[float] = None,
+    ) -> DmesgBuffer:
+        """Coroutine version of Dmesg.get_buffer."""
+        return await self._call(self.dmesg.get_buffer, level=level, service_name=service_name, timeout=timeout)
+
+    async def get_messages_by_level(
+        self, service_name: str = None, timeout: Optional[float] = None
+    ) -> Dict[DmesgLevelOptions, str]:
+        """Coroutine version of Dmesg.get_messages_by_level."""
+        return await self._call(self.dmesg.get_messages_by_level, service_name=service_name, timeout=timeout)
+
+    async def follow(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        only_new: bool = False,
+        queue_size: int = 1000,
+        timeout: Optional[float] = None,
+    ) -> AsyncDmesgFollower:
+        """Coroutine version of Dmesg.follow, returns asynchronous iterator over new lines."""
+        follower = await self._call(
+            self.dmesg.follow, level=level, only_new=only_new, queue_size=queue_size, timeout=timeout
+        )
+        return AsyncDmesgFollower(follower, self._executor)
+
+    async def get_buffer_size_data(
+        self, driver_name: str, driver_interface_number: str, timeout: Optional[float] = None
+    ) -> Optional[list]:
+        """Coroutine version of Dmesg.get_buffer_size_data."""
+        return await self._call(
+            self.dmesg.get_buffer_size_data, driver_name, driver_interface_number, timeout=timeout
+        )
+
+    async def get_os_package_info(self, timeout: Optional[float] = None) -> Union[OSPackageInfo, None]:
+        """Coroutine version of Dmesg.get_os_package_info."""
+        return await self._call(self.dmesg.get_os_package_info, timeout=timeout)
+
+    async def get_messages_additional(
+        self,
+        service_name: str = None,
+        lines: int = 1000,
+        expected_return_codes: Iterable = frozenset({0}),
+        additional_greps: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Coroutine version of Dmesg.get_messages_additional."""
+        return await self._call(
+            self.dmesg.get_messages_additional,
+            service_name=service_name,
+            lines=lines,
+            expected_return_codes=expected_return_codes,
+            additional_greps=additional_greps,
+            timeout=timeout,
+        )
+
+    async def get_digest(
+        self, error_list: Optional[Iterable[str]] = None, timeout: Optional[float] = None
+    ) -> DmesgDigest:
+        """Coroutine version of Dmesg.get_digest."""
+        return await self._call(self.dmesg.get_digest, error_list=error_list, timeout=timeout)
+
+    async def verify_messages(
+        self,
+        extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None,
+        aggregate: bool = False,
+        digest: Optional[DmesgDigest] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """Coroutine version of Dmesg.verify_messages."""
+        return await self._call(
+            self.dmesg.verify_messages,
+            extra_whitelist=extra_whitelist,
+            aggregate=aggregate,
+            digest=digest,
+            timeout=timeout,
+        )
+
+    async def clear_messages(
+        self,
+        errors_filter: Optional[List[str]] = None,
+        ignore_filter: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[str, List[str]]:
+        """Coroutine version of Dmesg.clear_messages."""
+        return await self._call(
+            self.dmesg.clear_messages,
+            errors_filter=errors_filter or [],
+            ignore_filter=ignore_filter or [],
+            timeout=timeout,
+        )
+
+    async def clear_messages_after_error(
+        self, error_msg: str, timeout: Optional[float] = None
+    ) -> Union[Tuple[str, List[str]], None]:
+        """Coroutine version of Dmesg.clear_messages_after_error."""
+        return await self._call(self.dmesg.clear_messages_after_error, error_msg, timeout=timeout)
+
+    async def check_errors(
+        self,
+        error_list: list,
+        remote_filter: bool = False,
+        digest: Optional[DmesgDigest] = None,
+        timeout: Optional[float] = None,
+    ) -> tuple:
+        """Coroutine version of Dmesg.check_errors."""
+        return await self._call(
+            self.dmesg.check_errors, error_list, remote_filter=remote_filter, digest=digest, timeout=timeout
+        )
+
+    async def check_str_present(
+        self,
+        service_name: str,
+        lookout_str: str,
+        additional_greps: Optional[List[str]] = None,
+        remote_filter: bool = False,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Coroutine version of Dmesg.check_str_present."""
+        return await self._call(
+            self.dmesg.check_str_present,
+            service_name=service_name,
+            lookout_str=lookout_str,
+            additional_greps=additional_greps,
+            remote_filter=remote_filter,
+            timeout=timeout,
+        )
+
+    async def check_messages_format(
+        self, driver: str, time_format: str = "%Y-%m-%dT%H:%M:%S.%fZ", timeout: Optional[float] = None
+    ) -> Union[bool, None]:
+        """Coroutine version of Dmesg.check_messages_format."""
+        return await self._call(self.dmesg.check_messages_format, driver, time_format=time_format, timeout=timeout)
+
+    async def get_records_after(
+        self,
+        sequence: Optional[int] = None,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        timeout: Optional[float] = None,
+    ) -> List[DmesgRecord]:
+        """Coroutine version of Dmesg.get_records_after."""
+        return await self._call(self.dmesg.get_records_after, sequence=sequence, level=level, timeout=timeout)
+
+    async def check_new_errors(
+        self, extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None, timeout: Optional[float] = None
+    ) -> dict:
+        """Coroutine version of Dmesg.check_new_errors."""
+        return await self._call(self.dmesg.check_new_errors, extra_whitelist=extra_whitelist, timeout=timeout)
+
+    async def verify_log(self, driver: str, timeout: Optional[float] = None) -> str:
+        """Coroutine version of Dmesg.verify_log."""
+        return await self._call(self.dmesg.verify_log, driver, timeout=timeout)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached dmesg output, see Dmesg.invalidate_cache."""
+        self.dmesg.invalidate_cache()
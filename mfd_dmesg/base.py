@@ -2,32 +2,89 @@
 # SPDX-License-Identifier: MIT
 """Dmesg module."""
 
+import base64
 import datetime
+import gzip
 import logging
-import re
-from typing import Iterable, Optional, Union, List, Tuple, TYPE_CHECKING
+import math
+import time
+import warnings
+from contextlib import contextmanager
+from subprocess import CalledProcessError
+from typing import Callable, Dict, Iterable, Iterator, Optional, Pattern, Type, Union, List, Tuple, TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels, os_supported
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_connect.exceptions import ConnectionCalledProcessError
 from mfd_base_tool import ToolTemplate
 from mfd_typing import OSName
 
-from mfd_dmesg.constants import DMESG_WHITELIST
+from mfd_dmesg.analysis import (  # noqa: F401
+    OS_PACKAGE_KEYWORD,
+    OS_PACKAGE_RE,
+    filter_error_records,
+    filter_errors,
+    find_buffer_size_data,
+    find_errors,
+    find_os_package_info,
+    find_str,
+    verify_freebsd_log,
+    verification_result,
+    verify_linux_log,
+)
+from mfd_dmesg.buffer import DmesgBuffer
+from mfd_dmesg.capabilities import (
+    VERSION_RE,
+    DmesgCapabilities,
+    build_probe_command,
+    build_time_window_check,
+    get_version_numbers,
+    parse_probe,
+)
+from mfd_dmesg.constants import (
+    ACC_IMC_LEVEL_KEYWORDS,
+    COMPRESSED_RETURN_CODE_MARKER,
+    JSON_MIN_VERSION,
+    KMSG_ERR_LEVEL,
+    KMSG_PATH,
+    TIME_WINDOW_MIN_VERSION,
+)
 from mfd_dmesg.constants import DmesgLevelOptions, OSPackageInfo
-from mfd_dmesg.exceptions import DmesgException, DmesgNotAvailable, DmesgExecutionError, BadWordInLog
+from mfd_dmesg.digest import DmesgDigest, digest_awk, parse_digest
+from mfd_dmesg.exceptions import DmesgException, DmesgNotAvailable, DmesgExecutionError, RoundTripBudgetExceeded
+from mfd_dmesg.follow import DmesgFollower
+from mfd_dmesg.matcher import compile_patterns, scan
+from mfd_dmesg.records import (
+    LEVEL_NAMES,
+    DmesgRecord,
+    find_time_window,
+    get_effective_timestamps,
+    parse_json_records,
+    parse_kmsg_record,
+    parse_records,
+)
+from mfd_dmesg.remote import (
+    COMPACT_JSON,
+    KMSG_READ,
+    fixed_strings_grep,
+    is_basic_regex,
+    kmsg_awk,
+    last_lines_awk,
+    parse_kmsg_trailer,
+)
+from mfd_dmesg.snapshot import DmesgSnapshot
+from mfd_dmesg.stats import CallStats, DmesgStats, RoundTripBudget, instrumented, received_bytes
 
 if TYPE_CHECKING:
     from mfd_connect import Connection
 
 logger = logging.getLogger(__name__)
 add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
-RUNNING_ERRORS = []
 
-OS_PACKAGE_RE = re.compile(
-    ".+: The (?P<package_name>.+) package was successfully loaded: "
-    "(?P<package_file>.+) version (?P<package_version>.+)",
-    flags=re.IGNORECASE,
-)
+
+def _format_utc(timestamp: int) -> str:
+    # format accepted by --since and --until of all util-linux versions supporting them, host has to use TZ=UTC
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
 
 class Dmesg(ToolTemplate):
@@ -40,14 +97,36 @@ class Dmesg(ToolTemplate):
     }
 
     @os_supported(OSName.LINUX, OSName.FREEBSD, OSName.ESXI)
-    def __init__(self, *, connection: "Connection"):
+    def __init__(
+        self,
+        *,
+        connection: "Connection",
+        cache_ttl: Optional[float] = None,
+        compress_transfer: bool = False,
+        collect_stats: bool = False,
+        stats_callback: Optional[Callable[[CallStats], None]] = None,
+    ):
         """
         Initialize connection.
 
         :param connection: mfd_connect object for remote connection handling
+        :param cache_ttl: time in seconds for which output of get_messages is reused for the same level and service,
+                          caching is disabled when None
+        :param compress_transfer: compress large outputs on the host before transfer when gzip and base64 are available
+        :param collect_stats: measure commands, received bytes, remote and local time of public methods in stats
+        :param stats_callback: called with CallStats of every finished public method call, enables collect_stats
         """
+        self.stats = DmesgStats(enabled=collect_stats or stats_callback is not None, callback=stats_callback)
+        self._budgets: List[RoundTripBudget] = []
+        self.capabilities = DmesgCapabilities()
         self.os_name = connection.get_os_name()
+        self.cache_ttl = cache_ttl
+        self.compress_transfer = compress_transfer
+        self._cache: Dict[Tuple[DmesgLevelOptions, Optional[str]], Tuple[float, str]] = {}
         super().__init__(connection=connection)
+        self._boot_time: Optional[float] = None
+        self._last_error_sequence: Optional[int] = None
+        self._running_errors: List[str] = []
 
     def _get_tool_exec_factory(self) -> str:
         return self.tool_executable_name[self._connection.get_os_name()]
@@ -59,6 +138,119 @@ class Dmesg(ToolTemplate):
         """
         return self.os_name == OSName.LINUX
 
+    def _execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """Execute command on the host, accounting it in statistics of the measured call.
+
+        :param command: command to execute
+        :param kwargs: arguments of execute_command
+        :return: completed process
+        """
+        for budget in self._budgets:
+            budget.commands.append(command)
+        call = self.stats.current
+        if call is None:
+            return self._connection.execute_command(command, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = self._connection.execute_command(command, **kwargs)
+        except CalledProcessError as e:
+            call.bytes_received += received_bytes(e)
+            raise
+        finally:
+            call.commands += 1
+            call.remote_time += time.perf_counter() - start
+        call.bytes_received += received_bytes(result)
+        return result
+
+    @contextmanager
+    def round_trip_budget(self, max_commands: int, on_exceed: str = "raise") -> Iterator[RoundTripBudget]:
+        """
+        Count commands executed on the host through this object within the block.
+
+        Budget is checked when the block finishes without exception, budgets can be nested.
+
+        :param max_commands: maximum number of commands allowed in the block
+        :param on_exceed: "raise" to raise RoundTripBudgetExceeded, "warn" to issue RuntimeWarning
+        :return: budget with list of executed commands
+        :raises RoundTripBudgetExceeded: when more commands were executed and on_exceed is "raise"
+        :raises ValueError: when on_exceed is not supported
+        """
+        if on_exceed not in ("raise", "warn"):
+            raise ValueError(f"Unsupported on_exceed value: {on_exceed}")
+        budget = RoundTripBudget(max_commands)
+        self._budgets.append(budget)
+        try:
+            yield budget
+        finally:
+            self._budgets.remove(budget)
+        if budget.exceeded:
+            message = (
+                f"{len(budget.commands)} commands executed, budget was {max_commands}: "
+                + "; ".join(budget.commands)
+            )
+            if on_exceed == "raise":
+                raise RoundTripBudgetExceeded(message)
+            logger.log(level=log_levels.MODULE_DEBUG, msg=message)
+            warnings.warn(message, RuntimeWarning, stacklevel=3)
+
+    def _is_compression_available(self) -> bool:
+        """Check once per instance if output can be compressed on the host.
+
+        :return: True if gzip and base64 are available on the host, False otherwise
+        """
+        if self.capabilities.compression is None:
+            result = self._execute_command(
+                "command -v gzip && command -v base64", shell=True, expected_return_codes=None, discard_stdout=True
+            )
+            self.capabilities.compression = result.return_code == 0
+            logger.log(
+                level=log_levels.MODULE_DEBUG, msg=f"Compressed transfer available: {self.capabilities.compression}"
+            )
+        return self.capabilities.compression
+
+    def _transfer(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Optional[Iterable] = frozenset({0}),
+        custom_exception: Optional[Type[CalledProcessError]] = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """Execute command with potentially large output, compressed when enabled and available on the host.
+
+        Compressed output is base64 encoded, so it passes through every connection type.
+        Return code of the command is transferred inside compressed stream and checked locally.
+
+        :param command: command to execute, it is executed in shell
+        :param expected_return_codes: return codes to be considered acceptable, any when None
+        :param custom_exception: exception raised on unexpected return code
+        :param kwargs: other arguments of execute_command
+        :return: completed process with decompressed stdout
+        """
+        if not (self.compress_transfer and self._is_compression_available()):
+            if custom_exception is not None:
+                kwargs["custom_exception"] = custom_exception
+            if expected_return_codes != frozenset({0}):
+                kwargs["expected_return_codes"] = expected_return_codes
+            return self._execute_command(command, **kwargs)
+
+        kwargs["shell"] = True
+        result = self._execute_command(
+            f'{{ {command}; echo "{COMPRESSED_RETURN_CODE_MARKER}$?"; }} | gzip -c | base64', **kwargs
+        )
+        compressed = base64.b64decode(result.stdout)
+        decompressed = gzip.decompress(compressed).decode("utf-8", errors="backslashreplace")
+        output, _, return_code = decompressed.rpartition(COMPRESSED_RETURN_CODE_MARKER)
+        return_code = int(return_code)
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Received {len(result.stdout)} bytes for {len(output)} bytes of output ({len(compressed)} compressed)",
+        )
+        if expected_return_codes is not None and return_code not in expected_return_codes:
+            raise (custom_exception or ConnectionCalledProcessError)(returncode=return_code, cmd=command, output=output)
+        return ConnectionCompletedProcess(args=command, stdout=output, stderr=result.stderr, return_code=return_code)
+
+    @instrumented
     def check_if_available(self) -> None:
         """
         Check if tool is available in system.
@@ -67,64 +259,391 @@ class Dmesg(ToolTemplate):
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg="Check if Dmesg is available.")
         command = f"{self._tool_exec}"
-        self._connection.execute_command(command, custom_exception=DmesgNotAvailable, discard_stdout=True)
+        self._execute_command(command, custom_exception=DmesgNotAvailable, discard_stdout=True)
 
+    @instrumented
     def get_version(self) -> str:
         """
-        Get Dmesg version.
+        Get Dmesg version, it is read from the host once per instance.
 
         :return Dmesg version or "N/A" when it cannot read it.
         """
+        if self.capabilities.version is not None:
+            return self.capabilities.version
         logger.log(level=log_levels.MODULE_DEBUG, msg="Get Dmesg Version.")
-        version_regex = r"dmesg\sfrom\sutil-linux\s(?P<version>.*)"
+        version = "NA"
         if self._is_linux():
-            result = self._connection.execute_command(
+            result = self._execute_command(
                 f"{self._tool_exec} -V",
                 expected_return_codes=None,
                 stderr_to_stdout=True,
                 custom_exception=DmesgExecutionError,
             ).stdout
-            match = re.search(version_regex, result, re.M)
+            match = VERSION_RE.search(result)
             if match:
-                return match.group("version").rstrip()
+                version = match.group("version").rstrip()
         else:
             logger.log(
                 level=log_levels.MODULE_DEBUG,
                 msg=f"There is no support to check {self._tool_exec} version in {self.os_name.value}",
             )
-        return "NA"
+        self.capabilities.version = version
+        return version
+
+    @instrumented
+    def probe_capabilities(self) -> DmesgCapabilities:
+        """
+        Detect all features of dmesg and the host with single command and remember them for the instance.
 
-    def get_messages(self, level: DmesgLevelOptions = DmesgLevelOptions.NONE, service_name: str = None) -> str:
+        Without probing, features are detected lazily on first use, and remembered as well.
+        Output of probed dmesg commands is discarded on the host, only return codes are transferred.
+
+        :return: DmesgCapabilities, also available as capabilities attribute
+        """
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Probe Dmesg capabilities.")
+        if self._is_linux():
+            result = self._execute_command(
+                build_probe_command(self._tool_exec), shell=True, expected_return_codes=None
+            ).stdout
+            self.capabilities = parse_probe(result)
+        else:
+            self.capabilities.version = "NA"
+            self.capabilities.raw = self.capabilities.json = self.capabilities.time_window = False
+            self.capabilities.follow = self.capabilities.kmsg_readable = False
+            self._is_compression_available()
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Dmesg capabilities: {self.capabilities}")
+        return self.capabilities
+
+    @instrumented
+    def get_messages(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        since: Optional[Union[float, datetime.datetime]] = None,
+        until: Optional[Union[float, datetime.datetime]] = None,
+    ) -> str:
         """
         Read the message buffer of the kernel (dmesg).
 
         For ACC and IMC systems different set of commands need to be executed.
+        When cache_ttl is set, output fetched within cache_ttl seconds for the same level and service is reused.
+        Time window bounds are either seconds since boot, as printed in dmesg timestamps,
+        or datetime (naive one is local time of this machine), see _get_messages_in_window.
 
         :param service_name: limits dmesg messages only to provided service
         :param level: limits dmesg messages only to provided by DmesgLevelOptions
+        :param since: limits dmesg messages to ones logged at or after
+        :param until: limits dmesg messages to ones logged at or before
         :return: dmesg output
         """
+        if since is not None or until is not None:
+            return self._get_messages_in_window(level, service_name, since, until)
         logger.log(level=log_levels.MODULE_DEBUG, msg="Get Dmesg Output")
+        if self.cache_ttl is not None:
+            cached = self._cache.get((level, service_name))
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                logger.log(level=log_levels.MODULE_DEBUG, msg="Use cached Dmesg Output")
+                return cached[1]
+        out = self._fetch_messages(level=level, service_name=service_name).stdout.strip()
+        if self.cache_ttl is not None:
+            self._cache[(level, service_name)] = (time.monotonic(), out)
+        return out
+
+    def _get_messages_in_window(
+        self,
+        level: DmesgLevelOptions,
+        service_name: Optional[str],
+        since: Optional[Union[float, datetime.datetime]],
+        until: Optional[Union[float, datetime.datetime]],
+    ) -> str:
+        """
+        Read messages logged within time window.
+
+        When both bounds are datetimes and dmesg supports --since and --until, the window is selected on the host
+        with one second precision (times are passed as UTC date, @epoch is rejected by some util-linux versions)
+        and the result is trimmed to exact bounds locally. Otherwise the output of get_messages (cached when
+        cache_ttl is set) is parsed and the window is found by binary search over timestamps, datetimes are
+        converted to seconds since boot.
+
+        :param level: limits dmesg messages only to provided by DmesgLevelOptions
+        :param service_name: limits dmesg messages only to lines containing provided service
+        :param since: seconds since boot or datetime, window start (inclusive)
+        :param until: seconds since boot or datetime, window end (inclusive)
+        :return: dmesg output
+        :raises DmesgException: when datetime is given on host other than Linux
+        """
+        bounds = [bound for bound in (since, until) if bound is not None]
+        if all(isinstance(bound, datetime.datetime) for bound in bounds) and self._is_time_window_supported():
+            command = self._tool_exec
+            if level is not DmesgLevelOptions.NONE:
+                command += f" --level={level.value}"
+            if since is not None:
+                command += f" --since '{_format_utc(math.floor(since.timestamp()))}'"
+            if until is not None:
+                command += f" --until '{_format_utc(math.ceil(until.timestamp()))}'"
+            try:
+                output = self._transfer(f"TZ=UTC {command}", shell=True).stdout
+            except ConnectionCalledProcessError as e:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Select time window locally, dmesg failed: {e}")
+                # failure can be caused by other options, e.g. --level on ACC and IMC systems
+                self._check_time_window()
+            else:
+                lines = output.strip().splitlines()
+                if service_name is not None:
+                    lines = [line for line in lines if service_name in line]
+                if all(bound.timestamp() % 1 == 0 for bound in bounds):
+                    return "\n".join(lines)
+                # whole seconds sent to dmesg widen the window, so it is trimmed as on hosts without time window
+                records = parse_records("\n".join(lines))
+                start, end = find_time_window(
+                    get_effective_timestamps(records),
+                    self._get_seconds_since_boot(since),
+                    self._get_seconds_since_boot(until),
+                )
+                return "\n".join(record.text for record in records[start:end])
+
+        since = self._get_seconds_since_boot(since)
+        until = self._get_seconds_since_boot(until)
+        records = parse_records(self.get_messages(level=level, service_name=service_name))
+        start, end = find_time_window(get_effective_timestamps(records), since, until)
+        return "\n".join(record.text for record in records[start:end])
+
+    def _is_time_window_supported(self) -> bool:
+        """Check once per instance if dmesg on the host supports --since and --until.
+
+        :return: True if util-linux dmesg is new enough and did not reject the window, False otherwise
+        """
+        if self.capabilities.time_window is None:
+            version = get_version_numbers(self.get_version()) if self._is_linux() else ()
+            self.capabilities.time_window = version >= TIME_WINDOW_MIN_VERSION
+            logger.log(
+                level=log_levels.MODULE_DEBUG, msg=f"Dmesg time window supported: {self.capabilities.time_window}"
+            )
+        return self.capabilities.time_window
+
+    def _check_time_window(self) -> bool:
+        """Check if dmesg on the host accepts --since and --until, result is stored in capabilities.
+
+        :return: True if time window is accepted, False otherwise
+        """
+        result = self._execute_command(
+            build_time_window_check(self._tool_exec), shell=True, expected_return_codes=None, discard_stdout=True
+        )
+        self.capabilities.time_window = result.return_code == 0
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Dmesg time window supported: {self.capabilities.time_window}")
+        return self.capabilities.time_window
+
+    def _is_json_supported(self) -> bool:
+        """Check once per instance if dmesg on the host prints records as JSON.
+
+        :return: True if util-linux dmesg is new enough and its JSON output could be read, False otherwise
+        """
+        if self.capabilities.json is None:
+            version = get_version_numbers(self.get_version()) if self._is_linux() else ()
+            self.capabilities.json = version >= JSON_MIN_VERSION
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Dmesg JSON output supported: {self.capabilities.json}")
+        return self.capabilities.json
+
+    def _fetch_json_records(self, level: DmesgLevelOptions) -> Optional[List[DmesgRecord]]:
+        """Read records of dmesg --json output, JSON output is not used again when it cannot be read.
+
+        Output is compacted on the host. Return code of dmesg is lost in the pipeline, so empty output
+        is considered a failure.
+
+        :param level: limits dmesg messages only to provided by DmesgLevelOptions
+        :return: list of DmesgRecord, None when dmesg failed or printed something else than JSON
+        """
+        command = f"{self._tool_exec} --json"
+        if level is not DmesgLevelOptions.NONE:
+            command += f" --level={level.value}"
+        try:
+            output = self._transfer(f"{command} | {COMPACT_JSON}", shell=True).stdout
+            if not output.strip():
+                raise ValueError("Empty output")
+            records = parse_json_records(output)
+        except (ConnectionCalledProcessError, ValueError) as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Dmesg JSON output not available, parse text output: {e}")
+            self.capabilities.json = False
+            return None
+        return records
+
+    def _get_seconds_since_boot(self, moment: Optional[Union[float, datetime.datetime]]) -> Optional[float]:
+        """Convert datetime to seconds since boot of the host, boot time is read once per instance.
+
+        :param moment: datetime, seconds since boot or None
+        :return: seconds since boot or None
+        :raises DmesgException: when datetime is given on host other than Linux
+        """
+        if not isinstance(moment, datetime.datetime):
+            return moment
+        if self._boot_time is None:
+            if not self._is_linux():
+                raise DmesgException(f"Time window given as datetime is not supported on {self.os_name.value}")
+            output = self._execute_command("cat /proc/uptime; date +%s.%N", shell=True).stdout.split()
+            self._boot_time = float(output[-1]) - float(output[0])
+        return moment.timestamp() - self._boot_time
+
+    def _fetch_messages(self, level: DmesgLevelOptions, service_name: Optional[str]) -> ConnectionCompletedProcess:
+        """
+        Execute dmesg on the host, for ACC and IMC systems different set of commands is executed.
+
+        :param level: limits dmesg messages only to provided by DmesgLevelOptions
+        :param service_name: limits dmesg messages only to provided service
+        :return: result of dmesg command
+        """
         command = self._tool_exec
         acc_imc_command = self._tool_exec
-        if f"{level.value}" != "None":
+        with_level = f"{level.value}" != "None"
+        if with_level:
             command += f" --level={level.value} "
             acc_imc_command = self._prepare_imc_acc_command(command=acc_imc_command, level=level)
         if service_name is not None:
             command += f"| grep '{service_name}'"
             acc_imc_command += f"| grep '{service_name}'"
-            try:
-                out = self._connection.execute_command(command, shell=True, expected_return_codes={0, 1}).stdout
-            except ConnectionCalledProcessError:
-                out = self._connection.execute_command(acc_imc_command, shell=True, expected_return_codes={0, 1}).stdout
+        if with_level and self.capabilities.level is False:
+            return self._transfer(acc_imc_command, shell=True, expected_return_codes={0, 1})
 
-        else:
+        try:
+            result = self._transfer(command, shell=True, expected_return_codes={0, 1} if service_name else {0})
+        except ConnectionCalledProcessError:
+            if with_level:
+                logger.log(level=log_levels.MODULE_DEBUG, msg="Dmesg --level not supported, assume ACC or IMC system")
+                self.capabilities.level = False
+            return self._transfer(acc_imc_command, shell=True, expected_return_codes={0, 1})
+        if with_level and service_name is None:
+            # return code of dmesg is lost when output is filtered by grep
+            self.capabilities.level = True
+        return result
+
+    @instrumented
+    def get_buffer(self, level: DmesgLevelOptions = DmesgLevelOptions.NONE, service_name: str = None) -> DmesgBuffer:
+        """
+        Read the message buffer of the kernel (dmesg) into DmesgBuffer.
+
+        Output is kept once as bytes and lines are decoded only when accessed, which keeps memory usage close
+        to the size of the output for huge buffers. When cache_ttl is set, cached get_messages output is used.
+
+        :param level: limits dmesg messages only to provided by DmesgLevelOptions
+        :param service_name: limits dmesg messages only to provided service
+        :return: DmesgBuffer
+        """
+        if self.cache_ttl is not None:
+            return DmesgBuffer(self.get_messages(level=level, service_name=service_name).encode())
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Get Dmesg Output as buffer")
+        return DmesgBuffer.from_completed_process(self._fetch_messages(level=level, service_name=service_name))
+
+    def invalidate_cache(self) -> None:
+        """Drop cached dmesg output, next queries fetch it from the host."""
+        self._cache.clear()
+
+    @instrumented
+    def get_records(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        since: Optional[Union[float, datetime.datetime]] = None,
+        until: Optional[Union[float, datetime.datetime]] = None,
+        structured: bool = False,
+    ) -> List[DmesgRecord]:
+        """
+        Read the message buffer of the kernel (dmesg) and parse it into records.
+
+        With structured set, when dmesg on the host supports --json and neither service name, time window nor cache
+        is used, records are built from JSON fields, so priority, timestamp and caller are exact and lines are
+        formatted like plain dmesg prints them. JSON output is larger and support is detected by get_version,
+        so it is used only on request. Otherwise, or when JSON output cannot be read, text output is parsed.
+
+        :param level: limits dmesg messages only to provided by DmesgLevelOptions
+        :param service_name: limits dmesg messages only to provided service
+        :param since: limits dmesg messages to ones logged at or after, see get_messages
+        :param until: limits dmesg messages to ones logged at or before, see get_messages
+        :param structured: build records from dmesg --json output when supported
+        :return: list of DmesgRecord, one per line of dmesg output
+        """
+        if (
+            structured
+            and service_name is None
+            and since is None
+            and until is None
+            and self.cache_ttl is None
+            and self._is_json_supported()
+        ):
+            records = self._fetch_json_records(level=level)
+            if records is not None:
+                return records
+        return parse_records(self.get_messages(level=level, service_name=service_name, since=since, until=until))
+
+    @instrumented
+    def snapshot(self, service_name: str = None, indexed: bool = False) -> DmesgSnapshot:
+        """
+        Capture the message buffer of the kernel (dmesg) once for local queries.
+
+        On Linux buffer is read in raw mode, so levels of messages are known to the snapshot.
+        When raw mode is not available (other OS, ACC and IMC systems), plain output is captured.
+
+        :param service_name: limits dmesg messages only to provided service
+        :param indexed: use inverted token index for substring lookups of the snapshot, see DmesgSnapshot
+        :return: DmesgSnapshot
+        """
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Capture Dmesg Snapshot")
+        if self._is_linux() and self.capabilities.raw is not False:
+            command = f"{self._tool_exec} -r"
+            if service_name is not None:
+                command += f"| grep '{service_name}'"
             try:
-                out = self._connection.execute_command(command, shell=True).stdout
+                out = self._transfer(command, shell=True, expected_return_codes={0, 1}).stdout
+                if service_name is None:
+                    self.capabilities.raw = True
+                return DmesgSnapshot(out.strip(), os_name=self.os_name, indexed=indexed)
             except ConnectionCalledProcessError:
-                out = self._connection.execute_command(acc_imc_command, shell=True, expected_return_codes={0, 1}).stdout
+                logger.log(level=log_levels.MODULE_DEBUG, msg="Raw mode not available, capture plain messages")
+                self.capabilities.raw = False
+        return DmesgSnapshot(self.get_messages(service_name=service_name), os_name=self.os_name, indexed=indexed)
 
-        return out.strip()
+    @instrumented
+    def get_messages_by_level(self, service_name: str = None) -> Dict[DmesgLevelOptions, str]:
+        """
+        Read the message buffer of the kernel (dmesg) once and split it by level locally.
+
+        On Linux buffer is read in raw mode, where each line has priority prefix, so levels are exact.
+        When raw mode is not available (other OS, ACC and IMC systems), plain output is classified
+        with the same heuristics as used for ACC and IMC systems in get_messages.
+        When cache_ttl is set, buckets read in raw mode are stored in get_messages cache.
+
+        :param service_name: limits dmesg messages only to provided service
+        :return: dmesg output for every DmesgLevelOptions, DmesgLevelOptions.NONE holds all messages
+        """
+        snapshot = self.snapshot(service_name=service_name)
+        buckets = snapshot.get_messages_by_level()
+        if self.cache_ttl is not None and (snapshot.has_levels or not len(snapshot)):
+            now = time.monotonic()
+            for level, out in buckets.items():
+                self._cache[(level, service_name)] = (now, out)
+        return buckets
+
+    def follow(
+        self, level: DmesgLevelOptions = DmesgLevelOptions.NONE, only_new: bool = False, queue_size: int = 1000
+    ) -> DmesgFollower:
+        """
+        Start streaming kernel messages as they arrive using single long-running dmesg process.
+
+        Use it as context manager or call stop() on returned follower to terminate remote process:
+            with dmesg.follow(level=DmesgLevelOptions.ERRORS) as messages:
+                for line in messages:
+                    ...
+
+        :param level: limits dmesg messages only to provided by DmesgLevelOptions
+        :param only_new: skip messages already present in the buffer and print only new ones
+        :param queue_size: maximum number of lines buffered locally before reading of the remote output is paused
+        :return: started DmesgFollower
+        :raises DmesgException: when follow mode is not supported on the OS
+        """
+        if not self._is_linux() or self.capabilities.follow is False:
+            raise DmesgException(f"Follow mode is not supported by {self._tool_exec} on {self.os_name.value}")
+        command = f"{self._tool_exec} {'--follow-new' if only_new else '--follow'}"
+        if f"{level.value}" != "None":
+            command += f" --level={level.value}"
+        return DmesgFollower(connection=self._connection, command=command, queue_size=queue_size).start()
 
     def _prepare_imc_acc_command(self, command: str, level: DmesgLevelOptions) -> str:
         """
@@ -135,15 +654,14 @@ class Dmesg(ToolTemplate):
         :return: Command valid for ACC and IMC systems
         """
         command += ' | grep -v "Step"'
-        if level == DmesgLevelOptions.ERRORS:
-            command += ' | grep -iE "error|fail" '
-        elif level == DmesgLevelOptions.WARNINGS:
-            command += ' | grep -iE "warning" '
+        if level in ACC_IMC_LEVEL_KEYWORDS:
+            command += f' | grep -iE "{ACC_IMC_LEVEL_KEYWORDS[level]}" '
         else:
             command += f" | grep {level.value} "
 
         return command
 
+    @instrumented
     def get_buffer_size_data(self, driver_name: str, driver_interface_number: str) -> Optional[list]:
         """Read the dmesg for driver buffer size information.
 
@@ -152,30 +670,20 @@ class Dmesg(ToolTemplate):
         :return: list of buffer size match objects
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg="Get Buffer Size Data from dmesg")
-        return list(
-            re.finditer(
-                rf"^{driver_name}{driver_interface_number}: "
-                r"using (?P<tx>\d*) tx descriptors and (?P<rx>\d*) rx descriptors$",
-                self.get_messages(service_name=f"{driver_name}{driver_interface_number}"),
-                re.MULTILINE | re.IGNORECASE,
-            )
-        )
+        records = self.get_records(service_name=f"{driver_name}{driver_interface_number}")
+        return find_buffer_size_data(records, driver_name, driver_interface_number)
 
+    @instrumented
     def get_os_package_info(self) -> Union[OSPackageInfo, None]:
         """Get loaded OS package information from dmesg log.
 
         :return: OSPackageMeta object or None when not found
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg="Get OS Package Info from dmesg")
-        dmesg_result = self.get_messages().splitlines()
-        for line in dmesg_result:
-            match = OS_PACKAGE_RE.match(line)
-            if match:
-                package_name = match.group("package_name")
-                package_file = match.group("package_file")
-                package_version = match.group("package_version")
-                return OSPackageInfo(package_name, package_file, package_version)
+        buffer = self.get_buffer()
+        return find_os_package_info(buffer.get_records(buffer.find_any([OS_PACKAGE_KEYWORD], ignore_case=True)))
 
+    @instrumented
     def get_messages_additional(
         self,
         service_name: str = None,
@@ -192,6 +700,36 @@ class Dmesg(ToolTemplate):
         :return: dmesg output
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg="Get Latest Dmesg Output")
+        command = self._get_messages_additional_command(
+            service_name=service_name, lines=lines, additional_greps=additional_greps
+        )
+        out = self._transfer(command, shell=True, expected_return_codes=expected_return_codes).stdout
+        return out.strip()
+
+    def _get_messages_additional_command(
+        self,
+        service_name: Optional[str],
+        lines: int,
+        additional_greps: Optional[List[str]],
+        then_any: Optional[List[str]] = None,
+    ) -> str:
+        """Prepare command reading the last lines of message buffer of the kernel (dmesg).
+
+        Filters run in single awk process, which scans the output once and keeps only the last lines.
+        awk matches literal substrings, so when service name or additional greps are grep patterns (contain
+        regex metacharacters) or strings contain newline, grep and tail pipeline is used.
+
+        :param service_name: limits dmesg messages only to provided service
+        :param lines: limit number of lines
+        :param additional_greps: list of text to find in addition
+        :param then_any: of the last lines only those containing any of the strings are printed
+        :return: command
+        """
+        awk = None
+        if not any(is_basic_regex(string) for string in [service_name or "", *(additional_greps or [])]):
+            awk = last_lines_awk(lines, service_name=service_name, any_ignore_case=additional_greps, then_any=then_any)
+        if awk is not None:
+            return f"{self._tool_exec} | {awk}"
         if not additional_greps:
             additional_greps = []
 
@@ -205,51 +743,95 @@ class Dmesg(ToolTemplate):
                 grep_content = grep_content + f"\\|{additional_grep}" if grep_content else f"{additional_grep}"
             command += f" | grep -i '{grep_content}'"
         command += f" | tail -n {lines}"
-        out = self._connection.execute_command(command, shell=True, expected_return_codes=expected_return_codes).stdout
-        return out.strip()
+        if then_any:
+            command += f" | {fixed_strings_grep(then_any)}"
+        return command
 
-    def _check_specific_errors(self, error_msg: str) -> bool:
-        """Check if error present in given string based on OS.
+    def _filter_errors(
+        self, records: Iterable[DmesgRecord], extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None
+    ) -> List[str]:
+        """Drop records which are not errors or are known to be benign.
 
-        :param error_msg: error message from dmesg output
-        :return: success or failure if the error keyword present else False,
-                for linux error_msg is anyhow error as level parameter is set while fetching dmesg output.
+        On Linux records are already limited to err level, on other OSes only lines containing error are considered.
+
+        :param records: dmesg records to be classified
+        :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
+        :return: list of lines which are considered errors
+        """
+        return filter_errors(records, extra_whitelist, keyword_required=not self._is_linux())
+
+    def _filter_error_records(
+        self, records: Iterable[DmesgRecord], extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None
+    ) -> List[DmesgRecord]:
+        """Drop records which are not errors or are known to be benign, see _filter_errors.
+
+        :param records: dmesg records to be classified
+        :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
+        :return: list of records which are considered errors
+        """
+        return filter_error_records(records, extra_whitelist, keyword_required=not self._is_linux())
+
+    @instrumented
+    def get_digest(self, error_list: Optional[Iterable[str]] = None) -> DmesgDigest:
+        """Summarize kernel message buffer on the host, so only compact JSON digest is transferred.
+
+        Digest contains number of records per level, err level lines not suppressed by literal DMESG_WHITELIST
+        entries, lines of any level containing any of error_list and suppressed counts per whitelist entry.
+        Records are read by dmesg -r, which respects the clear point of clear_messages unlike /dev/kmsg readers.
+        Digest can be passed to verify_messages and check_errors instead of fetching the whole buffer.
+
+        :param error_list: errors to be looked out in the dmesg log, e.g. FAILS, for check_errors
+        :return: DmesgDigest
+        :raises DmesgException: when OS is not Linux
         """
         if not self._is_linux():
-            return True if "error" in error_msg.lower() else False
-        else:
-            return True
+            raise DmesgException(f"Digest is not supported on {self.os_name.value}")
+        error_list = list(error_list or [])
+        output = self._transfer(
+            f"{self._tool_exec} -r | {digest_awk(error_list)}", shell=True, custom_exception=DmesgExecutionError
+        ).stdout
+        digest = parse_digest(output, error_list)
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Dmesg digest of {digest.records} records: {digest.levels}, suppressed: {digest.suppressed}",
+        )
+        return digest
 
-    def verify_messages(self) -> dict:
+    @instrumented
+    def verify_messages(
+        self,
+        extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None,
+        aggregate: bool = False,
+        digest: Optional[DmesgDigest] = None,
+    ) -> dict:
         """Verify if there are err level messages in dmesg output.
 
-        :return: dictionary indicating success or failure and the error messages if present.
+        Benign messages from DMESG_WHITELIST (and extra_whitelist) are ignored. DMESG_WHITELIST entries containing
+        regex metacharacters (other than dot) are matched as regular expressions, the rest as literal substrings.
+        User defined string entries are always literal, regular expressions have to be passed as re.Pattern.
+        With aggregate set, messages differing only in timestamps, PCI/MAC/IP addresses, hexadecimal values
+        and numbers are collapsed into one line per template with count, first and last timestamp and example.
+
+        :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
+        :param aggregate: collapse repetitive error messages into templates
+        :param digest: verify err level lines of digest returned by get_digest instead of fetching dmesg output
+        :return: dictionary indicating success or failure and the error messages if present,
+                 with list of MessageTemplate under "templates" key when aggregate is set.
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg="Verify Dmesg Errors.")
+        if digest is not None:
+            errors = self._filter_error_records(digest.get_error_records(), extra_whitelist)
+            return verification_result(errors, aggregate=aggregate)
         level = DmesgLevelOptions.ERRORS if self._is_linux() else DmesgLevelOptions.NONE
         out = self.get_messages(level=level)
-        dmesg_result = {"successful": True, "error": ""}
-        if out:
-            for error in out.splitlines():
-                is_error = True
-                if self._check_specific_errors(error):
-                    for benign_message in DMESG_WHITELIST:
-                        if benign_message in error:
-                            is_error = False
-                            logger.log(
-                                level=log_levels.MODULE_DEBUG,
-                                msg=f'Ignored error "{error}" in dmesg because it is known to be benign',
-                            )
-                            break
-                    if is_error:
-                        dmesg_result["successful"] = False
-                        dmesg_result["error"] += error + "\n"
-            dmesg_result["error"] = dmesg_result["error"].strip()
+        errors = self._filter_error_records(parse_records(out), extra_whitelist) if out else []
+        dmesg_result = verification_result(errors, aggregate=aggregate)
 
         # log for debug purposes
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"Dmesg dump: {out}")
         return dmesg_result
 
+    @instrumented
     def clear_messages(
         self,
         errors_filter: Optional[List[str]] = [],
@@ -262,18 +844,37 @@ class Dmesg(ToolTemplate):
         :return: A tuple containing the output of dmesg -c and a list of errors
         """
         command = f"{self._tool_exec} -c"
+        self.invalidate_cache()
+        read_kmsg = self._is_linux() and self.capabilities.kmsg_readable is not False
+        if read_kmsg:
+            # /dev/kmsg readers ignore the clear point, records up to it are not new for check_new_errors,
+            # the last sequence number is read by the same command just before clearing
+            command = f"test -r {KMSG_PATH} && {KMSG_READ} | {kmsg_awk(print_records=False)}; {command}"
         try:
-            output = self._connection.execute_command(command, shell=True, custom_exception=DmesgExecutionError).stdout
+            output = self._transfer(command, shell=True, custom_exception=DmesgExecutionError).stdout
+            if read_kmsg:
+                trailer, _, rest = output.partition("\n")
+                trailer = parse_kmsg_trailer(trailer)
+                if trailer is not None:
+                    output = rest
+                sequence = self._check_kmsg_trailer(trailer)
+                if sequence is not None:
+                    self._last_error_sequence = sequence
             new_errors = []
             if errors_filter:
-                for line in output.splitlines():
-                    if any(x in line for x in errors_filter) and not any(x in line for x in ignore_filter):
-                        new_errors.append(line)
-                        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Found error in dmesg: {line}")
+                pattern_sets = {
+                    "error": compile_patterns(errors_filter, literal=True),
+                    "ignore": compile_patterns(ignore_filter or [], literal=True),
+                }
+                for hit in scan((record.text for record in parse_records(output)), pattern_sets):
+                    if "error" in hit.categories and "ignore" not in hit.categories:
+                        new_errors.append(hit.line)
+                        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Found error in dmesg: {hit.line}")
             return (output, new_errors)
         except DmesgExecutionError as e:
             raise DmesgException("Failed to clear the dmesg contents.") from e
 
+    @instrumented
     def clear_messages_after_error(self, error_msg: str) -> Union[Tuple[str, List[str]], None]:
         """Clear dmesg if user defined error is raised.
 
@@ -284,62 +885,68 @@ class Dmesg(ToolTemplate):
             level=log_levels.MODULE_DEBUG,
             msg="Check for expected errors in dmesg.",
         )
-        if error_msg in self.verify_messages()["error"]:
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Expected error in dmesg: {self.verify_messages()['error']}")
+        errors = self.verify_messages()["error"]
+        if error_msg in errors:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Expected error in dmesg: {errors}")
             return self.clear_messages()
         else:
             logger.log(level=log_levels.MODULE_DEBUG, msg=f"{error_msg} is not present in dmesg")
 
-    def check_errors(self, error_list: list) -> tuple:
+    @instrumented
+    def check_errors(
+        self, error_list: list, remote_filter: bool = False, digest: Optional[DmesgDigest] = None
+    ) -> tuple:
         """Verify the Dmesg logs for any user defined errors.
 
         :param error_list: list of errors to be looked out in the dmesg log
+        :param remote_filter: filter lines on the host with single grep, so only matching lines are transferred,
+                              results are the same as with local filtering
+        :param digest: look for errors in matched lines of digest returned by get_digest for the errors
+                       instead of fetching dmesg output
         :return: tuple indicating success or failure and the list of error messages if present.
+        :raises ValueError: when digest was not collected for some of the errors
         """
-        dmesg_output = self.get_messages()
-        detected_fails_list = list()
-        if dmesg_output:
-            for dmesg_line in dmesg_output.splitlines():
-                for fail in error_list:
-                    if fail in dmesg_line:
-                        logger.log(
-                            level=log_levels.MODULE_DEBUG,
-                            msg=f"User defined error present:\n{dmesg_line}",
-                        )
-                        detected_fails_list.append(dmesg_line)
-
-        if detected_fails_list:
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Error(s) present in dmesg logs:\n{detected_fails_list}")
-            return (False, detected_fails_list)
+        grep = fixed_strings_grep(error_list) if remote_filter and digest is None else None
+        if digest is not None:
+            records = digest.get_matched_records(error_list)
+        elif grep is not None:
+            output = self._transfer(f"{self._tool_exec} | {grep}", shell=True, expected_return_codes={0, 1}).stdout
+            records = parse_records(output)
         else:
-            logger.log(level=log_levels.MODULE_DEBUG, msg="Not found any user defined errors in dmesg log.")
-            return (True, detected_fails_list)
+            # only lines containing any of errors are decoded and parsed
+            buffer = self.get_buffer()
+            records = buffer.get_records(buffer.find_any(error_list))
+        return find_errors(records, error_list)
 
+    @instrumented
     def check_str_present(
-        self, service_name: str, lookout_str: str, additional_greps: Optional[List[str]] = None
+        self,
+        service_name: str,
+        lookout_str: str,
+        additional_greps: Optional[List[str]] = None,
+        remote_filter: bool = False,
     ) -> bool:
         """Check the dmesg logs for user specified string.
 
         :param service_name: limits dmesg messages only to provided service
         :param additional_greps: list of text to find in addition
         :param lookout_str: user specified string to be searched in the dmesg logs
+        :param remote_filter: look for the string on the host, so only matching lines are transferred
         :return: returns True if no user define string present in dmesg logs, False otherwise
         """
-        dmesg_result = self.get_messages_additional(
-            service_name=service_name, lines=500, additional_greps=additional_greps
-        ).splitlines()
-        if dmesg_result:
-            for line in dmesg_result:
-                if lookout_str in line:
-                    logger.log(level=log_levels.MODULE_DEBUG, msg="Log found in dmesg")
-                    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Line: {line}")
-                    return True
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"User specified {lookout_str} not present in dmesg log")
-            return False
+        if remote_filter and fixed_strings_grep([lookout_str]) is not None:
+            command = self._get_messages_additional_command(
+                service_name=service_name, lines=500, additional_greps=additional_greps, then_any=[lookout_str]
+            )
+            output = self._transfer(command, shell=True, expected_return_codes={0, 1}).stdout
+            dmesg_result = parse_records(output.strip())
         else:
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"No logs found for service {service_name} in dmesg")
-            return False
+            dmesg_result = parse_records(
+                self.get_messages_additional(service_name=service_name, lines=500, additional_greps=additional_greps)
+            )
+        return find_str(dmesg_result, lookout_str, service_name)
 
+    @instrumented
     def check_messages_format(self, driver: str, time_format: str = "%Y-%m-%dT%H:%M:%S.%fZ") -> Union[bool, None]:
         """Verify if the dmesg logs are displayed in correct format.
 
@@ -347,9 +954,9 @@ class Dmesg(ToolTemplate):
         :param time_format: time format to be checked in dmesg logs for the specified driver
         :return: returns True if no specified format have found, False otherwise and if dmesg output is empty
         """
-        dmesg = self.get_messages_additional(lines=1, additional_greps=[f"{driver}_InitSharedCode"])
-        if dmesg:
-            dmesg = dmesg.split()
+        records = parse_records(self.get_messages_additional(lines=1, additional_greps=[f"{driver}_InitSharedCode"]))
+        if records:
+            dmesg = records[-1].text.split()
             logger.log(level=log_levels.MODULE_DEBUG, msg=f"dmesg log is {dmesg}")
             try:
                 dmesg_result = bool(datetime.datetime.strptime(dmesg[0], time_format))
@@ -383,30 +990,149 @@ class Dmesg(ToolTemplate):
             return None
         return dmesg_result
 
-    def check_new_errors(self) -> dict:
+    def _is_kmsg_readable(self) -> bool:
+        """Check once per instance if kernel records can be read directly from /dev/kmsg.
+
+        :return: True if /dev/kmsg is readable on the host, False otherwise
+        """
+        if self.capabilities.kmsg_readable is None:
+            result = self._execute_command(
+                f"test -r {KMSG_PATH}", shell=True, expected_return_codes=None, discard_stdout=True
+            )
+            self.capabilities.kmsg_readable = result.return_code == 0
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"{KMSG_PATH} readable: {self.capabilities.kmsg_readable}")
+        return self.capabilities.kmsg_readable
+
+    def _check_kmsg_trailer(self, trailer: Optional[Tuple[int, int]]) -> Optional[int]:
+        """Check trailer printed by kmsg_awk, /dev/kmsg is not used again when no records were read from it.
+
+        :param trailer: parsed trailer, None when it was not printed (/dev/kmsg not readable)
+        :return: sequence number of the last record, None when /dev/kmsg could not be read
+        """
+        self.capabilities.kmsg_readable = trailer is not None and trailer[0] > 0
+        if not self.capabilities.kmsg_readable:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Failed to read records from {KMSG_PATH}")
+            return None
+        return trailer[1]
+
+    def _read_kmsg(
+        self, after_sequence: Optional[int] = None, level: Optional[int] = None
+    ) -> Optional[List[DmesgRecord]]:
+        """Read kernel records newer than given sequence number from /dev/kmsg.
+
+        Filtering is done on the host, so only records newer than the cursor are transferred.
+
+        :param after_sequence: return only records with sequence number greater than this one, all when None
+        :param level: return only records with this syslog level (e.g. 3 for err), all when None
+        :return: list of DmesgRecord with sequence numbers, lines are formatted like dmesg output,
+                 None when /dev/kmsg could not be read
+        """
+        command = f"{KMSG_READ} | {kmsg_awk(after_sequence=after_sequence, level=level)}"
+        lines = self._transfer(command, shell=True, expected_return_codes={0, 1}).stdout.splitlines()
+        if self._check_kmsg_trailer(parse_kmsg_trailer(lines.pop()) if lines else None) is None:
+            return None
+        return [record for record in map(parse_kmsg_record, lines) if record is not None]
+
+    def _start_kmsg_cursor(
+        self, extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None
+    ) -> Optional[List[str]]:
+        """Read err level messages and sequence number of the last /dev/kmsg record by single command.
+
+        dmesg respects the clear point of dmesg -c made by anyone on the host, so cleared errors are not reported,
+        records newer than the last one are read from /dev/kmsg by next calls. When /dev/kmsg cannot be read,
+        errors are remembered for comparison of full err level output by next calls.
+
+        :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
+        :return: err level lines which are considered errors, None when dmesg failed
+        """
+        command = (
+            f"test -r {KMSG_PATH} && {KMSG_READ} | {kmsg_awk(print_records=False)}; "
+            f"{self._tool_exec} --level={DmesgLevelOptions.ERRORS.value}"
+        )
+        try:
+            output = self._transfer(command, shell=True).stdout
+        except ConnectionCalledProcessError as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Failed to read err level messages: {e}")
+            return None
+        trailer, _, rest = output.partition("\n")
+        trailer = parse_kmsg_trailer(trailer)
+        if trailer is not None:
+            output = rest
+        errors = self._filter_errors(parse_records(output), extra_whitelist)
+        sequence = self._check_kmsg_trailer(trailer)
+        if sequence is None:
+            self._running_errors = errors
+        else:
+            self._last_error_sequence = sequence
+        return errors
+
+    @instrumented
+    def get_records_after(
+        self, sequence: Optional[int] = None, level: DmesgLevelOptions = DmesgLevelOptions.NONE
+    ) -> List[DmesgRecord]:
+        """Read kernel records newer than given sequence number directly from /dev/kmsg.
+
+        Only new records are transferred, so it can be called repeatedly to read the buffer incrementally.
+
+        :param sequence: return only records with sequence number greater than this one, all when None
+        :param level: limits records only to provided by DmesgLevelOptions
+        :return: list of DmesgRecord with sequence numbers
+        :raises DmesgException: when /dev/kmsg is not readable on the host
+        """
+        if not (self._is_linux() and self._is_kmsg_readable()):
+            raise DmesgException(f"{KMSG_PATH} is not readable on the host")
+        kmsg_level = None if level is DmesgLevelOptions.NONE else LEVEL_NAMES.index(level.value)
+        records = self._read_kmsg(after_sequence=sequence, level=kmsg_level)
+        if records is None:
+            raise DmesgException(f"Failed to read records from {KMSG_PATH} on the host")
+        return records
+
+    @instrumented
+    def check_new_errors(self, extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None) -> dict:
         """Verify if there are new err level messages in dmesg output since the last time this was run.
 
+        On Linux hosts with readable /dev/kmsg the kernel record sequence number is used as a cursor,
+        so only records newer than the previous call are fetched and classified.
+        First call reads err level output of dmesg, which respects the clear point, together with the cursor.
+        clear_messages moves the cursor to the last record at clear time, cleared records are not reported.
+        Otherwise, or when records cannot be read from /dev/kmsg, full err level output is compared
+        with errors seen by previous call.
+
+        :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
         :return: dictionary indicating success or failure and the error message if present,
                  same return format as verify_messages() but only send back new errors.
         """
-        results = self.verify_messages()
-        global RUNNING_ERRORS
+        if self._is_linux() and self.capabilities.kmsg_readable is not False:
+            if self._last_error_sequence is None:
+                errors = self._start_kmsg_cursor(extra_whitelist)
+            else:
+                records = self._read_kmsg(after_sequence=self._last_error_sequence, level=KMSG_ERR_LEVEL)
+                if records:
+                    self._last_error_sequence = max(record.sequence for record in records)
+                errors = None if records is None else self._filter_errors(records, extra_whitelist)
+            if errors:
+                return {"successful": False, "error": "\n".join(errors)}
+            if errors is not None:
+                return {"successful": True, "error": ""}
+
+        results = self.verify_messages(extra_whitelist)
         if results["successful"] is not True:
             errors = results["error"].splitlines()
-            old_errors = errors[: len(RUNNING_ERRORS)]
-            new_errors = errors[len(RUNNING_ERRORS) :]
-            if RUNNING_ERRORS == old_errors:
+            old_errors = errors[: len(self._running_errors)]
+            new_errors = errors[len(self._running_errors) :]
+            if self._running_errors == old_errors:
                 if new_errors:
                     new_results = {"successful": False, "error": "\n".join(new_errors)}
                 else:
                     new_results = {"successful": True, "error": ""}
             else:
                 new_results = results
-            RUNNING_ERRORS = errors
+            self._running_errors = errors
         else:
             new_results = {"successful": True, "error": ""}
         return new_results
 
+    @instrumented
     def verify_log(self, driver: str) -> str:
         """
         Check the system log (journal on Windows, dmesg on Linux) for errors.
@@ -426,42 +1152,7 @@ class Dmesg(ToolTemplate):
         :raise BadWordInLog: Bad (ie. non-inclusive, offensive etc.) word found in log
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"Driver module name: {driver}")
-
-        # Look for bad words and whether they constitute error in log:)
-        bad_words = [
-            ("fail", False),
-            (" hang", False),
-            ("warning", False),
-            ("master", True),
-            ("slave", True),
-            ("whitelist", True),
-            ("blacklist", True),
-        ]
-        known_errors = ["get phy capabilities failed"]
-        expected_logs = ["rd.driver.blacklist"]
-
-        # Find lines that starts with service name and contain fail or hang keyword
-        log = self.get_messages(service_name=driver)
-        if not log:
-            return ""
-
-        for line in log.splitlines():
-            if any(known_error in line for known_error in known_errors) or any(
-                expected_log in line for expected_log in expected_logs
-            ):
-                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Error log line: '{line}'.")
-                continue
-
-            for word, is_error in bad_words:
-                if word in line.lower():
-                    msg = f"Word '{word}' found in log line: '{line}'"
-                    if is_error:
-                        raise BadWordInLog(msg)
-                    # Return the whole log if something bad was found
-                    logger.log(level=log_levels.MODULE_DEBUG, msg=msg)
-                    return log
-        # Everything is ok
-        return ""
+        return verify_linux_log(self.get_messages(service_name=driver))
 
     def _verify_log_freebsd(self, driver: str) -> str:
         """
@@ -471,22 +1162,4 @@ class Dmesg(ToolTemplate):
         :return: empty string if no errors found, error content otherwise.
         """
         logger.log(level=log_levels.MODULE_DEBUG, msg=f"Driver module name: {driver}")
-
-        # Look for bad words in log:)
-        bad_words = ["fail", " hang"]
-
-        # Find lines that starts with service name and contain fail or hang keyword
-        log = self.get_messages()
-        if not log:
-            return ""
-
-        for line in log.splitlines():
-            if line.startswith(driver):
-                line_low = line.lower()
-                for word in bad_words:
-                    if word in line_low:
-                        # Return the whole log if something bad was found
-                        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Word '{word}' found in log line: {line}")
-                        return log
-        # Everything is ok
-        return ""
+        return verify_freebsd_log(self.get_messages(), driver)
@@ -0,0 +1,162 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Raw dmesg output kept once as bytes, with lines decoded on demand."""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Union
+
+from mfd_dmesg.records import DmesgRecord, parse_record
+
+if TYPE_CHECKING:
+    from mfd_connect.base import ConnectionCompletedProcess
+
+NEWLINE_RE = re.compile(rb"\n")
+NON_WHITESPACE_RE = re.compile(rb"\S")
+WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
+class DmesgBuffer:
+    """
+    Dmesg output stored once as bytes, lines are addressed by offsets kept in compact array.
+
+    Surrounding whitespace is skipped without copying the output, so lines are the same as of stripped output.
+    Lookups run over the whole output and return ids of matching lines, only those lines have to be decoded.
+    """
+
+    __slots__ = ("_data", "_offsets", "encoding")
+
+    def __init__(self, data: bytes, encoding: str = "utf-8"):
+        """
+        Index lines of the output.
+
+        :param data: raw dmesg output
+        :param encoding: encoding used to decode lines, undecodable bytes are backslash escaped
+        """
+        self._data = data
+        self.encoding = encoding
+        self._offsets = array("Q")
+        first = NON_WHITESPACE_RE.search(data)
+        if first is None:
+            return
+        end = len(data)
+        while data[end - 1] in WHITESPACE:
+            end -= 1
+        # offsets of line starts, followed by offset of the byte after the end of the last line terminator
+        self._offsets.append(first.start())
+        self._offsets.extend(match.end() for match in NEWLINE_RE.finditer(data, first.start(), end))
+        self._offsets.append(end + 1)
+
+    @classmethod
+    def from_completed_process(cls, result: "ConnectionCompletedProcess", encoding: str = "utf-8") -> "DmesgBuffer":
+        """
+        Create buffer from result of executed command.
+
+        Raw bytes are used when connection provides them, otherwise text output is encoded.
+
+        :param result: result of execute_command
+        :param encoding: encoding used to decode lines
+        :return: DmesgBuffer
+        """
+        try:
+            data = result.stdout_bytes
+        except NotImplementedError:
+            data = result.stdout.encode(encoding, errors="surrogateescape")
+        return cls(data, encoding=encoding)
+
+    def __len__(self) -> int:
+        return max(len(self._offsets) - 1, 0)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the raw output."""
+        return len(self._data)
+
+    def line_view(self, line_id: int) -> memoryview:
+        """
+        Get line without copying.
+
+        :param line_id: number of line
+        :return: memoryview of the line without line terminator
+        """
+        if not 0 <= line_id < len(self):
+            raise IndexError(f"Line {line_id} out of range")
+        return memoryview(self._data)[self._offsets[line_id] : self._offsets[line_id + 1] - 1]
+
+    def line(self, line_id: int) -> str:
+        """
+        Get decoded line.
+
+        :param line_id: number of line
+        :return: line without line terminator
+        """
+        return str(self.line_view(line_id), self.encoding, errors="backslashreplace").rstrip("\r")
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.line(line_id) for line_id in range(len(self)))
+
+    def text(self) -> str:
+        """Get whole output decoded, same as stripped text output."""
+        if not self._offsets:
+            return ""
+        return str(
+            memoryview(self._data)[self._offsets[0] : self._offsets[-1] - 1], self.encoding, errors="backslashreplace"
+        )
+
+    def line_id_at(self, position: int) -> int:
+        """
+        Get number of line containing byte at position.
+
+        :param position: offset in raw output
+        :return: number of line
+        """
+        return bisect_right(self._offsets, position) - 1
+
+    def find_any(self, needles: Iterable[Union[str, bytes]], ignore_case: bool = False) -> Iterator[int]:
+        """
+        Find lines containing any of literal substrings in single pass over the output.
+
+        :param needles: literal substrings, ones containing newline never match, empty one matches every line
+        :param ignore_case: match ASCII letters case insensitively
+        :return: iterator over ascending numbers of matching lines, each line reported once
+        """
+        needles = {
+            needle.encode(self.encoding, errors="surrogateescape") if isinstance(needle, str) else needle
+            for needle in needles
+        }
+        if b"" in needles:
+            # same as substring check, empty string is contained in every line
+            yield from range(len(self))
+            return
+        needles = sorted((needle for needle in needles if b"\n" not in needle), key=len, reverse=True)
+        if not needles or not self._offsets:
+            return
+        end = self._offsets[-1] - 1
+        position = self._offsets[0]
+        if len(needles) == 1 and not ignore_case:
+            needle = needles[0]
+            while True:
+                found = self._data.find(needle, position, end)
+                if found == -1:
+                    return
+                line_id = self.line_id_at(found)
+                yield line_id
+                position = self._offsets[line_id + 1]
+        regex = re.compile(b"|".join(map(re.escape, needles)), re.IGNORECASE if ignore_case else 0)
+        while True:
+            match = regex.search(self._data, position, end)
+            if match is None:
+                return
+            line_id = self.line_id_at(match.start())
+            yield line_id
+            position = self._offsets[line_id + 1]
+
+    def get_records(self, line_ids: Iterable[int]) -> List[DmesgRecord]:
+        """
+        Parse selected lines into records.
+
+        :param line_ids: numbers of lines
+        :return: list of DmesgRecord
+        """
+        return [parse_record(self.line(line_id)) for line_id in line_ids]
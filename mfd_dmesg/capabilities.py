@@ -0,0 +1,92 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Features of dmesg and the host, detected once per Dmesg instance."""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from mfd_dmesg.constants import KMSG_PATH
+
+VERSION_RE = re.compile(r"dmesg\sfrom\sutil-linux\s(?P<version>.*)", re.M)
+PROBE_MARKER = "__MFD_DMESG_PROBE_"
+# time window is probed with date format used by Dmesg.get_messages
+EPOCH = "1970-01-01 00:00:00"
+PROBE_RESULT_RE = re.compile(rf"^{PROBE_MARKER}(?P<name>\w+)=(?P<return_code>\d+)$", re.M)
+
+
+@dataclass
+class DmesgCapabilities:
+    """
+    Features of dmesg and the host, None until detected.
+
+    Features are detected lazily on first use, or all at once by Dmesg.probe_capabilities.
+    """
+
+    version: Optional[str] = None
+    level: Optional[bool] = None  # --level filters messages, False on ACC and IMC systems
+    raw: Optional[bool] = None  # -r prints priority prefixes
+    json: Optional[bool] = None  # --json
+    time_window: Optional[bool] = None  # --since and --until
+    follow: Optional[bool] = None  # -w, --follow
+    kmsg_readable: Optional[bool] = None  # /dev/kmsg readable
+    compression: Optional[bool] = None  # gzip and base64 available
+
+    @property
+    def acc_imc(self) -> Optional[bool]:
+        """ACC or IMC system, where levels are selected by keywords, None until detected."""
+        return None if self.level is None else not self.level
+
+
+def get_version_numbers(version: Optional[str]) -> Tuple[int, ...]:
+    """
+    Get major and minor number of util-linux version.
+
+    :param version: version as returned by Dmesg.get_version, e.g. 2.39.3
+    :return: tuple of numbers, empty when version is not known
+    """
+    return tuple(int(part) for part in re.findall(r"\d+", version or "")[:2])
+
+
+def build_time_window_check(tool_exec: str) -> str:
+    """
+    Build command checking if dmesg accepts --since and --until, output is discarded.
+
+    :param tool_exec: dmesg executable
+    :return: command returning 0 when time window is supported
+    """
+    return f"TZ=UTC {tool_exec} --since '{EPOCH}' --until '{EPOCH}' >/dev/null 2>&1"
+
+
+def build_probe_command(tool_exec: str) -> str:
+    """
+    Build single command detecting all Linux features, outputs of dmesg are not transferred.
+
+    :param tool_exec: dmesg executable
+    :return: command printing dmesg version followed by return code of every check
+    """
+    checks = {
+        "level": f"{tool_exec} --level=err >/dev/null 2>&1",
+        "raw": f"{tool_exec} -r >/dev/null 2>&1",
+        "json": f"{tool_exec} --json >/dev/null 2>&1",
+        "time_window": build_time_window_check(tool_exec),
+        "follow": f"{tool_exec} --help 2>&1 | grep -q -e --follow",
+        "kmsg_readable": f"test -r {KMSG_PATH}",
+        "compression": "command -v gzip >/dev/null && command -v base64 >/dev/null",
+    }
+    probes = " ".join(f'{check}; echo "{PROBE_MARKER}{name}=$?";' for name, check in checks.items())
+    return f"{tool_exec} -V 2>&1; {probes}"
+
+
+def parse_probe(output: str) -> DmesgCapabilities:
+    """
+    Parse output of command built by build_probe_command.
+
+    :param output: output of the command
+    :return: DmesgCapabilities, features without result stay None
+    """
+    match = VERSION_RE.search(output)
+    capabilities = DmesgCapabilities(version=match.group("version").rstrip() if match else "NA")
+    for result in PROBE_RESULT_RE.finditer(output):
+        setattr(capabilities, result.group("name"), result.group("return_code") == "0")
+    return capabilities
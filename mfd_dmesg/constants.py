@@ -78,6 +78,15 @@ DMESG_WHITELIST = [
     r"the capability attribute has been deprecated",  # related to disk
     r"VF could not set VLAN 0",
 ]
+KMSG_PATH = "/dev/kmsg"
+KMSG_ERR_LEVEL = 3
+COMPRESSED_RETURN_CODE_MARKER = "__MFD_DMESG_RC="
+# util-linux version from which dmesg filters messages by --since and --until given as "YYYY-MM-DD hh:mm:ss"
+TIME_WINDOW_MIN_VERSION = (2, 37)
+# util-linux version from which dmesg prints records as JSON (--json)
+JSON_MIN_VERSION = (2, 38)
+# extended regex matching messages of the level on systems without level support (ACC, IMC), case insensitive
+ACC_IMC_LEVEL_KEYWORDS = {DmesgLevelOptions.ERRORS: "error|fail", DmesgLevelOptions.WARNINGS: "warning"}
 FAILS = ["no defer", "error", "fail", "timeout", "warning", "overruns", "excessive missed"]
 INVALID_MODULE_ERRORS = ["Invalid", "default value", "outside of range", "Single Root Input/Output Virtualization"]
 KNOWN_ERRORS = [
@@ -96,3 +105,16 @@ KNOWN_ERRORS = [
     "failed to add vlan filter",
     "vf could not set vlan",
 ]
+# Bad words looked for by verify_log on Linux and whether they constitute error (raise BadWordInLog)
+VERIFY_LOG_BAD_WORDS = {
+    "fail": False,
+    " hang": False,
+    "warning": False,
+    "master": True,
+    "slave": True,
+    "whitelist": True,
+    "blacklist": True,
+}
+VERIFY_LOG_KNOWN_ERRORS = ["get phy capabilities failed"]
+VERIFY_LOG_EXPECTED_LOGS = ["rd.driver.blacklist"]
+VERIFY_LOG_FREEBSD_BAD_WORDS = ["fail", " hang"]
@@ -0,0 +1,147 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Compact digest of kernel message buffer computed on the host by single awk process."""
+
+import json
+import shlex
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from mfd_dmesg.constants import DMESG_WHITELIST, KMSG_ERR_LEVEL
+from mfd_dmesg.matcher import is_regex_pattern
+from mfd_dmesg.records import LEVEL_NAMES, DmesgRecord, parse_records
+
+# reads dmesg -r records and prints JSON digest: number of records, level histogram, err level lines not suppressed
+# by literal whitelist entries, lines containing any of the patterns and suppressed counts per entry;
+# lines are JSON escaped with split, gsub escaping is not portable
+DIGEST_AWK = """
+function replace(text, separator, replacement,    parts, count, i, result) {
+    count = split(text, parts, separator)
+    result = parts[1]
+    for (i = 2; i <= count; i++) result = result replacement parts[i]
+    return result
+}
+function quote(text) {
+    return "\\"" replace(replace(text, "\\\\", "\\\\\\\\"), "\\"", "\\\\\\"") "\\""
+}
+function add(line, level,    i, found) {
+    if (level == err_level) {
+        found = 0
+        for (i = 1; i <= whitelist_count && !found; i++) if (index(line, whitelist[i])) found = i
+        if (found) suppressed[found]++
+        else errors[error_count++] = line
+    }
+    found = match_all
+    for (i = 1; i <= pattern_count && !found; i++) found = index(line, patterns[i])
+    if (found) matched[matched_count++] = line
+}
+function print_lines(name, lines, count,    i) {
+    printf ",\\"%s\\":[", name
+    for (i = 0; i < count; i++) printf "%s%s", (i ? "," : ""), quote(lines[i])
+    printf "]"
+}
+BEGIN {
+    whitelist_count = split(ENVIRON["MFD_DMESG_WHITELIST"], whitelist, "\\n")
+    pattern_count = split(ENVIRON["MFD_DMESG_MATCH"], patterns, "\\n")
+    match_all = ENVIRON["MFD_DMESG_MATCH_ALL"] != ""
+    err_level = ENVIRON["MFD_DMESG_ERR_LEVEL"] + 0
+    level = -1
+}
+/^<[0-9]+>/ {
+    end = index($0, ">")
+    level = substr($0, 2, end - 2) % 8
+    levels[level]++
+    records++
+    add(substr($0, end + 1), level)
+    next
+}
+level >= 0 { add($0, level) }
+END {
+    histogram = ""
+    for (i = 0; i < 8; i++) histogram = histogram (i ? "," : "") (levels[i] + 0)
+    counts = ""
+    for (i = 1; i <= whitelist_count; i++) counts = counts (i > 1 ? "," : "") (suppressed[i] + 0)
+    printf "{\\"records\\":%d,\\"levels\\":[%s],\\"suppressed\\":[%s]", records, histogram, counts
+    print_lines("errors", errors, error_count)
+    print_lines("matched", matched, matched_count)
+    print "}"
+}
+"""
+
+
+@dataclass
+class DmesgDigest:
+    """Summary of kernel message buffer, containing only lines needed by verify_messages and check_errors."""
+
+    records: int
+    levels: Dict[str, int]
+    errors: List[str]
+    matched: List[str]
+    suppressed: Dict[str, int]
+    error_list: Tuple[str, ...] = field(default=())
+
+    def get_error_records(self) -> List[DmesgRecord]:
+        """Get err level records not suppressed by literal entries of DMESG_WHITELIST."""
+        return parse_records("\n".join(self.errors))
+
+    def get_matched_records(self, error_list: Iterable[str]) -> List[DmesgRecord]:
+        """
+        Get records of all levels containing any of the errors looked for.
+
+        :param error_list: errors looked for, digest has to be collected for all of them
+        :return: records containing any of the digest error_list
+        :raises ValueError: when digest was not collected for some of the errors
+        """
+        missing = set(error_list).difference(self.error_list)
+        if missing:
+            raise ValueError(f"Digest was not collected for errors: {sorted(missing)}")
+        return parse_records("\n".join(self.matched))
+
+
+def _passable(strings: Iterable[str]) -> List[str]:
+    # lines never contain newline, so strings with newline cannot match and are not passed
+    return list(dict.fromkeys(string for string in strings if "\n" not in string and "\r" not in string))
+
+
+def get_digest_whitelist() -> List[str]:
+    """Get literal entries of DMESG_WHITELIST applied on the host, regex entries are applied locally."""
+    return [entry for entry in _passable(DMESG_WHITELIST) if entry and not is_regex_pattern(entry)]
+
+
+def digest_awk(error_list: Optional[Iterable[str]] = None) -> str:
+    """
+    Build awk invocation summarizing dmesg -r output read on standard input.
+
+    :param error_list: lines of any level containing any of the strings are returned as matched
+    :return: command printing JSON digest
+    """
+    patterns = _passable(error_list or [])
+    environment = {
+        "MFD_DMESG_ERR_LEVEL": str(KMSG_ERR_LEVEL),
+        "MFD_DMESG_WHITELIST": "\n".join(get_digest_whitelist()),
+        "MFD_DMESG_MATCH": "\n".join(pattern for pattern in patterns if pattern),
+        "MFD_DMESG_MATCH_ALL": "1" if "" in patterns else "",
+    }
+    assignments = " ".join(f"{name}={shlex.quote(value)}" for name, value in environment.items() if value)
+    return f"{assignments} awk {shlex.quote(DIGEST_AWK.strip())}"
+
+
+def parse_digest(output: str, error_list: Optional[Iterable[str]] = None) -> DmesgDigest:
+    """
+    Parse JSON digest printed by digest_awk command.
+
+    :param output: output of the command
+    :param error_list: strings passed to digest_awk
+    :return: DmesgDigest
+    """
+    # strict=False accepts control characters, awk escapes only backslashes and quotes
+    digest = json.loads(output, strict=False)
+    whitelist = get_digest_whitelist()
+    return DmesgDigest(
+        records=digest["records"],
+        levels=dict(zip(LEVEL_NAMES, digest["levels"])),
+        errors=digest["errors"],
+        matched=digest["matched"],
+        suppressed={entry: count for entry, count in zip(whitelist, digest["suppressed"]) if count},
+        error_list=tuple(dict.fromkeys(error_list or [])),
+    )
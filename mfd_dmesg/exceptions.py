@@ -20,3 +20,11 @@ class DmesgExecutionError(DmesgException, subprocess.CalledProcessError):
 
 class BadWordInLog(DmesgException):
     """Exception raised when bad word is found in log."""
+
+
+class ReplayError(DmesgException):
+    """Exception raised when replayed command does not match the recording."""
+
+
+class RoundTripBudgetExceeded(DmesgException):
+    """Exception raised when more commands were executed than allowed by round trip budget."""
@@ -0,0 +1,225 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Concurrent dmesg operations across many hosts."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from mfd_dmesg.base import Dmesg
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+
+@dataclass
+class FleetResult:
+    """Result of dmesg operation on single host."""
+
+    host: str
+    result: Any = None
+    duration: float = 0.0
+    exception: Optional[BaseException] = None
+
+    @property
+    def successful(self) -> bool:
+        """Check if operation finished without exception."""
+        return self.exception is None
+
+
+class DmesgFleet:
+    """
+    Run Dmesg operations on many hosts concurrently using bounded thread pool.
+
+    Dmesg objects are created lazily in worker threads, so initial availability checks run concurrently too.
+    Failure or slowness of one host does not affect results of others.
+    Operations on the same host are serialized: a host still busy with an operation which did not finish in time
+    is skipped and reported as timed out, so its connection is never used by two operations at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        connections: Iterable["Connection"],
+        max_workers: int = 16,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+    ):
+        """
+        Initialize fleet.
+
+        :param connections: mfd_connect objects of hosts
+        :param max_workers: maximum number of hosts handled at the same time
+        :param timeout: default time in seconds to wait for all hosts, hosts not finished are reported as failed
+        :param cache_ttl: cache_ttl passed to Dmesg objects
+        """
+        self.timeout = timeout
+        self._cache_ttl = cache_ttl
+        self._connections: Dict[str, "Connection"] = {}
+        for connection in connections:
+            self._connections[self._get_host_name(connection)] = connection
+        self._dmesgs: Dict[str, Dmesg] = {}
+        self._lock = threading.Lock()
+        self._host_locks = {host: threading.Lock() for host in self._connections}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dmesg-fleet")
+
+    @property
+    def hosts(self) -> List[str]:
+        """Names of hosts in the fleet."""
+        return list(self._connections)
+
+    def _get_host_name(self, connection: "Connection") -> str:
+        """
+        Get unique name of the host.
+
+        :param connection: mfd_connect object
+        :return: IP address of the host or connection representation, suffixed when not unique
+        """
+        name = str(getattr(connection, "ip", None) or connection)
+        unique_name, index = name, 1
+        while unique_name in self._connections:
+            index += 1
+            unique_name = f"{name}#{index}"
+        return unique_name
+
+    def get_dmesg(self, host: str) -> Dmesg:
+        """
+        Get Dmesg object of the host, created on first use.
+
+        :param host: name of the host
+        :return: Dmesg object
+        """
+        with self._lock:
+            dmesg = self._dmesgs.get(host)
+        if dmesg is None:
+            dmesg = Dmesg(connection=self._connections[host], cache_ttl=self._cache_ttl)
+            with self._lock:
+                dmesg = self._dmesgs.setdefault(host, dmesg)
+        return dmesg
+
+    def _run_on_host(self, host: str, method_name: str, args: tuple, kwargs: dict) -> FleetResult:
+        # lock of the host is acquired by run and released here, when the operation really finishes
+        start = time.perf_counter()
+        try:
+            result = getattr(self.get_dmesg(host), method_name)(*args, **kwargs)
+            return FleetResult(host=host, result=result, duration=time.perf_counter() - start)
+        except Exception as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"{method_name} failed on {host}: {e}")
+            return FleetResult(host=host, duration=time.perf_counter() - start, exception=e)
+        finally:
+            self._host_locks[host].release()
+
+    def run(self, method_name: str, *args, timeout: Optional[float] = None, **kwargs) -> Dict[str, FleetResult]:
+        """
+        Call Dmesg method on all hosts concurrently.
+
+        :param method_name: name of Dmesg method, e.g. verify_messages
+        :param args: positional arguments of the method
+        :param timeout: time in seconds to wait for all hosts, default timeout of the fleet when None
+        :param kwargs: keyword arguments of the method
+        :return: FleetResult by host name, hosts not finished in time and hosts still busy with previous operation
+                 have TimeoutError as exception
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        results = {}
+        futures = {}
+        for host in self._connections:
+            if not self._host_locks[host].acquire(blocking=False):
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"{host} is busy, {method_name} skipped")
+                results[host] = FleetResult(
+                    host=host, exception=TimeoutError(f"{host} is still busy with previous operation")
+                )
+                continue
+            try:
+                futures[host] = self._executor.submit(self._run_on_host, host, method_name, args, kwargs)
+            except BaseException:
+                self._host_locks[host].release()
+                raise
+        wait(futures.values(), timeout=timeout)
+        for host, future in futures.items():
+            if future.done():
+                results[host] = future.result()
+            else:
+                if future.cancel():
+                    # operation did not start, so it will not release the host
+                    self._host_locks[host].release()
+                results[host] = FleetResult(
+                    host=host,
+                    duration=time.perf_counter() - start,
+                    exception=TimeoutError(f"{method_name} did not finish on {host} in {timeout} seconds"),
+                )
+        return {host: results[host] for host in self._connections}
+
+    def verify_messages(self, timeout: Optional[float] = None, **kwargs) -> Dict[str, FleetResult]:
+        """
+        Run verify_messages on all hosts.
+
+        :param timeout: time in seconds to wait for all hosts
+        :param kwargs: keyword arguments of Dmesg.verify_messages
+        :return: FleetResult by host name
+        """
+        return self.run("verify_messages", timeout=timeout, **kwargs)
+
+    def get_digest(
+        self, error_list: Optional[List[str]] = None, timeout: Optional[float] = None
+    ) -> Dict[str, FleetResult]:
+        """
+        Run get_digest on all hosts, so only compact digests are transferred.
+
+        :param error_list: errors to be looked out in the dmesg log, see Dmesg.get_digest
+        :param timeout: time in seconds to wait for all hosts
+        :return: FleetResult with DmesgDigest by host name
+        """
+        return self.run("get_digest", error_list=error_list, timeout=timeout)
+
+    def check_errors(
+        self, error_list: list, remote_filter: bool = False, timeout: Optional[float] = None
+    ) -> Dict[str, FleetResult]:
+        """
+        Run check_errors on all hosts.
+
+        :param error_list: list of errors to be looked out in the dmesg log
+        :param remote_filter: filter lines on the hosts, see Dmesg.check_errors
+        :param timeout: time in seconds to wait for all hosts
+        :return: FleetResult by host name
+        """
+        return self.run("check_errors", error_list, remote_filter=remote_filter, timeout=timeout)
+
+    def clear_messages(self, timeout: Optional[float] = None, **kwargs) -> Dict[str, FleetResult]:
+        """
+        Run clear_messages on all hosts.
+
+        :param timeout: time in seconds to wait for all hosts
+        :param kwargs: keyword arguments of Dmesg.clear_messages
+        :return: FleetResult by host name
+        """
+        return self.run("clear_messages", timeout=timeout, **kwargs)
+
+    def verify_log(self, driver: str, timeout: Optional[float] = None) -> Dict[str, FleetResult]:
+        """
+        Run verify_log on all hosts.
+
+        :param driver: Name of the driver such as i40en
+        :param timeout: time in seconds to wait for all hosts
+        :return: FleetResult by host name
+        """
+        return self.run("verify_log", driver, timeout=timeout)
+
+    def close(self) -> None:
+        """Shut down thread pool, operations still running on slow hosts are not waited for."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "DmesgFleet":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
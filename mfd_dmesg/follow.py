@@ -0,0 +1,144 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Streaming follow mode for Dmesg."""
+
+import logging
+import threading
+from queue import Empty, Full, Queue
+from typing import Iterator, Optional, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from mfd_dmesg.exceptions import DmesgException
+
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.process import RemoteProcess
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+_END_OF_STREAM = object()
+
+
+class DmesgFollower:
+    """
+    Long-running dmesg process yielding kernel messages as they arrive.
+
+    Lines are read by a background thread into a bounded queue.
+    When the queue is full the reader waits for the consumer, so no message is dropped.
+    """
+
+    def __init__(self, *, connection: "Connection", command: str, queue_size: int = 1000, poll_interval: float = 0.1):
+        """
+        Initialize follower.
+
+        :param connection: mfd_connect object for remote connection handling
+        :param command: command printing kernel messages continuously, e.g. dmesg --follow
+        :param queue_size: maximum number of lines buffered between reader and consumer
+        :param poll_interval: time in seconds between checks for stop request while queue is full
+        """
+        if queue_size <= 0:
+            raise ValueError("queue_size must be greater than zero")
+        self._connection = connection
+        self._command = command
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._process: Optional["RemoteProcess"] = None
+        self._reader: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Check if follower was started and not stopped yet."""
+        return self._reader is not None and not self._stop_event.is_set()
+
+    def start(self) -> "DmesgFollower":
+        """
+        Start remote process and reader thread.
+
+        :return: started follower
+        :raises DmesgException: when follower is already started
+        """
+        if self._reader is not None:
+            raise DmesgException("Dmesg follower is already started.")
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Start following dmesg: {self._command}")
+        self._process = self._connection.start_process(self._command, shell=True)
+        self._reader = threading.Thread(target=self._read, name="dmesg-follower", daemon=True)
+        self._reader.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop remote process and reader thread, lines already buffered can still be read."""
+        if self._reader is None or self._stop_event.is_set():
+            return
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Stop following dmesg.")
+        self._stop_event.set()
+        if self._process.running:
+            self._process.kill(wait=None)
+        self._reader.join(timeout=self._poll_interval * 10)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Get next line.
+
+        :param timeout: time in seconds to wait for the line, wait until line arrives when None
+        :return: next line or None when timeout expired or stream ended
+        """
+        try:
+            line = self._queue.get(timeout=timeout)
+        except Empty:
+            return None
+        if line is _END_OF_STREAM:
+            self._queue.put(_END_OF_STREAM)
+            return None
+        return line
+
+    def _read(self) -> None:
+        """Move lines from remote process output to the queue until stopped."""
+        try:
+            for line in self._process.get_stdout_iter():
+                if not self._put(line.rstrip("\n")):
+                    return
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Reading dmesg output failed: {e}")
+        finally:
+            self._put(_END_OF_STREAM, force=True)
+
+    def _put(self, item: object, force: bool = False) -> bool:
+        """
+        Put item to the queue, waiting for free space until follower is stopped.
+
+        :param item: line or end of stream marker
+        :param force: drop the oldest line if queue is full and follower is stopped
+        :return: True if item was queued, False otherwise
+        """
+        while True:
+            try:
+                self._queue.put(item, timeout=self._poll_interval)
+                return True
+            except Full:
+                if not self._stop_event.is_set():
+                    continue
+                if not force:
+                    return False
+                try:
+                    self._queue.get_nowait()
+                except Empty:
+                    pass
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = self.get()
+        if line is None:
+            raise StopIteration
+        return line
+
+    def __enter__(self) -> "DmesgFollower":
+        return self if self._reader is not None else self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
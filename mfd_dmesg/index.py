@@ -0,0 +1,93 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Inverted token index for repeated substring lookups in dmesg lines."""
+
+import re
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+class TokenIndex:
+    """
+    Map of word tokens to ids of lines containing them.
+
+    Substring lookup narrows lines to candidates using word tokens of the substring and verifies candidates,
+    so results are the same as of plain substring check on every line.
+    Token of the substring bounded by non-word characters inside the substring has to be equal to, start or end
+    a token of the line, unbounded token can be any part of a line token.
+    Substrings without word characters cannot be indexed and are looked for in every line.
+    """
+
+    def __init__(self, lines: Sequence[str]):
+        """
+        Build index.
+
+        :param lines: lines to be indexed, line id is position in the sequence
+        """
+        self._lines = lines
+        postings: Dict[str, List[int]] = {}
+        for line_id, line in enumerate(lines):
+            for token in set(TOKEN_RE.findall(line)):
+                postings.setdefault(token, []).append(line_id)
+        self._postings = postings
+        self._fragments: Dict[Tuple[str, bool, bool], FrozenSet[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def _lookup(self, token: str, starts: bool, ends: bool) -> FrozenSet[int]:
+        """
+        Get ids of lines with token matching fragment of the substring.
+
+        :param token: word token of the substring
+        :param starts: line token has to start with the token
+        :param ends: line token has to end with the token
+        :return: ids of lines
+        """
+        key = (token, starts, ends)
+        line_ids = self._fragments.get(key)
+        if line_ids is not None:
+            return line_ids
+        if starts and ends:
+            line_ids = frozenset(self._postings.get(token, ()))
+        else:
+            if starts:
+                matching = [posting for candidate, posting in self._postings.items() if candidate.startswith(token)]
+            elif ends:
+                matching = [posting for candidate, posting in self._postings.items() if candidate.endswith(token)]
+            else:
+                matching = [posting for candidate, posting in self._postings.items() if token in candidate]
+            line_ids = frozenset().union(*matching)
+        self._fragments[key] = line_ids
+        return line_ids
+
+    def candidates(self, substring: str) -> Optional[FrozenSet[int]]:
+        """
+        Get ids of lines which may contain the substring.
+
+        :param substring: literal substring
+        :return: ids of candidate lines or None when substring cannot be indexed
+        """
+        fragments = list(TOKEN_RE.finditer(substring))
+        if not fragments:
+            return None
+        line_ids = None
+        for fragment in fragments:
+            fragment_ids = self._lookup(fragment.group(), fragment.start() > 0, fragment.end() < len(substring))
+            line_ids = fragment_ids if line_ids is None else line_ids & fragment_ids
+            if not line_ids:
+                break
+        return line_ids
+
+    def search(self, substring: str) -> List[int]:
+        """
+        Get ids of lines containing the substring.
+
+        :param substring: literal substring
+        :return: sorted ids of lines
+        """
+        line_ids = self.candidates(substring)
+        if line_ids is None:
+            return [line_id for line_id, line in enumerate(self._lines) if substring in line]
+        return sorted(line_id for line_id in line_ids if substring in self._lines[line_id])
@@ -0,0 +1,187 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Compiled multi-pattern matching for dmesg lines."""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Tuple, Union
+
+from mfd_dmesg.constants import DMESG_WHITELIST
+
+REGEX_METACHARACTERS = frozenset("|*+?[](){}^$\\")
+# flags which can be scoped to a group of combined alternation
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+
+
+def is_regex_pattern(pattern: str) -> bool:
+    """
+    Check if pattern is meant to be a regular expression rather than literal substring.
+
+    Dot is not taken into account, entries like "Module is not present." are literal sentences.
+
+    :param pattern: pattern to check
+    :return: True if pattern contains regex metacharacters and is a valid regex, False otherwise
+    """
+    if not REGEX_METACHARACTERS.intersection(pattern):
+        return False
+    try:
+        re.compile(pattern)
+    except re.error:
+        return False
+    return True
+
+
+class PatternSet:
+    """
+    Set of literal and regex patterns compiled into single alternations.
+
+    Literals are matched as substrings, longest first, regex patterns are matched with re.search semantics.
+    Compiled re.Pattern entries are always regex patterns, string entries are regex patterns only when they
+    contain regex metacharacters and literal mode is off.
+    Each line is scanned once by the regex engine regardless of the number of patterns,
+    patterns are checked one by one only for lines which matched.
+    Regex patterns which cannot be combined without changing their meaning (capturing groups, global inline flags)
+    are searched one by one with their own search.
+    """
+
+    def __init__(
+        self, patterns: Tuple[Union[str, Pattern], ...], literal: bool = False, ignore_case: bool = False
+    ):
+        """
+        Compile patterns.
+
+        :param patterns: literal substrings, regex patterns and compiled regex patterns
+        :param literal: treat all string patterns as literal substrings, even if they contain regex metacharacters
+        :param ignore_case: match case-insensitively
+        """
+        self.patterns = patterns
+        self.ignore_case = ignore_case
+        flags = re.IGNORECASE if ignore_case else 0
+        # (pattern, pattern used for substring check, compiled regex or None for literals)
+        self._compiled: List[Tuple[Union[str, Pattern], str, Optional[Pattern]]] = []
+        for pattern in patterns:
+            if isinstance(pattern, Pattern):
+                self._compiled.append((pattern, pattern.pattern, pattern))
+            elif literal or not is_regex_pattern(pattern):
+                self._compiled.append((pattern, pattern.lower() if ignore_case else pattern, None))
+            else:
+                self._compiled.append((pattern, pattern, re.compile(pattern, flags)))
+        literals = sorted({key for _, key, regex in self._compiled if regex is None}, key=len, reverse=True)
+        alternatives = [re.escape(pattern) for pattern in literals]
+        self._separate: List[Pattern] = []
+        for _, _, regex in self._compiled:
+            if regex is None:
+                continue
+            scoped = _scoped(regex, flags)
+            if scoped is None:
+                self._separate.append(regex)
+            else:
+                alternatives.append(scoped)
+        self._regex: Optional[Pattern] = re.compile("|".join(alternatives), flags) if alternatives else None
+
+    def search(self, line: str) -> bool:
+        """
+        Check if any pattern matches the line.
+
+        :param line: line to check
+        :return: True if any pattern matches, False otherwise
+        """
+        if self._regex is not None and self._regex.search(line) is not None:
+            return True
+        return any(regex.search(line) is not None for regex in self._separate)
+
+    def find_all(self, line: str) -> List[str]:
+        """
+        Get all patterns matching the line.
+
+        :param line: line to check
+        :return: matching patterns in the order they were given, empty list if none matches
+        """
+        if not self.search(line):
+            return []
+        folded = line.lower() if self.ignore_case else line
+        return [
+            pattern
+            for pattern, key, regex in self._compiled
+            if (regex.search(line) if regex is not None else key in folded)
+        ]
+
+
+def _scoped(regex: Pattern, flags: int) -> Optional[str]:
+    # own flags of compiled pattern are kept for its group of the alternation, None when pattern cannot be combined:
+    # groups would be renumbered or clash by name and global inline flags are not allowed inside of a group
+    if regex.groups:
+        return None
+    added = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if regex.flags & flag and not flags & flag)
+    scoped = f"(?{added}:{regex.pattern})" if added else f"(?:{regex.pattern})"
+    try:
+        re.compile(scoped, flags)
+    except re.error:
+        return None
+    return scoped
+
+
+class PatternHit(NamedTuple):
+    """Line matched by at least one of pattern sets."""
+
+    index: int
+    line: str
+    categories: Dict[str, List[str]]
+
+
+@lru_cache(maxsize=128)
+def _compile_patterns(patterns: Tuple[Union[str, Pattern], ...], literal: bool, ignore_case: bool) -> PatternSet:
+    return PatternSet(patterns, literal=literal, ignore_case=ignore_case)
+
+
+def compile_patterns(
+    patterns: Iterable[Union[str, Pattern]], literal: bool = False, ignore_case: bool = False
+) -> PatternSet:
+    """
+    Compile patterns into PatternSet, compiled sets are cached by patterns and options.
+
+    :param patterns: literal substrings, regex patterns and compiled regex patterns, duplicates are dropped
+    :param literal: treat all string patterns as literal substrings, even if they contain regex metacharacters
+    :param ignore_case: match case-insensitively
+    :return: compiled PatternSet
+    """
+    return _compile_patterns(tuple(dict.fromkeys(patterns)), literal, ignore_case)
+
+
+def scan(lines: Iterable[str], pattern_sets: Dict[str, PatternSet]) -> Iterator[PatternHit]:
+    """
+    Scan lines once against multiple categories of patterns.
+
+    :param lines: lines to scan
+    :param pattern_sets: compiled pattern sets by category name
+    :return: iterator over lines matched by any category, with matching patterns by category
+    """
+    for index, line in enumerate(lines):
+        categories = {}
+        for category, pattern_set in pattern_sets.items():
+            matched = pattern_set.find_all(line)
+            if matched:
+                categories[category] = matched
+        if categories:
+            yield PatternHit(index, line, categories)
+
+
+def get_whitelist_matcher(extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None) -> PatternSet:
+    """
+    Get compiled matcher of benign dmesg messages.
+
+    Entries of DMESG_WHITELIST containing regex metacharacters are regular expressions, user defined string entries
+    are always literal substrings, regular expressions have to be passed compiled.
+
+    :param extra_whitelist: user defined benign messages (literal strings or re.Pattern), added to DMESG_WHITELIST
+    :return: compiled PatternSet
+    """
+    patterns = _get_builtin_whitelist(tuple(DMESG_WHITELIST))
+    if extra_whitelist:
+        patterns += tuple(extra_whitelist)
+    return compile_patterns(patterns, literal=True)
+
+
+@lru_cache(maxsize=8)
+def _get_builtin_whitelist(whitelist: Tuple[str, ...]) -> Tuple[Union[str, Pattern], ...]:
+    return tuple(re.compile(entry) if is_regex_pattern(entry) else entry for entry in whitelist)
@@ -0,0 +1,294 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Structured dmesg records."""
+
+import json
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+LEVEL_NAMES = ("emerg", "alert", "crit", "err", "warn", "notice", "info", "debug")
+FACILITY_NAMES = (
+    "kern",
+    "user",
+    "mail",
+    "daemon",
+    "auth",
+    "syslog",
+    "lpr",
+    "news",
+    "uucp",
+    "cron",
+    "authpriv",
+    "ftp",
+    "res0",
+    "res1",
+    "res2",
+    "res3",
+    "local0",
+    "local1",
+    "local2",
+    "local3",
+    "local4",
+    "local5",
+    "local6",
+    "local7",
+)
+
+RECORD_PREFIX_RE = re.compile(
+    rf"(?:(?P<facility>{'|'.join(FACILITY_NAMES)})\s*:(?P<level>{'|'.join(LEVEL_NAMES)})\s*:\s)?"  # dmesg -x
+    r"(?:<(?P<prio>\d+)>)?"  # dmesg -r
+    r"(?P<stamp>\[\s*(?P<timestamp>\d+\.\d+)\]\s?)?"
+)
+SUBSYSTEM_RE = re.compile(r"(?P<subsystem>[\w.\-]+)(?: (?P<device>[\w.\-]*[:.][\w.:\-]*?))?(?: [\w.\-@]+)?: ")
+KMSG_RECORD_RE = re.compile(r"^(?P<prio>\d+),(?P<sequence>\d+),(?P<timestamp>\d+),[^;]*;(?P<message>.*)$")
+
+_NOT_PARSED = object()
+
+
+class DmesgRecord:
+    """
+    Single kernel message parsed from dmesg output.
+
+    Only one copy of the line is kept, text and message are slices computed on access.
+    Subsystem and device are parsed from the message on first access.
+    """
+
+    __slots__ = (
+        "line",
+        "timestamp",
+        "level",
+        "facility",
+        "sequence",
+        "caller",
+        "_text_start",
+        "_message_start",
+        "_subsystem",
+        "_device",
+    )
+
+    def __init__(
+        self,
+        line: str,
+        timestamp: Optional[float] = None,
+        level: Optional[int] = None,
+        facility: Optional[int] = None,
+        sequence: Optional[int] = None,
+        text_start: int = 0,
+        message_start: int = 0,
+        caller: Optional[str] = None,
+    ):
+        """
+        Initialize record.
+
+        :param line: line as returned by dmesg
+        :param timestamp: seconds since boot, None when not present
+        :param level: syslog level (0 - emerg ... 7 - debug), None when not present
+        :param facility: syslog facility (0 - kern ...), None when not present
+        :param sequence: kernel record sequence number, None when not present
+        :param text_start: offset of the line without level/facility prefix
+        :param message_start: offset of the message after timestamp
+        :param caller: thread or CPU which logged the record (e.g. T123), None when not present
+        """
+        self.line = line
+        self.timestamp = timestamp
+        self.level = level
+        self.facility = facility
+        self.sequence = sequence
+        self.caller = caller
+        self._text_start = text_start
+        self._message_start = message_start
+        self._subsystem = _NOT_PARSED
+        self._device = _NOT_PARSED
+
+    @property
+    def text(self) -> str:
+        """Line as printed by plain dmesg, without level and facility prefix."""
+        return self.line[self._text_start :] if self._text_start else self.line
+
+    @property
+    def message(self) -> str:
+        """Message without timestamp."""
+        return self.line[self._message_start :] if self._message_start else self.line
+
+    @property
+    def subsystem(self) -> Optional[str]:
+        """Subsystem or driver prefix of the message, e.g. ice, IPv6."""
+        if self._subsystem is _NOT_PARSED:
+            self._parse_subsystem()
+        return self._subsystem
+
+    @property
+    def device(self) -> Optional[str]:
+        """Device the message refers to, e.g. PCI address 0000:4e:00.0."""
+        if self._device is _NOT_PARSED:
+            self._parse_subsystem()
+        return self._device
+
+    def _parse_subsystem(self) -> None:
+        match = SUBSYSTEM_RE.match(self.line, self._message_start)
+        self._subsystem = match.group("subsystem") if match else None
+        self._device = match.group("device") if match else None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.line!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DmesgRecord):
+            return NotImplemented
+        return self.line == other.line and self.sequence == other.sequence
+
+    def __hash__(self) -> int:
+        return hash((self.line, self.sequence))
+
+
+def parse_record(line: str) -> DmesgRecord:
+    """
+    Parse single line of dmesg output.
+
+    Plain output as well as raw (-r) and decoded (-x) prefixes are supported.
+
+    :param line: line of dmesg output
+    :return: DmesgRecord
+    """
+    match = RECORD_PREFIX_RE.match(line)
+    if not match.end():
+        return DmesgRecord(line)
+    level = facility = None
+    text_start = match.start("stamp") if match.group("stamp") else match.end()
+    if match.group("prio"):
+        prio = int(match.group("prio"))
+        level, facility = prio & 7, prio >> 3
+    elif match.group("level"):
+        level, facility = LEVEL_NAMES.index(match.group("level")), FACILITY_NAMES.index(match.group("facility"))
+    timestamp = float(match.group("timestamp")) if match.group("timestamp") else None
+    return DmesgRecord(
+        line,
+        timestamp=timestamp,
+        level=level,
+        facility=facility,
+        text_start=text_start,
+        message_start=match.end(),
+    )
+
+
+def parse_records(output: str) -> List[DmesgRecord]:
+    """
+    Parse dmesg output into records, single pass over the output.
+
+    :param output: dmesg output
+    :return: list of DmesgRecord, one per line
+    """
+    return [parse_record(line) for line in output.splitlines()]
+
+
+def parse_kmsg_record(line: str) -> Optional[DmesgRecord]:
+    """
+    Parse record read from /dev/kmsg.
+
+    Line of the record is formatted the same way as plain dmesg prints it.
+
+    :param line: record in /dev/kmsg format: prio,sequence,timestamp,flags;message
+    :return: DmesgRecord or None when line is not a kmsg record, e.g. continuation line
+    """
+    match = KMSG_RECORD_RE.match(line)
+    if not match:
+        return None
+    prio = int(match.group("prio"))
+    seconds, microseconds = divmod(int(match.group("timestamp")), 1_000_000)
+    prefix = f"[{seconds:5d}.{microseconds:06d}] "
+    return DmesgRecord(
+        f"{prefix}{match.group('message')}",
+        timestamp=seconds + microseconds / 1_000_000,
+        level=prio & 7,
+        facility=prio >> 3,
+        sequence=int(match.group("sequence")),
+        message_start=len(prefix),
+    )
+
+
+def _json_record(fields: dict) -> Union[DmesgRecord, dict]:
+    """Build record of dmesg --json object as soon as it is decoded, other objects are returned unchanged."""
+    if "msg" not in fields:
+        return fields
+    # floats are decoded as strings, dmesg prints timestamps with 6 decimals, so they are reused without formatting
+    stamp = fields.get("time")
+    if stamp is None:
+        timestamp, prefix = None, ""
+    else:
+        timestamp = float(stamp)
+        if not (isinstance(stamp, str) and stamp[-7:-6] == "."):
+            stamp = f"{timestamp:.6f}"
+        prefix = f"[{stamp:>12}] "
+    prio = fields.get("pri")
+    if not isinstance(prio, int):
+        prio = None
+    return DmesgRecord(
+        f"{prefix}{fields['msg']}",
+        timestamp=timestamp,
+        level=None if prio is None else prio & 7,
+        facility=None if prio is None else prio >> 3,
+        message_start=len(prefix),
+        caller=fields.get("caller"),
+    )
+
+
+# control characters of messages are escaped by dmesg, strict=False only tolerates raw ones of broken printers
+_JSON_DECODER = json.JSONDecoder(object_hook=_json_record, parse_float=str, strict=False)
+
+
+def parse_json_records(output: str) -> List[DmesgRecord]:
+    """
+    Parse output of dmesg --json into records.
+
+    Records are built by the decoder as soon as each object is decoded, so dictionaries of all objects
+    are never kept at once. Priority, timestamp and caller are taken from fields of the object,
+    lines are formatted the same way as plain dmesg prints them, without caller.
+
+    :param output: dmesg --json output
+    :return: list of DmesgRecord
+    :raises ValueError: when output is not dmesg --json output
+    """
+    if not output.strip():
+        return []
+    document = _JSON_DECODER.decode(output)
+    records = document.get("dmesg") if isinstance(document, dict) else None
+    if not isinstance(records, list) or not all(isinstance(record, DmesgRecord) for record in records):
+        raise ValueError("Output is not dmesg --json output")
+    return records
+
+
+def get_effective_timestamps(records: Iterable[DmesgRecord]) -> array:
+    """
+    Get timestamps usable for binary search over records in buffer order.
+
+    Record without timestamp (e.g. continuation line) takes timestamp of the closest previous record,
+    records before the first timestamp get -inf. Kernel timestamps grow monotonically in the buffer.
+
+    :param records: records in buffer order
+    :return: array of timestamps, one per record
+    """
+    timestamps = array("d")
+    last = float("-inf")
+    for record in records:
+        if record.timestamp is not None:
+            last = record.timestamp
+        timestamps.append(last)
+    return timestamps
+
+
+def find_time_window(
+    timestamps: Sequence[float], since: Optional[float] = None, until: Optional[float] = None
+) -> Tuple[int, int]:
+    """
+    Find range of records logged within time window by binary search.
+
+    :param timestamps: effective timestamps of records, see get_effective_timestamps
+    :param since: seconds since boot, window start (inclusive), no limit when None
+    :param until: seconds since boot, window end (inclusive), no limit when None
+    :return: start and end (exclusive) positions of records
+    """
+    start = 0 if since is None else bisect_left(timestamps, since)
+    end = len(timestamps) if until is None else bisect_right(timestamps, until)
+    return start, max(start, end)
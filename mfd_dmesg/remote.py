@@ -0,0 +1,157 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Building of filter commands executed on the host."""
+
+import shlex
+from typing import Iterable, Optional, Tuple
+
+from mfd_dmesg.constants import KMSG_PATH
+
+
+def fixed_strings_grep(patterns: Iterable[str]) -> Optional[str]:
+    """
+    Build single grep invocation printing lines which contain any of literal patterns.
+
+    Matching is the same as Python substring check, every pattern is passed quoted as separate -e argument.
+
+    :param patterns: literal substrings
+    :return: grep command or None when patterns cannot be passed to grep (empty list or pattern with newline)
+    """
+    patterns = list(dict.fromkeys(patterns))
+    if not patterns or any("\n" in pattern or "\r" in pattern for pattern in patterns):
+        return None
+    return "grep -a -F " + " ".join(f"-e {shlex.quote(pattern)}" for pattern in patterns)
+
+
+# characters special in grep basic regular expressions, other characters match themselves
+BRE_METACHARACTERS = frozenset("\\.[]*^$")
+
+
+def is_basic_regex(string: str) -> bool:
+    """
+    Check if grep matches string as a pattern rather than as a literal substring.
+
+    :param string: string passed to grep without -F
+    :return: True if string contains characters special in basic regular expressions, False otherwise
+    """
+    return not BRE_METACHARACTERS.isdisjoint(string)
+
+
+# removes indentation and newlines of dmesg --json output, keys are only at the beginning of lines,
+# raw newlines cannot occur inside JSON strings
+COMPACT_JSON = "sed 's/^ *\\(\"[a-z]*\":\\) */\\1/; s/^ *//' | tr -d '\\n'"
+
+# selects the last lines containing all of the filters, user strings are passed by awk -v with backslashes escaped,
+# so they are matched literally and never interpreted by shell or awk; index() with empty string is not portable;
+# program is joined into single line, so it can be passed by shells which do not allow newlines in quotes (csh)
+LAST_LINES_AWK = " ".join(
+    line.strip()
+    for line in """
+BEGIN {
+    any_count = split(tolower(any_text), any_of, "\\n");
+    then_count = split(then_text, then_any, "\\n");
+    last += 0;
+}
+last > 0 && (service == "" || index($0, service)) {
+    if (any_count) {
+        line = tolower($0);
+        found = 0;
+        for (i = 1; i <= any_count && !found; i++) found = index(line, any_of[i]);
+        if (!found) next;
+    }
+    ring[count++ % last] = $0;
+}
+END {
+    for (i = (count > last ? count - last : 0); i < count; i++) {
+        line = ring[i % last];
+        found = !then_count;
+        for (j = 1; j <= then_count && !found; j++) found = index(line, then_any[j]);
+        if (found) print line;
+    }
+}
+""".strip().splitlines()
+)
+
+
+def last_lines_awk(
+    lines: int,
+    service_name: Optional[str] = None,
+    any_ignore_case: Optional[Iterable[str]] = None,
+    then_any: Optional[Iterable[str]] = None,
+) -> Optional[str]:
+    """
+    Build single awk invocation replacing grep service | grep -i 'a\\|b' | tail -n lines [| grep -F -e c] pipeline.
+
+    Input is scanned once and only the last lines are kept in memory. Strings are matched as literal substrings,
+    which is the same as grep for strings without regex metacharacters.
+
+    :param lines: number of the last matching lines to print
+    :param service_name: lines have to contain the string
+    :param any_ignore_case: lines have to contain any of the strings, case insensitive
+    :param then_any: of the last lines only those containing any of the strings are printed
+    :return: command reading dmesg output on standard input, None when strings cannot be passed (newline inside)
+    """
+    any_ignore_case = list(any_ignore_case or [])
+    then_any = list(then_any or [])
+    strings = [service_name or "", *any_ignore_case, *then_any]
+    if any("\n" in string or "\r" in string for string in strings):
+        return None
+    if "" in any_ignore_case:
+        any_ignore_case = []
+    variables = {
+        "last": str(max(lines, 0)),
+        "service": _escape_awk_value(service_name or ""),
+        "any_text": "\\n".join(_escape_awk_value(string) for string in any_ignore_case),
+        "then_text": "\\n".join(_escape_awk_value(string) for string in then_any) if "" not in then_any else "",
+    }
+    assignments = " ".join(f"-v {name}={shlex.quote(value)}" for name, value in variables.items() if value)
+    return f"awk {assignments} {shlex.quote(LAST_LINES_AWK)}"
+
+
+def _escape_awk_value(value: str) -> str:
+    # escape sequences of awk -v assignments are processed like in string literals
+    return value.replace("\\", "\\\\")
+
+
+# reads all records of /dev/kmsg without waiting for new ones, dd exits with error at the end of records
+KMSG_READ = f"dd if={KMSG_PATH} iflag=nonblock bs=8192 2>/dev/null"
+# first word of the last line printed by kmsg_awk
+KMSG_TRAILER = "__MFD_DMESG_KMSG"
+
+
+def kmsg_awk(after_sequence: Optional[int] = None, level: Optional[int] = None, print_records: bool = True) -> str:
+    """
+    Build awk invocation selecting /dev/kmsg records read on standard input.
+
+    Trailer with number of records read and sequence number of the last one (-1 when none) is printed last,
+    so failed read of /dev/kmsg (e.g. dd without nonblock flag) can be told apart from no new records.
+
+    :param after_sequence: print only records with sequence number greater than this one, all when None
+    :param level: print only records with this syslog level (e.g. 3 for err), all when None
+    :param print_records: print selected records, otherwise only the trailer is printed
+    :return: awk command
+    """
+    conditions = [f"h[2] + 0 > {after_sequence if after_sequence is not None else -1}"]
+    if level is not None:
+        conditions.append(f"h[1] % 8 == {level}")
+    action = f"if ({' && '.join(conditions)}) print " if print_records else ""
+    return (
+        f"awk -F';' '/^[0-9]+,[0-9]+,[0-9]+,/ {{ split($1, h, \",\"); count++; last = h[2]; {action}}} "
+        f"END {{ print \"{KMSG_TRAILER}\", count + 0, (count ? last : -1) }}'"
+    )
+
+
+def parse_kmsg_trailer(line: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse trailer printed by kmsg_awk.
+
+    :param line: line of the output
+    :return: number of records read and sequence number of the last one, None when line is not a trailer
+    """
+    fields = line.split()
+    if len(fields) != 3 or fields[0] != KMSG_TRAILER:
+        return None
+    try:
+        return int(fields[1]), int(fields[2])
+    except ValueError:
+        return None
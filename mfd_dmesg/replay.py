@@ -0,0 +1,334 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Recording of commands executed on a host and their offline replay."""
+
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
+from subprocess import CalledProcessError
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Type, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_connect.process import RemoteProcess
+from mfd_typing import OSBitness, OSName, OSType
+from mfd_typing.cpu_values import CPUArchitecture
+
+from mfd_dmesg.exceptions import ReplayError
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+# recordings are gzip compressed JSON lines, the first line is a header:
+# {"version": int, "os_name": str, "os_type": str, "os_bitness": str, "cpu_architecture": str}
+# where values other than os_name are null when the recorded connection could not provide them,
+# other lines are executed commands:
+# {"command": str, "return_code": int, "stdout": str, "stderr": str, "duration": float}
+# output bytes which are not valid UTF-8 are kept as surrogate escapes, so they are restored exactly
+RECORDING_VERSION = 1
+
+
+def _get_stdout_bytes(result: ConnectionCompletedProcess) -> bytes:
+    try:
+        return result.stdout_bytes
+    except NotImplementedError:
+        return (result.stdout or "").encode("utf-8", "surrogateescape")
+
+
+def _get_stderr_bytes(result: ConnectionCompletedProcess) -> bytes:
+    try:
+        return result.stderr_bytes
+    except NotImplementedError:
+        return (result.stderr or "").encode("utf-8", "surrogateescape")
+
+
+def _get_value(getter: Callable[[], Any]) -> Optional[str]:
+    try:
+        value = getattr(getter(), "value", None)
+    except Exception as e:
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Host information not recorded: {e}")
+        return None
+    return value if isinstance(value, str) else None
+
+
+def _check_return_code(
+    command: str,
+    return_code: int,
+    stdout: str,
+    stderr: str,
+    expected_return_codes: Optional[Iterable],
+    custom_exception: Optional[Type[CalledProcessError]],
+) -> None:
+    if expected_return_codes is not None and return_code not in expected_return_codes:
+        raise (custom_exception or ConnectionCalledProcessError)(
+            returncode=return_code, cmd=command, output=stdout, stderr=stderr
+        )
+
+
+class RecordingConnection(Connection):
+    """
+    Connection wrapper saving every executed command with its output and duration to a recording file.
+
+    Commands are executed by the wrapped connection, other methods are delegated to it.
+    Recording is written as the commands run, close() has to be called to finish the file.
+    """
+
+    def __init__(self, connection: Connection, path: Union[str, Path]):
+        """
+        Open recording file.
+
+        :param connection: mfd_connect object of the real host
+        :param path: path of the recording file, overwritten if exists
+        """
+        super().__init__()
+        self._connection = connection
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        header = {
+            "version": RECORDING_VERSION,
+            "os_name": connection.get_os_name().value,
+            "os_type": _get_value(connection.get_os_type),
+            "os_bitness": _get_value(connection.get_os_bitness),
+            "cpu_architecture": _get_value(connection.get_cpu_architecture),
+        }
+        self._file.write(json.dumps(header) + "\n")
+
+    def __enter__(self) -> "RecordingConnection":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Finish recording file."""
+        with self._lock:
+            self._file.close()
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Optional[Iterable] = frozenset({0}),
+        custom_exception: Optional[Type[CalledProcessError]] = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Execute command on wrapped connection and record it, see Connection.execute_command.
+
+        Command is recorded also when its return code is not expected.
+        """
+        start = time.perf_counter()
+        result = self._connection.execute_command(command, expected_return_codes=None, **kwargs)
+        duration = time.perf_counter() - start
+        stdout = _get_stdout_bytes(result).decode("utf-8", "surrogateescape")
+        stderr = _get_stderr_bytes(result).decode("utf-8", "surrogateescape")
+        entry = {
+            "command": command,
+            "return_code": result.return_code,
+            "stdout": stdout,
+            "stderr": stderr,
+            "duration": round(duration, 6),
+        }
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+        _check_return_code(
+            command, result.return_code, result.stdout, result.stderr, expected_return_codes, custom_exception
+        )
+        return result
+
+    def start_process(self, *args, **kwargs) -> RemoteProcess:
+        """Start process on wrapped connection, it is not recorded."""
+        return self._connection.start_process(*args, **kwargs)
+
+    def get_os_name(self) -> OSName:
+        """Get name of client OS."""
+        return self._connection.get_os_name()
+
+    def get_os_type(self) -> OSType:
+        """Get type of client OS."""
+        return self._connection.get_os_type()
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get bitness of client OS."""
+        return self._connection.get_os_bitness()
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """Get CPU architecture of client."""
+        return self._connection.get_cpu_architecture()
+
+    @property
+    def path(self) -> Type[Path]:
+        """Path class of wrapped connection."""
+        return self._connection.path
+
+    def restart_platform(self) -> None:
+        """Reboot host."""
+        self._connection.restart_platform()
+
+    def shutdown_platform(self) -> None:
+        """Shutdown host."""
+        self._connection.shutdown_platform()
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        """Wait for host availability."""
+        self._connection.wait_for_host(timeout=timeout)
+
+    def disconnect(self) -> None:
+        """Disconnect wrapped connection."""
+        self._connection.disconnect()
+
+
+class ReplayConnection(Connection):
+    """
+    Connection returning outputs of a recording instead of executing commands.
+
+    Every command returns its recorded outputs in the recorded order, independently of other commands,
+    so replay is deterministic as long as the same sequence of calls is made.
+    Recorded duration of the command, multiplied by time_scale, is slept before returning.
+    OS information of the recorded host is replayed from the recording header, the host cannot be restarted.
+    """
+
+    def __init__(self, path: Union[str, Path], *, time_scale: float = 1.0, cycle: bool = False):
+        """
+        Load recording.
+
+        :param path: path of the recording file created by RecordingConnection
+        :param time_scale: factor of recorded durations, 0 replays without delays
+        :param cycle: start again from the first output when outputs of a command are exhausted,
+                      useful for repeated runs in benchmarks
+        :raises ReplayError: when file is not a supported recording
+        """
+        super().__init__()
+        if time_scale < 0:
+            raise ValueError("time_scale cannot be negative")
+        self.time_scale = time_scale
+        self.cycle = cycle
+        self.executed: List[str] = []
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, List[dict]] = defaultdict(list)
+        with gzip.open(path, "rt", encoding="utf-8") as recording:
+            header = json.loads(next(recording, "{}"))
+            if header.get("version") != RECORDING_VERSION:
+                raise ReplayError(f"Unsupported recording: {path}")
+            self._os_name = OSName(header["os_name"])
+            self._header = header
+            for line in recording:
+                entry = json.loads(line)
+                self._recorded[entry["command"]].append(entry)
+        self._pending: Dict[str, Deque[dict]] = {}
+        self.rewind()
+
+    def rewind(self) -> None:
+        """Start replay from the beginning of the recording."""
+        with self._lock:
+            self._pending = {command: deque(entries) for command, entries in self._recorded.items()}
+            self.executed.clear()
+
+    def _next_entry(self, command: str) -> dict:
+        with self._lock:
+            pending = self._pending.get(command)
+            if pending is None:
+                raise ReplayError(f"Command was not recorded: {command}")
+            if not pending:
+                if not self.cycle:
+                    raise ReplayError(f"All recorded outputs of command were already replayed: {command}")
+                pending.extend(self._recorded[command])
+            self.executed.append(command)
+            return pending.popleft()
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        discard_stdout: bool = False,
+        discard_stderr: bool = False,
+        expected_return_codes: Optional[Iterable] = frozenset({0}),
+        custom_exception: Optional[Type[CalledProcessError]] = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Return recorded output of the command, see Connection.execute_command.
+
+        :raises ReplayError: when command was not recorded or its outputs were exhausted
+        """
+        entry = self._next_entry(command)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Replaying: {command}")
+        if self.time_scale:
+            time.sleep(entry["duration"] * self.time_scale)
+        stdout_bytes = b"" if discard_stdout else entry["stdout"].encode("utf-8", "surrogateescape")
+        stderr_bytes = b"" if discard_stderr else entry["stderr"].encode("utf-8", "surrogateescape")
+        stdout = stdout_bytes.decode(errors="backslashreplace")
+        stderr = stderr_bytes.decode(errors="backslashreplace")
+        _check_return_code(command, entry["return_code"], stdout, stderr, expected_return_codes, custom_exception)
+        return ConnectionCompletedProcess(
+            args=command,
+            stdout=stdout,
+            stderr=stderr,
+            stdout_bytes=stdout_bytes,
+            stderr_bytes=stderr_bytes,
+            return_code=entry["return_code"],
+        )
+
+    def get_os_name(self) -> OSName:
+        """Get name of recorded OS."""
+        return self._os_name
+
+    def _get_recorded(self, key: str, value_type: Type) -> Any:
+        if self._header.get(key) is None:
+            raise ReplayError(f"{key} of the host was not recorded")
+        return value_type(self._header[key])
+
+    def get_os_type(self) -> OSType:
+        """Get type of recorded OS, derived from OS name for recordings without it."""
+        if self._header.get("os_type") is None:
+            return OSType.WINDOWS if self._os_name == OSName.WINDOWS else OSType.POSIX
+        return self._get_recorded("os_type", OSType)
+
+    def get_os_bitness(self) -> OSBitness:
+        """
+        Get bitness of recorded OS.
+
+        :raises ReplayError: when bitness was not recorded
+        """
+        return self._get_recorded("os_bitness", OSBitness)
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """
+        Get CPU architecture of recorded host.
+
+        :raises ReplayError: when CPU architecture was not recorded
+        """
+        return self._get_recorded("cpu_architecture", CPUArchitecture)
+
+    @property
+    def path(self) -> Type[PurePath]:
+        """Pure path class of recorded OS, files of the recorded host are not accessible."""
+        return PureWindowsPath if self.get_os_type() == OSType.WINDOWS else PurePosixPath
+
+    def restart_platform(self) -> None:
+        """
+        Reboot host.
+
+        :raises ReplayError: recorded host cannot be restarted
+        """
+        raise ReplayError("Replayed host cannot be restarted")
+
+    def shutdown_platform(self) -> None:
+        """
+        Shutdown host.
+
+        :raises ReplayError: recorded host cannot be shut down
+        """
+        raise ReplayError("Replayed host cannot be shut down")
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        """Replayed host is always available."""
+
+    def disconnect(self) -> None:
+        """Nothing to disconnect."""
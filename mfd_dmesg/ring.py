@@ -0,0 +1,215 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Bounded in-memory history of kernel messages for long-running monitoring."""
+
+import logging
+import threading
+from array import array
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, Union, TYPE_CHECKING
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from mfd_dmesg.exceptions import DmesgException
+from mfd_dmesg.matcher import compile_patterns
+from mfd_dmesg.records import DmesgRecord, parse_record
+
+if TYPE_CHECKING:
+    from mfd_dmesg.base import Dmesg
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+
+class DmesgRingBuffer:
+    """
+    Most recent kernel records kept in fixed-size circular storage.
+
+    Storage is limited by number of records and by size of their lines in bytes, oldest records are evicted first.
+    Evicted records which matched pin patterns (or were appended pinned) are moved to separate bounded history,
+    so context of errors survives eviction. Append and eviction are O(1), time slicing uses binary search.
+    Memory usage does not grow with duration of the test.
+    """
+
+    def __init__(
+        self,
+        dmesg: Optional["Dmesg"] = None,
+        *,
+        max_records: int = 10000,
+        max_bytes: int = 16 * 1024 * 1024,
+        pin_patterns: Optional[Iterable[str]] = None,
+        max_pinned: int = 1000,
+    ):
+        """
+        Initialize buffer.
+
+        :param dmesg: Dmesg object used by update() to read new records
+        :param max_records: maximum number of records kept in the buffer
+        :param max_bytes: maximum size of lines kept in the buffer, single bigger record is kept alone
+        :param pin_patterns: literal substrings, matching records are kept after eviction, e.g. FAILS
+        :param max_pinned: maximum number of evicted pinned records kept, oldest are dropped
+        :raises ValueError: when limits are not positive
+        """
+        if max_records < 1 or max_bytes < 1:
+            raise ValueError("max_records and max_bytes have to be positive")
+        self._dmesg = dmesg
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self._pin_patterns = compile_patterns(pin_patterns, literal=True) if pin_patterns else None
+        self._records: List[Optional[DmesgRecord]] = [None] * max_records
+        self._sizes = array("Q", [0]) * max_records
+        # timestamp of the record or of the closest previous record with timestamp, used for time slicing
+        self._times = array("d", [0.0]) * max_records
+        self._pinned_flags = bytearray(max_records)
+        self._start = 0
+        self._count = 0
+        self._bytes = 0
+        self._pinned: Deque[DmesgRecord] = deque(maxlen=max_pinned)
+        self._last_timestamp: Optional[float] = None
+        self._last_sequence: Optional[int] = None
+        self._use_kmsg = True
+        self.evicted = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """Size of lines kept in the buffer in bytes."""
+        return self._bytes
+
+    def _get(self, index: int) -> DmesgRecord:
+        return self._records[(self._start + index) % self.max_records]
+
+    def _evict_oldest(self) -> None:
+        start = self._start
+        if self._pinned_flags[start]:
+            self._pinned.append(self._records[start])
+        self._bytes -= self._sizes[start]
+        self._records[start] = None
+        self._start = (start + 1) % self.max_records
+        self._count -= 1
+        self.evicted += 1
+
+    def append(self, record: Union[DmesgRecord, str], pin: bool = False) -> None:
+        """
+        Add record as the newest one, evicting oldest records when limits are exceeded.
+
+        :param record: DmesgRecord or line of dmesg output
+        :param pin: keep record after eviction regardless of pin patterns
+        """
+        if isinstance(record, str):
+            record = parse_record(record)
+        line = record.line
+        size = len(line) if line.isascii() else len(line.encode())
+        pinned = pin or (self._pin_patterns is not None and self._pin_patterns.search(record.text))
+        with self._lock:
+            while self._count and (self._count == self.max_records or self._bytes + size > self.max_bytes):
+                self._evict_oldest()
+            if record.timestamp is not None:
+                self._last_timestamp = record.timestamp
+            position = (self._start + self._count) % self.max_records
+            self._records[position] = record
+            self._sizes[position] = size
+            self._times[position] = self._last_timestamp if self._last_timestamp is not None else float("-inf")
+            self._pinned_flags[position] = pinned
+            self._count += 1
+            self._bytes += size
+
+    def extend(self, records: Iterable[Union[DmesgRecord, str]]) -> None:
+        """
+        Add records in order.
+
+        :param records: DmesgRecords or lines of dmesg output
+        """
+        for record in records:
+            self.append(record)
+
+    def update(self) -> int:
+        """
+        Read records which appeared since the last update from Dmesg object.
+
+        On Linux hosts with readable /dev/kmsg only records newer than the last sequence number are transferred.
+        Otherwise whole buffer is read and records with timestamp newer than the last one are added,
+        lines without timestamp cannot be told apart and are skipped.
+
+        :return: number of added records
+        :raises DmesgException: when buffer was created without Dmesg object
+        """
+        if self._dmesg is None:
+            raise DmesgException("DmesgRingBuffer was created without Dmesg object to read from")
+        records = None
+        if self._use_kmsg:
+            try:
+                records = self._dmesg.get_records_after(self._last_sequence)
+            except DmesgException as e:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Fall back to timestamps for incremental reads: {e}")
+                self._use_kmsg = False
+            else:
+                if records:
+                    self._last_sequence = max(record.sequence for record in records)
+        if records is None:
+            last_timestamp = self._last_timestamp
+            records = [
+                record
+                for record in self._dmesg.get_records()
+                if record.timestamp is not None and (last_timestamp is None or record.timestamp > last_timestamp)
+            ]
+        self.extend(records)
+        return len(records)
+
+    def __iter__(self) -> Iterator[DmesgRecord]:
+        return iter(self.records)
+
+    @property
+    def records(self) -> List[DmesgRecord]:
+        """Records kept in the buffer, oldest first."""
+        with self._lock:
+            return [self._get(index) for index in range(self._count)]
+
+    @property
+    def pinned(self) -> List[DmesgRecord]:
+        """Pinned records, evicted ones followed by ones still kept in the buffer, oldest first."""
+        with self._lock:
+            kept = [
+                self._get(index)
+                for index in range(self._count)
+                if self._pinned_flags[(self._start + index) % self.max_records]
+            ]
+            return list(self._pinned) + kept
+
+    def since(self, timestamp: float) -> List[DmesgRecord]:
+        """
+        Get records logged at or after the time.
+
+        :param timestamp: seconds since boot
+        :return: records, oldest first
+        """
+        with self._lock:
+            low, high = 0, self._count
+            while low < high:
+                middle = (low + high) // 2
+                if self._times[(self._start + middle) % self.max_records] < timestamp:
+                    low = middle + 1
+                else:
+                    high = middle
+            return [self._get(index) for index in range(low, self._count)]
+
+    def last(self, seconds: float) -> List[DmesgRecord]:
+        """
+        Get records logged within the last seconds before the newest record.
+
+        :param seconds: length of the time window
+        :return: records, oldest first
+        """
+        if self._last_timestamp is None:
+            return self.records
+        return self.since(self._last_timestamp - seconds)
+
+    def clear(self) -> None:
+        """Drop all records, including pinned ones, position of incremental reads is kept."""
+        with self._lock:
+            self._records = [None] * self.max_records
+            self._pinned.clear()
+            self._start = self._count = self._bytes = 0
@@ -0,0 +1,391 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Immutable capture of the kernel message buffer queried locally."""
+
+import logging
+import re
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_typing import OSName
+
+from mfd_dmesg.analysis import (
+    filter_error_records,
+    find_buffer_size_data,
+    find_errors,
+    find_os_package_info,
+    find_str,
+    verification_result,
+    verify_freebsd_log,
+    verify_linux_log,
+)
+from mfd_dmesg.constants import ACC_IMC_LEVEL_KEYWORDS, DmesgLevelOptions, OSPackageInfo
+from mfd_dmesg.index import TokenIndex
+from mfd_dmesg.records import LEVEL_NAMES, DmesgRecord, find_time_window, get_effective_timestamps, parse_records
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+_NOT_BUILT = object()
+
+
+class DmesgSnapshot:
+    """
+    Kernel message buffer captured once, with Dmesg queries computed locally on the same data.
+
+    Snapshot is immutable, indexes used by queries are built on first use and shared between queries.
+    When captured in raw mode (Linux), levels of messages are exact,
+    otherwise they are classified by keywords as on ACC and IMC systems.
+    Indexed snapshot narrows substring lookups (search, check_errors, check_str_present) with inverted token index,
+    which pays off when many strings are looked for in the same snapshot.
+    """
+
+    __slots__ = (
+        "_output",
+        "_os_name",
+        "_captured_at",
+        "_indexed",
+        "_records",
+        "_text",
+        "_levels",
+        "_token_index",
+        "_timestamps",
+    )
+
+    def __init__(self, output: str, os_name: OSName, captured_at: Optional[float] = None, indexed: bool = False):
+        """
+        Initialize snapshot.
+
+        :param output: dmesg output, plain or raw (-r)
+        :param os_name: OS of the host the output was captured on
+        :param captured_at: time of capture in seconds since the epoch, current time when None
+        :param indexed: use inverted token index for substring lookups, built on first lookup
+        """
+        self._output = output
+        self._os_name = os_name
+        self._captured_at = time.time() if captured_at is None else captured_at
+        self._indexed = indexed
+        self._records = _NOT_BUILT
+        self._text = _NOT_BUILT
+        self._levels = _NOT_BUILT
+        self._token_index = _NOT_BUILT
+        self._timestamps = _NOT_BUILT
+
+    @property
+    def os_name(self) -> OSName:
+        """OS of the host the snapshot was captured on."""
+        return self._os_name
+
+    @property
+    def captured_at(self) -> float:
+        """Time of capture in seconds since the epoch."""
+        return self._captured_at
+
+    @property
+    def records(self) -> Tuple[DmesgRecord, ...]:
+        """All records of the snapshot."""
+        if self._records is _NOT_BUILT:
+            self._records = tuple(parse_records(self._output))
+        return self._records
+
+    @property
+    def output(self) -> str:
+        """Captured output as printed by plain dmesg."""
+        if self._text is _NOT_BUILT:
+            self._text = "\n".join(record.text for record in self.records)
+        return self._text
+
+    @property
+    def has_levels(self) -> bool:
+        """Check if snapshot was captured in raw mode, so levels of messages are exact."""
+        return bool(self.records) and self.records[0].level is not None
+
+    def _get_level_index(self) -> Dict[DmesgLevelOptions, Tuple[int, ...]]:
+        """
+        Get positions of records of every level, built in single pass on first use.
+
+        Lines without priority prefix in raw output are continuation of previous message and share its level.
+
+        :return: positions of records by DmesgLevelOptions, DmesgLevelOptions.NONE holds all records
+        """
+        if self._levels is not _NOT_BUILT:
+            return self._levels
+        positions = {option: [] for option in DmesgLevelOptions}
+        if self.has_levels:
+            options = {
+                LEVEL_NAMES.index(option.value): option for option in DmesgLevelOptions if option.value in LEVEL_NAMES
+            }
+            level = None
+            for position, record in enumerate(self.records):
+                if record.level is not None:
+                    level = record.level
+                if level in options:
+                    positions[options[level]].append(position)
+        else:
+            keywords = {
+                option: (
+                    re.compile(ACC_IMC_LEVEL_KEYWORDS[option], re.IGNORECASE)
+                    if option in ACC_IMC_LEVEL_KEYWORDS
+                    else re.compile(re.escape(option.value))
+                )
+                for option in DmesgLevelOptions
+                if option is not DmesgLevelOptions.NONE
+            }
+            for position, record in enumerate(self.records):
+                if "Step" in record.text:
+                    continue
+                for option, keyword in keywords.items():
+                    if keyword.search(record.text):
+                        positions[option].append(position)
+        positions[DmesgLevelOptions.NONE] = range(len(self.records))
+        self._levels = {option: tuple(option_positions) for option, option_positions in positions.items()}
+        return self._levels
+
+    @property
+    def indexed(self) -> bool:
+        """Check if substring lookups use inverted token index."""
+        return self._indexed
+
+    def _get_token_index(self) -> TokenIndex:
+        """Get inverted token index of record texts, built on first use."""
+        if self._token_index is _NOT_BUILT:
+            self._token_index = TokenIndex([record.text for record in self.records])
+        return self._token_index
+
+    def _get_time_window(self, since: Optional[float], until: Optional[float]) -> Tuple[int, int]:
+        """
+        Get range of positions of records logged within time window, timestamps are collected on first use.
+
+        :param since: seconds since boot, window start (inclusive), no limit when None
+        :param until: seconds since boot, window end (inclusive), no limit when None
+        :return: start and end (exclusive) positions of records
+        """
+        if self._timestamps is _NOT_BUILT:
+            self._timestamps = get_effective_timestamps(self.records)
+        return find_time_window(self._timestamps, since, until)
+
+    def _find(self, substring: str) -> List[int]:
+        """
+        Get positions of records containing the substring.
+
+        :param substring: literal substring
+        :return: sorted positions of records
+        """
+        if self._indexed:
+            return self._get_token_index().search(substring)
+        return [position for position, record in enumerate(self.records) if substring in record.text]
+
+    def _select(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[int]:
+        """
+        Get positions of records of the level and service.
+
+        Time window is found by binary search, so only records within the window are visited.
+
+        :param level: limits messages only to provided by DmesgLevelOptions
+        :param service_name: limits messages only to lines containing provided service
+        :param since: seconds since boot, limits messages to ones logged at or after
+        :param until: seconds since boot, limits messages to ones logged at or before
+        :return: sorted positions of records
+        """
+        positions = self._get_level_index()[level]
+        if since is not None or until is not None:
+            start, end = self._get_time_window(since, until)
+            positions = positions[bisect_left(positions, start) : bisect_left(positions, end)]
+        if service_name is None:
+            return list(positions)
+        if self._indexed:
+            matching = set(self._find(service_name))
+            return [position for position in positions if position in matching]
+        records = self.records
+        return [position for position in positions if service_name in records[position].text]
+
+    def search(self, substring: str) -> List[DmesgRecord]:
+        """
+        Get records containing the substring.
+
+        :param substring: literal substring, case sensitive
+        :return: list of DmesgRecord
+        """
+        records = self.records
+        return [records[position] for position in self._find(substring)]
+
+    def get_records(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[DmesgRecord]:
+        """
+        Get records of the snapshot.
+
+        :param level: limits messages only to provided by DmesgLevelOptions
+        :param service_name: limits messages only to lines containing provided service
+        :param since: seconds since boot, limits messages to ones logged at or after
+        :param until: seconds since boot, limits messages to ones logged at or before
+        :return: list of DmesgRecord
+        """
+        records = self.records
+        positions = self._select(level=level, service_name=service_name, since=since, until=until)
+        return [records[position] for position in positions]
+
+    def get_messages(
+        self,
+        level: DmesgLevelOptions = DmesgLevelOptions.NONE,
+        service_name: str = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> str:
+        """
+        Get messages of the snapshot, same as Dmesg.get_messages would return at the time of capture.
+
+        :param level: limits messages only to provided by DmesgLevelOptions
+        :param service_name: limits messages only to lines containing provided service
+        :param since: seconds since boot, limits messages to ones logged at or after
+        :param until: seconds since boot, limits messages to ones logged at or before
+        :return: dmesg output
+        """
+        if level is DmesgLevelOptions.NONE and service_name is None and since is None and until is None:
+            return self.output
+        records = self.get_records(level=level, service_name=service_name, since=since, until=until)
+        return "\n".join(record.text for record in records)
+
+    def get_messages_by_level(self, service_name: str = None) -> Dict[DmesgLevelOptions, str]:
+        """
+        Get messages of every level.
+
+        :param service_name: limits messages only to lines containing provided service
+        :return: dmesg output for every DmesgLevelOptions, DmesgLevelOptions.NONE holds all messages
+        """
+        return {option: self.get_messages(level=option, service_name=service_name) for option in DmesgLevelOptions}
+
+    def get_messages_additional(
+        self, service_name: str = None, lines: int = 1000, additional_greps: Optional[List[str]] = None
+    ) -> str:
+        """
+        Get the last lines of the snapshot.
+
+        :param service_name: limits messages only to lines containing provided service
+        :param lines: limit number of lines
+        :param additional_greps: list of text to find in addition, case insensitive
+        :return: dmesg output
+        """
+        records = self.records
+        return "\n".join(
+            records[position].text
+            for position in self._select_last(service_name=service_name, lines=lines, additional_greps=additional_greps)
+        )
+
+    def _select_last(self, service_name: Optional[str], lines: int, additional_greps: Optional[List[str]]) -> List[int]:
+        """
+        Get positions of the last records of the service, see get_messages_additional.
+
+        :param service_name: limits messages only to lines containing provided service
+        :param lines: limit number of lines
+        :param additional_greps: list of text to find in addition, case insensitive
+        :return: sorted positions of records
+        """
+        positions = self._select(service_name=service_name)
+        if additional_greps:
+            greps = [grep.lower() for grep in additional_greps]
+            records = self.records
+            positions = [
+                position for position in positions if any(grep in records[position].text.lower() for grep in greps)
+            ]
+        return positions[-lines:] if lines > 0 else []
+
+    def get_buffer_size_data(self, driver_name: str, driver_interface_number: str) -> Optional[list]:
+        """
+        Get driver buffer size information.
+
+        :param driver_name: limits buffer size info only to provided driver name
+        :param driver_interface_number: limits buffer size info only to provided driver interface number
+        :return: list of buffer size match objects
+        """
+        records = self.get_records(service_name=f"{driver_name}{driver_interface_number}")
+        return find_buffer_size_data(records, driver_name, driver_interface_number)
+
+    def get_os_package_info(self) -> Union[OSPackageInfo, None]:
+        """
+        Get loaded OS package information.
+
+        :return: OSPackageInfo object or None when not found
+        """
+        return find_os_package_info(self.records)
+
+    def verify_messages(
+        self, extra_whitelist: Optional[Iterable[Union[str, Pattern]]] = None, aggregate: bool = False
+    ) -> dict:
+        """
+        Verify if there are err level messages in the snapshot, see Dmesg.verify_messages.
+
+        :param extra_whitelist: user defined benign messages, literal strings or re.Pattern, added to DMESG_WHITELIST
+        :param aggregate: collapse repetitive error messages into templates
+        :return: dictionary indicating success or failure and the error messages if present.
+        """
+        is_linux = self._os_name == OSName.LINUX
+        records = self.get_records(level=DmesgLevelOptions.ERRORS) if is_linux else self.records
+        errors = filter_error_records(records, extra_whitelist, keyword_required=not is_linux)
+        return verification_result(errors, aggregate=aggregate)
+
+    def check_errors(self, error_list: list) -> tuple:
+        """
+        Verify the snapshot for any user defined errors.
+
+        :param error_list: list of errors to be looked out in the dmesg log
+        :return: tuple indicating success or failure and the list of error messages if present.
+        """
+        records = self.records
+        if self._indexed:
+            positions = set()
+            for error in set(error_list):
+                positions.update(self._find(error))
+            records = [records[position] for position in sorted(positions)]
+        return find_errors(records, error_list)
+
+    def check_str_present(
+        self, service_name: str, lookout_str: str, additional_greps: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Check the last 500 lines of the snapshot for user specified string, see Dmesg.check_str_present.
+
+        :param service_name: limits messages only to lines containing provided service
+        :param lookout_str: user specified string to be searched in the dmesg logs
+        :param additional_greps: list of text to find in addition
+        :return: True if user specified string is present, False otherwise
+        """
+        positions = self._select_last(service_name=service_name, lines=500, additional_greps=additional_greps)
+        if self._indexed and positions:
+            matching = set(self._find(lookout_str))
+            positions = [position for position in positions if position in matching]
+            if not positions:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"User specified {lookout_str} not present in dmesg log")
+                return False
+        records = self.records
+        return find_str([records[position] for position in positions], lookout_str, service_name)
+
+    def verify_log(self, driver: str) -> str:
+        """
+        Check messages of the driver for errors, see Dmesg.verify_log.
+
+        :param driver: Name of the driver such as i40en
+        :return: empty string if no errors found, error content otherwise
+        :raise BadWordInLog: Bad (ie. non-inclusive, offensive etc.) word found in log
+        """
+        if self._os_name == OSName.LINUX:
+            return verify_linux_log(self.get_messages(service_name=driver))
+        return verify_freebsd_log(self.output, driver)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} records, captured_at={self._captured_at})"
@@ -0,0 +1,201 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Instrumentation of remote I/O and local processing time of Dmesg methods."""
+
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+
+@dataclass
+class CallStats:
+    """Statistics of a single call of public method, or accumulated statistics of many calls."""
+
+    method: str
+    calls: int = 0
+    commands: int = 0
+    bytes_received: int = 0
+    remote_time: float = 0.0
+    local_time: float = 0.0
+
+    @property
+    def total_time(self) -> float:
+        """Wall time of calls in seconds."""
+        return self.remote_time + self.local_time
+
+    def add(self, other: "CallStats") -> None:
+        """
+        Accumulate statistics of other calls.
+
+        :param other: statistics to add
+        """
+        self.calls += other.calls
+        self.commands += other.commands
+        self.bytes_received += other.bytes_received
+        self.remote_time += other.remote_time
+        self.local_time += other.local_time
+
+
+def _size(output: Any) -> int:
+    if not output:
+        return 0
+    if isinstance(output, str):
+        return len(output) if output.isascii() else len(output.encode())
+    return len(output)
+
+
+def received_bytes(result: Any) -> int:
+    """
+    Get size of outputs of executed command.
+
+    :param result: ConnectionCompletedProcess or CalledProcessError
+    :return: size of stdout and stderr in bytes
+    """
+    if hasattr(result, "return_code"):
+        try:
+            return len(result.stdout_bytes) + _size(result.stderr)
+        except NotImplementedError:
+            return _size(result.stdout) + _size(result.stderr)
+    return _size(getattr(result, "output", None)) + _size(getattr(result, "stderr", None))
+
+
+class DmesgStats:
+    """
+    Statistics of public Dmesg methods accumulated per method name.
+
+    For every call the number of executed commands, size of received outputs, time spent waiting for commands
+    (remote time) and the rest of the wall time (local parsing and scanning) are measured.
+    Calls made inside another measured call are accounted to the outer one.
+    When disabled, the only cost of a call is the check of the enabled flag.
+    """
+
+    def __init__(self, enabled: bool = False, callback: Optional[Callable[[CallStats], None]] = None):
+        """
+        Initialize statistics.
+
+        :param enabled: collect statistics
+        :param callback: called with CallStats of every finished call, e.g. to export them to metrics system
+        """
+        self.enabled = enabled
+        self.callback = callback
+        self._methods: Dict[str, CallStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def current(self) -> Optional[CallStats]:
+        """Statistics of the call being measured in the current thread, None when no call is measured."""
+        return getattr(self._local, "call", None)
+
+    def get(self, method: str) -> CallStats:
+        """
+        Get accumulated statistics of method.
+
+        :param method: name of Dmesg method
+        :return: statistics, empty when method was not called
+        """
+        with self._lock:
+            accumulated = CallStats(method)
+            if method in self._methods:
+                accumulated.add(self._methods[method])
+            return accumulated
+
+    @property
+    def total(self) -> CallStats:
+        """Statistics accumulated over all methods."""
+        total = CallStats("total")
+        with self._lock:
+            for accumulated in self._methods.values():
+                total.add(accumulated)
+        return total
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Get accumulated statistics of called methods as dictionaries, keyed by method name."""
+        with self._lock:
+            return {method: asdict(accumulated) for method, accumulated in self._methods.items()}
+
+    def reset(self) -> None:
+        """Forget accumulated statistics."""
+        with self._lock:
+            self._methods.clear()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.as_dict())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(enabled={self.enabled}, methods={self.as_dict()})"
+
+    def _record(self, call: CallStats) -> None:
+        with self._lock:
+            self._methods.setdefault(call.method, CallStats(call.method)).add(call)
+        if self.callback is not None:
+            try:
+                self.callback(call)
+            except Exception as e:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Statistics callback failed: {e}")
+
+    def measure(self, method: str, function: Callable, *args, **kwargs) -> Any:
+        """
+        Call function and record its statistics under method name.
+
+        :param method: name under which statistics are accumulated
+        :param function: measured function
+        :return: result of the function
+        """
+        if self.current is not None:
+            return function(*args, **kwargs)
+        call = CallStats(method, calls=1)
+        self._local.call = call
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._local.call = None
+            call.local_time = max(time.perf_counter() - start - call.remote_time, 0.0)
+            self._record(call)
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Measure calls of method of object having DmesgStats in stats attribute.
+
+    :param method: public method
+    :return: decorated method
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs) -> Any:
+        if not self.stats.enabled:
+            return method(self, *args, **kwargs)
+        return self.stats.measure(method.__name__, method, self, *args, **kwargs)
+
+    return wrapper
+
+
+class RoundTripBudget:
+    """Commands executed within Dmesg.round_trip_budget block."""
+
+    def __init__(self, max_commands: int):
+        """
+        Initialize budget.
+
+        :param max_commands: maximum number of commands allowed
+        """
+        self.max_commands = max_commands
+        self.commands: List[str] = []
+
+    @property
+    def exceeded(self) -> bool:
+        """Check if more commands were executed than allowed."""
+        return len(self.commands) > self.max_commands
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_commands={self.max_commands}, commands={len(self.commands)})"
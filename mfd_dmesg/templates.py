@@ -0,0 +1,84 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Collapsing of repetitive kernel messages into templates with variable tokens normalized."""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from mfd_dmesg.records import DmesgRecord
+
+# order matters, the first alternative matching at given position wins
+VARIABLE_PATTERNS = {
+    "MAC": r"\b[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){5}\b",
+    "PCI": r"\b(?:[0-9a-fA-F]{4}:)?[0-9a-fA-F]{2}:[0-9a-fA-F]{2}\.[0-7]\b",
+    "IP": r"\b\d{1,3}(?:\.\d{1,3}){3}\b",
+    "HEX": r"\b0x[0-9a-fA-F]+\b|\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b",
+    # standalone numbers only, numbers glued to names (eth0, ice1) tell devices apart
+    "NUM": r"(?<![\w.:-])[-+]?\d+(?:\.\d+)?(?![\w.:])",
+}
+_VARIABLE_RE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in VARIABLE_PATTERNS.items()))
+
+
+def _placeholder(match: re.Match) -> str:
+    return f"<{match.lastgroup}>"
+
+
+@lru_cache(maxsize=65536)
+def _normalize_word(word: str) -> str:
+    return _VARIABLE_RE.sub(_placeholder, word)
+
+
+def normalize(message: str) -> str:
+    """
+    Replace variable tokens of message with placeholders.
+
+    MAC addresses, PCI addresses, IPv4 addresses, hexadecimal values and standalone numbers are replaced with
+    <MAC>, <PCI>, <IP>, <HEX> and <NUM>.
+    No pattern spans a space, so message is normalized word by word and words repeated in floods are cached.
+
+    :param message: message without timestamp
+    :return: template of the message
+    """
+    return " ".join([_normalize_word(word) for word in message.split(" ")])
+
+
+@dataclass
+class MessageTemplate:
+    """Group of messages which differ only in variable tokens."""
+
+    template: str
+    count: int
+    first_timestamp: Optional[float]
+    last_timestamp: Optional[float]
+    example: str
+
+    def __str__(self) -> str:
+        if self.count == 1:
+            return self.example
+        first = "-" if self.first_timestamp is None else f"{self.first_timestamp:.6f}"
+        last = "-" if self.last_timestamp is None else f"{self.last_timestamp:.6f}"
+        return f"[{self.count}x {first}..{last}] {self.template} (e.g. {self.example})"
+
+
+def mine_templates(records: Iterable[DmesgRecord]) -> List[MessageTemplate]:
+    """
+    Group records by template of their message in one pass.
+
+    :param records: dmesg records
+    :return: templates ordered by their first occurrence, example is the first record of the template
+    """
+    templates: Dict[str, MessageTemplate] = {}
+    for record in records:
+        template = normalize(record.message)
+        found = templates.get(template)
+        if found is None:
+            templates[template] = MessageTemplate(template, 1, record.timestamp, record.timestamp, record.text)
+            continue
+        found.count += 1
+        if record.timestamp is not None:
+            if found.first_timestamp is None:
+                found.first_timestamp = record.timestamp
+            found.last_timestamp = record.timestamp
+    return list(templates.values())
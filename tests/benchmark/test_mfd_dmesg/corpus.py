@@ -0,0 +1,117 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Generator of synthetic dmesg buffers of ice, i40e and ixgbe hosts."""
+
+import json
+import random
+from typing import List, NamedTuple
+
+DRIVERS = {
+    "ice": "0000:4e:00.{}",
+    "i40e": "0000:18:00.{}",
+    "ixgbe": "0000:af:00.{}",
+}
+INFO_MESSAGES = [
+    "{driver} {pci}: NIC Link is Up {speed} Gbps Full Duplex, Flow Control: None",
+    "{driver} {pci}: NIC Link is Down",
+    "{driver} {pci} eth{port}: renamed from eth{other}",
+    "{driver} {pci}: firmware version {major}.{minor}.{build}",
+    "{driver} {pci}: PTP init successful",
+    "{driver} {pci}: {queues} queues allocated, {vectors} MSI-X vectors",
+    "IPv6: ADDRCONF(NETDEV_CHANGE): eth{port}: link becomes ready",
+    "{driver}{port}: using {tx} tx descriptors and {rx} rx descriptors",
+]
+WARNING_MESSAGES = [
+    "{driver} {pci}: PCI-Express bandwidth available for this device may be insufficient",
+    "{driver} {pci}: Firmware recovery mode detected. Limiting functionality",
+]
+ERROR_MESSAGES = [
+    "{driver} {pci}: tx timeout on queue {queues}",
+    "{driver} {pci}: Detected Tx Unit Hang",
+    "{driver} {pci}: TX driver issue detected, PF reset issued",
+    "{driver} {pci}: Failed to set PTP clock index parameter",
+    "{driver} {pci}: probe failed for device",
+    "{driver} {pci}: Adminq error: queue {queues} failed",
+]
+OS_PACKAGE_MESSAGE = (
+    "ice {pci}: The DDP package was successfully loaded: ICE OS Default Package version 1.3.30.0"
+)
+
+
+class SyntheticRecord(NamedTuple):
+    """Single generated kernel record."""
+
+    level: int
+    timestamp: float
+    message: str
+
+
+def generate_records(lines: int, error_density: float = 0.01, seed: int = 0) -> List[SyntheticRecord]:
+    """
+    Generate kernel records.
+
+    :param lines: number of records
+    :param error_density: fraction of records logged at err level
+    :param seed: seed of the generator, same seed gives the same records
+    :return: records ordered by timestamp
+    """
+    rng = random.Random(seed)
+    drivers = list(DRIVERS)
+    records = []
+    timestamp = 0.0
+    for index in range(lines):
+        timestamp += rng.expovariate(100)
+        driver = rng.choice(drivers)
+        port = rng.randrange(4)
+        values = {
+            "driver": driver,
+            "pci": DRIVERS[driver].format(port),
+            "port": port,
+            "other": port + 4,
+            "speed": rng.choice([10, 25, 100]),
+            "major": rng.randrange(1, 5),
+            "minor": rng.randrange(100),
+            "build": rng.randrange(10000),
+            "queues": rng.randrange(256),
+            "vectors": rng.randrange(512),
+            "tx": rng.choice([512, 1024, 2048]),
+            "rx": rng.choice([512, 1024, 2048]),
+        }
+        if index == lines // 10:
+            level, template = 6, OS_PACKAGE_MESSAGE
+        elif rng.random() < error_density:
+            level, template = 3, rng.choice(ERROR_MESSAGES)
+        elif rng.random() < 0.05:
+            level, template = 4, rng.choice(WARNING_MESSAGES)
+        else:
+            level, template = 6, rng.choice(INFO_MESSAGES)
+        records.append(SyntheticRecord(level, timestamp, template.format(**values)))
+    return records
+
+
+def to_raw(records: List[SyntheticRecord]) -> str:
+    """Format records as printed by dmesg -r."""
+    return "".join(f"<{record.level}>[{record.timestamp:12.6f}] {record.message}\n" for record in records)
+
+
+def to_plain(records: List[SyntheticRecord]) -> str:
+    """Format records as printed by dmesg."""
+    return "".join(f"[{record.timestamp:12.6f}] {record.message}\n" for record in records)
+
+
+def to_json(records: List[SyntheticRecord]) -> str:
+    """Format records as printed by dmesg --json."""
+    objects = ",".join(
+        f'\n      {{\n         "pri": {record.level},\n         "time": {record.timestamp:12.6f},\n'
+        f'         "msg": {json.dumps(record.message)}\n      }}'
+        for record in records
+    )
+    return f'{{\n   "dmesg": [{objects}\n   ]\n}}\n'
+
+
+def to_kmsg(records: List[SyntheticRecord], first_sequence: int = 0) -> str:
+    """Format records as read from /dev/kmsg."""
+    return "".join(
+        f"{record.level},{sequence},{round(record.timestamp * 1_000_000)},-;{record.message}\n"
+        for sequence, record in enumerate(records, start=first_sequence)
+    )
@@ -0,0 +1,225 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Connection executing commands locally against synthetic kernel buffer, with simulated link."""
+
+import os
+import resource
+import shutil
+import stat
+import subprocess
+import tempfile
+import time
+from pathlib import Path, PurePosixPath
+from typing import Iterable, List, Optional, Type
+
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSBitness, OSName, OSType
+from mfd_typing.cpu_values import CPUArchitecture
+
+from mfd_dmesg.constants import KMSG_PATH
+
+from .corpus import SyntheticRecord, to_kmsg, to_raw
+
+# dmesg replacement reading raw records (with <level> prefix) from $FAKE_DMESG_BUFFER
+FAKE_DMESG = r"""#!/bin/sh
+raw=0
+clear=0
+json=0
+levels=""
+for arg in "$@"; do
+    case "$arg" in
+        -V) echo "dmesg from util-linux 2.39.3"; exit 0 ;;
+        -r) raw=1 ;;
+        -c) clear=1 ;;
+        --json) json=1 ;;
+        --level=*) levels="${arg#--level=}" ;;
+    esac
+done
+# synthetic messages contain no characters to be escaped in JSON
+awk -v raw="$raw" -v json="$json" -v levels="$levels" '
+BEGIN {
+    split("emerg alert crit err warn notice info debug", names, " ")
+    count = split(levels, wanted, ",")
+    for (i = 1; i <= count; i++) for (j = 1; j <= 8; j++) if (names[j] == wanted[i]) keep[j - 1] = 1
+    if (json) printf "{\n   \"dmesg\": ["
+}
+{
+    match($0, /^<[0-9]+>/)
+    level = substr($0, 2, RLENGTH - 2) % 8
+    if (levels != "" && !(level in keep)) next
+    if (!json) {
+        print (raw ? $0 : substr($0, RLENGTH + 1))
+        next
+    }
+    line = substr($0, RLENGTH + 1)
+    end = index(line, "]")
+    printf "%s\n      {\n         \"pri\": %d,\n         \"time\": %s,\n         \"msg\": \"%s\"\n      }",
+        (printed++ ? "," : ""), substr($0, 2, RLENGTH - 2), substr(line, 2, end - 2), substr(line, end + 2)
+}
+END {
+    if (json) printf "\n   ]\n}\n"
+}' "$FAKE_DMESG_BUFFER"
+if [ "$clear" = 1 ]; then : > "$FAKE_DMESG_BUFFER"; fi
+"""
+
+
+def is_supported(*tools: str) -> bool:
+    """
+    Check if tools needed by FakeConnection are available.
+
+    :param tools: additional tools needed by the benchmark, e.g. gzip and base64 for compressed transfer
+    :return: True if all tools are found in PATH
+    """
+    return all(shutil.which(tool) for tool in ("sh", "awk", "grep", "tail", "dd", *tools))
+
+
+class FakeConnection(Connection):
+    """
+    Linux connection running commands in local shell, where dmesg and /dev/kmsg serve synthetic records.
+
+    Latency and bandwidth of the link are simulated by sleeping after every command,
+    executed commands and transferred bytes are counted to track round trips and transfer size,
+    CPU time of processes spawned by commands is counted as remote CPU time.
+    """
+
+    def __init__(self, records: Iterable[SyntheticRecord], latency: float = 0.0, bandwidth: Optional[float] = None):
+        """
+        Prepare buffers.
+
+        :param records: records of the kernel buffer
+        :param latency: time in seconds added to every command
+        :param bandwidth: speed of the link in bytes per second, unlimited when None
+        """
+        super().__init__()
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.commands: List[str] = []
+        self.transferred = 0
+        self.cpu_time = 0.0
+        self._directory = Path(tempfile.mkdtemp(prefix="fake-dmesg-"))
+        self._buffer_path = self._directory / "buffer"
+        self._kmsg_path = self._directory / "kmsg"
+        dmesg_path = self._directory / "dmesg"
+        dmesg_path.write_text(FAKE_DMESG)
+        dmesg_path.chmod(dmesg_path.stat().st_mode | stat.S_IEXEC)
+        self._env = {**os.environ, "PATH": f"{self._directory}{os.pathsep}{os.environ.get('PATH', '')}"}
+        self._env["FAKE_DMESG_BUFFER"] = str(self._buffer_path)
+        self.load(records)
+
+    def load(self, records: Iterable[SyntheticRecord]) -> None:
+        """
+        Replace kernel buffer.
+
+        :param records: records of the kernel buffer
+        """
+        records = list(records)
+        self._buffer_path.write_text(to_raw(records))
+        self._kmsg_path.write_text(to_kmsg(records))
+
+    def append(self, records: Iterable[SyntheticRecord], first_sequence: int) -> None:
+        """
+        Log new records.
+
+        :param records: new records
+        :param first_sequence: kernel sequence number of the first new record
+        """
+        records = list(records)
+        with self._buffer_path.open("a") as buffer:
+            buffer.write(to_raw(records))
+        with self._kmsg_path.open("a") as kmsg:
+            kmsg.write(to_kmsg(records, first_sequence=first_sequence))
+
+    def reset_counters(self) -> None:
+        """Forget executed commands, transferred bytes and remote CPU time."""
+        self.commands.clear()
+        self.transferred = 0
+        self.cpu_time = 0.0
+
+    def close(self) -> None:
+        """Remove files of the buffer."""
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def execute_command(
+        self,
+        command: str,
+        *,
+        input_data: Optional[str] = None,
+        cwd: Optional[str] = None,
+        timeout: Optional[int] = None,
+        env: Optional[dict] = None,
+        stderr_to_stdout: bool = False,
+        discard_stdout: bool = False,
+        discard_stderr: bool = False,
+        skip_logging: bool = False,
+        expected_return_codes: Optional[Iterable] = frozenset({0}),
+        shell: bool = False,
+        custom_exception: Optional[Type[ConnectionCalledProcessError]] = None,
+    ) -> ConnectionCompletedProcess:
+        """Execute command in local shell, see Connection.execute_command."""
+        self.commands.append(command)
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        process = subprocess.run(
+            ["sh", "-c", command.replace(KMSG_PATH, str(self._kmsg_path))],
+            input=input_data.encode() if input_data is not None else None,
+            cwd=cwd,
+            timeout=timeout,
+            env={**self._env, **(env or {})},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT if stderr_to_stdout else subprocess.PIPE,
+        )
+        finished = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self.cpu_time += finished.ru_utime + finished.ru_stime - usage.ru_utime - usage.ru_stime
+        stdout = b"" if discard_stdout else process.stdout
+        stderr = b"" if discard_stderr or process.stderr is None else process.stderr
+        size = len(stdout) + len(stderr)
+        self.transferred += size
+        time.sleep(self.latency + (size / self.bandwidth if self.bandwidth else 0))
+        if expected_return_codes is not None and process.returncode not in expected_return_codes:
+            raise (custom_exception or ConnectionCalledProcessError)(
+                returncode=process.returncode, cmd=command, output=stdout.decode(), stderr=stderr.decode()
+            )
+        return ConnectionCompletedProcess(
+            args=command,
+            stdout=stdout.decode(errors="backslashreplace"),
+            stderr=stderr.decode(errors="backslashreplace"),
+            stdout_bytes=stdout,
+            stderr_bytes=stderr,
+            return_code=process.returncode,
+        )
+
+    def get_os_name(self) -> OSName:
+        """Get name of client OS."""
+        return OSName.LINUX
+
+    def get_os_type(self) -> OSType:
+        """Get type of client OS."""
+        return OSType.POSIX
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get bitness of client OS."""
+        return OSBitness.OS_64BIT
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """Get CPU architecture of client."""
+        return CPUArchitecture.X86_64
+
+    @property
+    def path(self) -> Type[PurePosixPath]:
+        """Pure path class, files of the synthetic host are not exposed."""
+        return PurePosixPath
+
+    def restart_platform(self) -> None:
+        """Reboot synthetic host, kernel buffer is emptied."""
+        self.load([])
+
+    def shutdown_platform(self) -> None:
+        """Shutdown synthetic host, kernel buffer is emptied."""
+        self.load([])
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        """Synthetic host is always available."""
+
+    def disconnect(self) -> None:
+        """Nothing to disconnect."""
@@ -0,0 +1,50 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmarks of `mfd_dmesg.buffer` scans over huge dmesg output."""
+
+import tracemalloc
+
+import pytest
+
+from mfd_dmesg.analysis import find_errors
+from mfd_dmesg.buffer import DmesgBuffer
+from mfd_dmesg.records import parse_records
+
+pytest.importorskip("pytest_benchmark")
+
+LINE = b"[ 1234.567890] ice 0000:4e:00.0: NIC Link is Up 100 Gbps Full Duplex, Flow Control: None\n"
+OUTPUT = LINE * 200_000 + b"[ 1234.567891] ice 0000:4e:00.0: tx timeout\n"
+ERRORS = ["tx timeout", "Tx Unit Hang", "Call Trace"]
+
+
+def measure_peak(function) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def check_errors_text(output: bytes) -> tuple:
+    return find_errors(parse_records(output.decode().strip()), ERRORS)
+
+
+def check_errors_buffer(output: bytes) -> tuple:
+    buffer = DmesgBuffer(output)
+    return find_errors(buffer.get_records(buffer.find_any(ERRORS)), ERRORS)
+
+
+def test_same_result():
+    assert check_errors_text(OUTPUT) == check_errors_buffer(OUTPUT)
+
+
+def test_peak_memory_close_to_output_size():
+    # output itself is allocated by connection, only memory allocated by the scan is measured
+    assert measure_peak(lambda: check_errors_buffer(OUTPUT)) < 0.25 * len(OUTPUT)
+    assert measure_peak(lambda: check_errors_text(OUTPUT)) > 2 * len(OUTPUT)
+
+
+@pytest.mark.parametrize("scan", [check_errors_text, check_errors_buffer], ids=["text", "buffer"])
+def test_check_errors_huge_output(benchmark, scan):
+    benchmark(scan, OUTPUT)
@@ -0,0 +1,205 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmarks of `mfd_dmesg.base` checks on synthetic buffers served by FakeConnection.
+
+Environment variables:
+    MFD_DMESG_BENCHMARK_SIZES - comma separated numbers of lines of generated buffers, default 1000,10000,100000
+    MFD_DMESG_BENCHMARK_ERROR_DENSITY - fraction of err level records, default 0.01
+    MFD_DMESG_BENCHMARK_LATENCY - simulated latency of every command in seconds, default 0
+    MFD_DMESG_BENCHMARK_BANDWIDTH - simulated bandwidth in bytes per second, default 0 (unlimited),
+                                    compressed transfer is compared on 10 MB/s link when unlimited
+    MFD_DMESG_UPDATE_BASELINE - when set, round_trips.json is rewritten with measured values
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from mfd_dmesg import FAILS, Dmesg, RecordingConnection, ReplayConnection
+from mfd_dmesg.remote import last_lines_awk
+
+from .corpus import generate_records
+from .fake_connection import FakeConnection, is_supported
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.skipif(not is_supported(), reason="sh, awk, grep, tail and dd are required")
+
+SIZES = [int(size) for size in os.environ.get("MFD_DMESG_BENCHMARK_SIZES", "1000,10000,100000").split(",")]
+ERROR_DENSITY = float(os.environ.get("MFD_DMESG_BENCHMARK_ERROR_DENSITY", "0.01"))
+LATENCY = float(os.environ.get("MFD_DMESG_BENCHMARK_LATENCY", "0"))
+BANDWIDTH = float(os.environ.get("MFD_DMESG_BENCHMARK_BANDWIDTH", "0")) or None
+
+BASELINE_PATH = Path(__file__).with_name("round_trips.json")
+BASELINE_SIZE = 10000
+
+
+def compressed_get_messages(dmesg):
+    dmesg.compress_transfer = True
+    return dmesg.get_messages()
+
+
+def digest_checks(dmesg):
+    digest = dmesg.get_digest(FAILS)
+    return dmesg.verify_messages(digest=digest), dmesg.check_errors(FAILS, digest=digest)
+
+
+OPERATIONS = {
+    "verify_messages": lambda dmesg: dmesg.verify_messages(),
+    "check_errors": lambda dmesg: dmesg.check_errors(FAILS),
+    "clear_messages": lambda dmesg: dmesg.clear_messages(errors_filter=FAILS),
+    "verify_log": lambda dmesg: dmesg.verify_log("ice"),
+    "get_os_package_info": lambda dmesg: dmesg.get_os_package_info(),
+    "check_new_errors": lambda dmesg: dmesg.check_new_errors(),
+    "digest_checks": digest_checks,
+    "get_records": lambda dmesg: dmesg.get_records(),
+    "structured_get_records": lambda dmesg: dmesg.get_records(structured=True),
+    "get_buffer_size_data": lambda dmesg: dmesg.get_buffer_size_data("ice", "0"),
+    "compressed_get_messages": compressed_get_messages,
+}
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}_lines")
+def records(request):
+    return generate_records(request.param, error_density=ERROR_DENSITY)
+
+
+@pytest.fixture()
+def connection(records):
+    connection = FakeConnection(records, latency=LATENCY, bandwidth=BANDWIDTH)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture()
+def dmesg(connection):
+    dmesg = Dmesg(connection=connection)
+    connection.reset_counters()
+    return dmesg
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        "verify_messages",
+        "check_errors",
+        "verify_log",
+        "get_os_package_info",
+        "digest_checks",
+        "get_records",
+        "structured_get_records",
+        "get_buffer_size_data",
+    ],
+)
+def test_operation(benchmark, dmesg, operation):
+    benchmark(OPERATIONS[operation], dmesg)
+
+
+def test_clear_messages(benchmark, dmesg, connection, records):
+    benchmark.pedantic(
+        OPERATIONS["clear_messages"], args=(dmesg,), setup=lambda: connection.load(records), rounds=10, iterations=1
+    )
+
+
+def test_check_new_errors_first_call(benchmark, connection):
+    benchmark.pedantic(
+        OPERATIONS["check_new_errors"], setup=lambda: ((Dmesg(connection=connection),), {}), rounds=10, iterations=1
+    )
+
+
+def test_check_new_errors_no_new_records(benchmark, dmesg):
+    dmesg.check_new_errors()
+    benchmark(OPERATIONS["check_new_errors"], dmesg)
+
+
+@pytest.mark.parametrize("operation", ["verify_messages", "check_errors", "verify_log", "get_os_package_info"])
+def test_replayed_operation(benchmark, connection, operation, tmp_path):
+    """Parsing and checks alone, outputs are replayed from recording without executing commands."""
+    path = tmp_path / "recording.jsonl.gz"
+    with RecordingConnection(connection, path) as recorder:
+        OPERATIONS[operation](Dmesg(connection=recorder))
+    replay = ReplayConnection(path, time_scale=0, cycle=True)
+    benchmark(OPERATIONS[operation], Dmesg(connection=replay))
+
+
+FILTER_PIPELINES = {
+    "grep_tail": "dmesg | grep ice | grep -i 'link\\|reset' | tail -n 1000",
+    "awk": f"dmesg | {last_lines_awk(1000, service_name='ice', any_ignore_case=['link', 'reset'])}",
+}
+
+
+@pytest.mark.skipif(not is_supported("gzip", "base64"), reason="gzip and base64 are required")
+@pytest.mark.parametrize("compress", [False, True], ids=["plain", "compressed"])
+def test_compress_transfer(benchmark, records, compress):
+    """Bytes on the wire and time of get_messages with and without compress_transfer, outputs must be identical."""
+    connection = FakeConnection(records, latency=LATENCY, bandwidth=BANDWIDTH or 10_000_000)
+    try:
+        expected = Dmesg(connection=connection).get_messages()
+        dmesg = Dmesg(connection=connection, compress_transfer=compress)
+        dmesg.get_messages()
+        connection.reset_counters()
+        benchmark.group = f"compress_transfer-{len(records)}_lines"
+        assert benchmark(dmesg.get_messages) == expected
+    finally:
+        connection.close()
+    # compressed path is really exercised, not silently replaced by plain transfer
+    assert dmesg.capabilities.compression is (True if compress else None)
+    benchmark.extra_info["bytes_per_call"] = connection.transferred / len(connection.commands)
+    benchmark.extra_info["commands_per_call"] = 1.0
+
+
+@pytest.mark.parametrize("pipeline", FILTER_PIPELINES)
+def test_remote_filter_pipeline(benchmark, connection, pipeline):
+    """Latency and remote CPU time of get_messages_additional filter pipelines, outputs must be identical."""
+    expected = connection.execute_command(FILTER_PIPELINES["grep_tail"], shell=True).stdout
+    connection.reset_counters()
+    result = benchmark(connection.execute_command, FILTER_PIPELINES[pipeline], shell=True)
+    assert result.stdout == expected
+    benchmark.extra_info["remote_cpu_time_per_call"] = connection.cpu_time / len(connection.commands)
+
+
+def test_digest_checks_same_as_full_output(dmesg):
+    """Checks on digest give the same results as checks on full output."""
+    assert digest_checks(dmesg) == (dmesg.verify_messages(), dmesg.check_errors(FAILS))
+
+
+def test_check_new_errors_after_clear(dmesg):
+    """Errors removed by clear_messages are not reported as new, although they are still in /dev/kmsg."""
+    dmesg.clear_messages()
+    assert dmesg.check_new_errors() == {"successful": True, "error": ""}
+
+
+def test_check_new_errors_after_clear_elsewhere(connection):
+    """Errors cleared by dmesg -c of another process are not reported by the first call."""
+    connection.execute_command("dmesg -c > /dev/null", shell=True)
+    assert Dmesg(connection=connection).check_new_errors() == {"successful": True, "error": ""}
+
+
+def test_digest_after_clear(dmesg):
+    """Digest does not contain records removed by clear_messages, same as checks on full output."""
+    dmesg.clear_messages()
+    assert digest_checks(dmesg) == (dmesg.verify_messages(), dmesg.check_errors(FAILS))
+    assert dmesg.get_digest().records == 0
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+def test_round_trips(operation):
+    """Number of executed commands and transferred bytes must not exceed stored baseline."""
+    connection = FakeConnection(generate_records(BASELINE_SIZE, error_density=0.01))
+    try:
+        dmesg = Dmesg(connection=connection)
+        connection.reset_counters()
+        OPERATIONS[operation](dmesg)
+    finally:
+        connection.close()
+    measured = {"commands": len(connection.commands), "bytes": connection.transferred}
+    baselines = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    if os.environ.get("MFD_DMESG_UPDATE_BASELINE"):
+        baselines[operation] = measured
+        BASELINE_PATH.write_text(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+        return
+    assert operation in baselines, f"No baseline for {operation}, run with MFD_DMESG_UPDATE_BASELINE=1"
+    baseline = baselines[operation]
+    assert measured["commands"] <= baseline["commands"], f"{operation} executes more commands: {connection.commands}"
+    assert measured["bytes"] <= baseline["bytes"], f"{operation} transfers more bytes than {baseline['bytes']}"
@@ -0,0 +1,66 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmarks of repeated substring lookups in `mfd_dmesg.snapshot` with and without token index."""
+
+import random
+
+import pytest
+from mfd_typing import OSName
+
+from mfd_dmesg import DmesgSnapshot
+
+pytest.importorskip("pytest_benchmark")
+
+LINES = 5000
+LOOKUPS = 200
+
+
+def generate_output(lines: int) -> str:
+    """Generate raw dmesg output with realistic mix of drivers and messages."""
+    rng = random.Random(0)
+    drivers = ["ice", "i40e", "igb", "ixgbe", "mlx5_core", "nvme", "xhci_hcd", "e1000e"]
+    messages = [
+        "NIC Link is Up 100 Gbps Full Duplex",
+        "NIC Link is Down",
+        "tx timeout on queue {}",
+        "Detected Tx Unit Hang queue {}",
+        "using {} tx descriptors and {} rx descriptors",
+        "firmware version {}.{}.{}",
+        "reset adapter, attempt {}",
+    ]
+    output = []
+    for line in range(lines):
+        driver = rng.choice(drivers)
+        message = rng.choice(messages).format(*(rng.randint(0, 4096) for _ in range(3)))
+        output.append(f"<{rng.choice([3, 4, 6])}>[{line / 100:12.6f}] {driver} 0000:{line % 256:02x}:00.0: {message}")
+    return "\n".join(output)
+
+
+OUTPUT = generate_output(LINES)
+LOOKUP_STRINGS = [f"attempt {i}" for i in range(LOOKUPS // 2)] + [f"queue {i}" for i in range(LOOKUPS // 2)]
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["linear", "indexed"])
+def test_search_repeated(benchmark, indexed):
+    snapshot = DmesgSnapshot(OUTPUT, os_name=OSName.LINUX, indexed=indexed)
+    snapshot.search("warm up")
+
+    def lookups():
+        return [snapshot.search(lookout_str) for lookout_str in LOOKUP_STRINGS]
+
+    benchmark(lookups)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["linear", "indexed"])
+def test_check_errors_repeated(benchmark, indexed):
+    snapshot = DmesgSnapshot(OUTPUT, os_name=OSName.LINUX, indexed=indexed)
+    snapshot.search("warm up")
+
+    def lookups():
+        return [snapshot.check_errors([f"reset adapter, attempt {i}"]) for i in range(LOOKUPS)]
+
+    benchmark(lookups)
+
+
+def test_index_build(benchmark):
+    benchmark(lambda: DmesgSnapshot(OUTPUT, os_name=OSName.LINUX, indexed=True).search("warm up"))
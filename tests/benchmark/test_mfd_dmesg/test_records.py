@@ -0,0 +1,28 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmarks of `mfd_dmesg.records` parsers of text and JSON dmesg output."""
+
+import pytest
+
+from mfd_dmesg.records import parse_json_records, parse_records
+
+from .corpus import generate_records, to_json, to_raw
+
+pytest.importorskip("pytest_benchmark")
+
+RECORDS = generate_records(100_000)
+OUTPUTS = {"raw": to_raw(RECORDS), "json": to_json(RECORDS)}
+PARSERS = {"raw": parse_records, "json": parse_json_records}
+
+
+def test_same_records():
+    text, structured = (PARSERS[name](OUTPUTS[name]) for name in PARSERS)
+    assert [record.text for record in text] == [record.text for record in structured]
+    assert [(record.level, record.timestamp) for record in text] == [
+        (record.level, record.timestamp) for record in structured
+    ]
+
+
+@pytest.mark.parametrize("output", PARSERS)
+def test_parse(benchmark, output):
+    benchmark(PARSERS[output], OUTPUTS[output])
@@ -0,0 +1,89 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.async_dmesg` module."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mfd_connect import SolConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_dmesg import AsyncDmesg, AsyncDmesgFollower, Dmesg, DmesgLevelOptions
+
+
+class TestAsyncDmesg:
+    @pytest.fixture()
+    def connection(self, mocker):
+        mocker.patch("mfd_dmesg.Dmesg.check_if_available", mocker.create_autospec(Dmesg.check_if_available))
+        mocker.patch("mfd_dmesg.Dmesg.get_version", mocker.create_autospec(Dmesg.get_version, return_value="2.31.1"))
+        mocker.patch(
+            "mfd_dmesg.Dmesg._get_tool_exec_factory",
+            mocker.create_autospec(Dmesg._get_tool_exec_factory, return_value="dmesg"),
+        )
+        conn = mocker.create_autospec(SolConnection)
+        conn.get_os_name.return_value = OSName.LINUX
+        conn.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="[    4.694322] ice: tx timeout error\n", stderr=""
+        )
+        return conn
+
+    def test_methods(self, connection):
+        async def scenario():
+            dmesg = await AsyncDmesg.create(connection=connection)
+            messages = await dmesg.get_messages(level=DmesgLevelOptions.ERRORS, timeout=5)
+            errors = await dmesg.check_errors(["timeout"])
+            verdict = await dmesg.verify_messages()
+            return messages, errors, verdict
+
+        messages, errors, verdict = asyncio.run(scenario())
+        assert messages == "[    4.694322] ice: tx timeout error"
+        assert errors == (False, ["[    4.694322] ice: tx timeout error"])
+        assert verdict == {"successful": False, "error": "[    4.694322] ice: tx timeout error"}
+
+    def test_many_hosts(self, connection):
+        async def scenario():
+            hosts = await asyncio.gather(*(AsyncDmesg.create(connection=connection) for _ in range(50)))
+            return await asyncio.gather(*(host.check_errors(["error"]) for host in hosts))
+
+        assert all(not successful for successful, _ in asyncio.run(scenario()))
+
+    def test_timeout_keeps_host_locked(self, connection):
+        release = threading.Event()
+        calls = []
+
+        def slow(*args, **kwargs):
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+            return ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr="")
+
+        async def scenario():
+            dmesg = await AsyncDmesg.create(connection=connection)
+            connection.execute_command.side_effect = slow
+            with pytest.raises(asyncio.TimeoutError):
+                await dmesg.get_messages(timeout=0.1)
+            second = asyncio.ensure_future(dmesg.get_messages())
+            await asyncio.sleep(0.1)
+            assert len(calls) == 1
+            release.set()
+            return await second
+
+        assert asyncio.run(scenario()) == ""
+
+    def test_follow(self, mocker):
+        follower = mocker.Mock()
+        follower.get.side_effect = [None, "line", None]
+        follower.running = True
+
+        async def scenario():
+            async_follower = AsyncDmesgFollower(follower, ThreadPoolExecutor(max_workers=1))
+            first = await async_follower.get()
+            follower.running = False
+            second = await async_follower.get()
+            await async_follower.stop()
+            return first, second
+
+        assert asyncio.run(scenario()) == ("line", None)
+        follower.stop.assert_called_once()
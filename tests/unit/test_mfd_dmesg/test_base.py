@@ -2,6 +2,11 @@
 # SPDX-License-Identifier: MIT
 """Tests for `mfd_dmesg` package."""
 
+import base64
+import datetime
+import gzip
+import re
+import shlex
 from textwrap import dedent
 
 import pytest
@@ -12,9 +17,19 @@ from mfd_connect.exceptions import ConnectionCalledProcessError
 
 from mfd_dmesg import Dmesg, OSPackageInfo
 from mfd_dmesg.constants import DmesgLevelOptions, FAILS
-from mfd_dmesg.exceptions import DmesgNotAvailable, DmesgExecutionError, BadWordInLog
+from mfd_dmesg.digest import DmesgDigest, digest_awk
+from mfd_dmesg.remote import COMPACT_JSON, KMSG_READ, LAST_LINES_AWK, kmsg_awk
+from mfd_dmesg.exceptions import (
+    BadWordInLog,
+    DmesgException,
+    DmesgExecutionError,
+    DmesgNotAvailable,
+    RoundTripBudgetExceeded,
+)
 from mfd_typing import OSName
 
+CLEAR_COMMAND = f"test -r /dev/kmsg && {KMSG_READ} | {kmsg_awk(print_records=False)}; dmesg -c"
+
 
 class TestDmesg:
     @pytest.fixture()
@@ -55,6 +70,36 @@ class TestDmesg:
 
         assert dmesg.get_version() == "NA"
 
+    def test_get_version_cached(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="dmesg from util-linux 2.39.3", stderr=""
+        )
+        assert dmesg.get_version() == dmesg.get_version() == "2.39.3"
+        dmesg._connection.execute_command.assert_called_once()
+
+    def test_probe_capabilities(self, dmesg):
+        output = dedent(
+            """\
+            dmesg from util-linux 2.38.1
+            __MFD_DMESG_PROBE_level=0
+            __MFD_DMESG_PROBE_raw=0
+            __MFD_DMESG_PROBE_json=0
+            __MFD_DMESG_PROBE_time_window=1
+            __MFD_DMESG_PROBE_follow=0
+            __MFD_DMESG_PROBE_kmsg_readable=1
+            __MFD_DMESG_PROBE_compression=0"""
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        capabilities = dmesg.probe_capabilities()
+        assert capabilities is dmesg.capabilities
+        assert (capabilities.version, capabilities.time_window, capabilities.kmsg_readable) == ("2.38.1", False, False)
+        assert capabilities.level and capabilities.json and capabilities.compression
+        assert capabilities.acc_imc is False
+        assert dmesg.get_version() == "2.38.1"
+        dmesg._connection.execute_command.assert_called_once()
+
     def test_get_os_package_info(self, dmesg):
         output = dedent(
             """
@@ -193,6 +238,189 @@ class TestDmesg:
         output = dmesg.get_messages(level=DmesgLevelOptions.NONE)
         assert expected == dmesg.get_messages(level=DmesgLevelOptions.NONE)
 
+    def test_get_messages_cache(self, dmesg, mocker):
+        dmesg.cache_ttl = 10
+        monotonic = mocker.patch("mfd_dmesg.base.time.monotonic", return_value=100.0)
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="line\n", stderr="stderr"
+        )
+        assert dmesg.get_messages() == "line"
+        assert dmesg.get_messages() == "line"
+        assert dmesg._connection.execute_command.call_count == 1
+        dmesg.get_messages(level=DmesgLevelOptions.ERRORS)
+        assert dmesg._connection.execute_command.call_count == 2
+        monotonic.return_value = 110.0
+        dmesg.get_messages()
+        assert dmesg._connection.execute_command.call_count == 3
+
+    def test_get_messages_cache_disabled(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="line", stderr="stderr"
+        )
+        dmesg.get_messages()
+        dmesg.get_messages()
+        assert dmesg._connection.execute_command.call_count == 2
+
+    def test_get_messages_cache_invalidated_by_clear(self, dmesg):
+        dmesg.cache_ttl = 10
+        dmesg.capabilities.kmsg_readable = False
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="line", stderr="stderr"
+        )
+        dmesg.get_messages()
+        dmesg.clear_messages()
+        dmesg.get_messages()
+        assert dmesg._connection.execute_command.call_count == 3
+        dmesg.invalidate_cache()
+        dmesg.get_messages()
+        assert dmesg._connection.execute_command.call_count == 4
+
+    @staticmethod
+    def _compressed(output):
+        return base64.b64encode(gzip.compress(output.encode())).decode()
+
+    def test_get_messages_compressed(self, dmesg):
+        dmesg.compress_transfer = True
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr=""),
+            ConnectionCompletedProcess(
+                return_code=0, args="command", stdout=self._compressed("line\n__MFD_DMESG_RC=0\n"), stderr=""
+            ),
+        ]
+        assert dmesg.get_messages() == "line"
+        dmesg._connection.execute_command.assert_called_with(
+            '{ dmesg; echo "__MFD_DMESG_RC=$?"; } | gzip -c | base64', shell=True
+        )
+
+    def test_clear_messages_compressed_return_code(self, dmesg):
+        dmesg.compress_transfer = True
+        dmesg.capabilities.compression = True
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=self._compressed("__MFD_DMESG_RC=1\n"), stderr=""
+        )
+        with pytest.raises(DmesgException, match="Failed to clear"):
+            dmesg.clear_messages()
+
+    def test_get_messages_compression_not_available(self, dmesg):
+        dmesg.compress_transfer = True
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=1, args="command", stdout="", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="line", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="line", stderr=""),
+        ]
+        assert dmesg.get_messages() == "line"
+        assert dmesg.get_messages() == "line"
+        dmesg._connection.execute_command.assert_called_with("dmesg", shell=True)
+        assert dmesg._connection.execute_command.call_count == 3
+
+    def test_get_messages_by_level(self, dmesg):
+        output = dedent(
+            """\
+            <6>[    0.000000] Linux version 5.15.0
+            <3>[    4.694322] ice 0000:4e:00.0: tx timeout
+            <4>[    5.000000] ice 0000:4e:00.0: link is slow
+            continued line
+            <2>[    6.000000] kernel panic soon
+            """
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        buckets = dmesg.get_messages_by_level()
+        dmesg._connection.execute_command.assert_called_once_with(
+            "dmesg -r", shell=True, expected_return_codes={0, 1}
+        )
+        assert buckets[DmesgLevelOptions.ERRORS] == "[    4.694322] ice 0000:4e:00.0: tx timeout"
+        assert buckets[DmesgLevelOptions.WARNINGS] == "[    5.000000] ice 0000:4e:00.0: link is slow\ncontinued line"
+        assert buckets[DmesgLevelOptions.CRITICAL] == "[    6.000000] kernel panic soon"
+        assert buckets[DmesgLevelOptions.ALERT] == buckets[DmesgLevelOptions.EMERGENCY] == ""
+        assert buckets[DmesgLevelOptions.NONE].splitlines()[0] == "[    0.000000] Linux version 5.15.0"
+
+    def test_get_messages_by_level_fills_cache(self, dmesg):
+        dmesg.cache_ttl = 10
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="<3>[    4.694322] ice: tx timeout\n", stderr=""
+        )
+        dmesg.get_messages_by_level()
+        assert dmesg.get_messages(level=DmesgLevelOptions.ERRORS) == "[    4.694322] ice: tx timeout"
+        assert dmesg._connection.execute_command.call_count == 1
+
+    def test_get_messages_by_level_without_raw_mode(self, dmesg):
+        output = dedent(
+            """\
+            [    4.694322] ice: Step 1 error
+            [    4.694323] ice: init failed
+            [    4.694324] ice: Warning: slow link
+            [    4.694325] ice: crit condition
+            """
+        )
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCalledProcessError(returncode=2, cmd="dmesg -r"),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=output, stderr=""),
+        ]
+        buckets = dmesg.get_messages_by_level()
+        assert buckets[DmesgLevelOptions.ERRORS] == "[    4.694323] ice: init failed"
+        assert buckets[DmesgLevelOptions.WARNINGS] == "[    4.694324] ice: Warning: slow link"
+        assert buckets[DmesgLevelOptions.CRITICAL] == "[    4.694325] ice: crit condition"
+        assert buckets[DmesgLevelOptions.NONE] == output.strip()
+
+    def test_get_buffer(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stdout_bytes=b"[    1.000000] ice: tx timeout\n", stderr=""
+        )
+        buffer = dmesg.get_buffer(level=DmesgLevelOptions.ERRORS)
+        dmesg._connection.execute_command.assert_called_once_with("dmesg --level=err ", shell=True)
+        assert list(buffer) == ["[    1.000000] ice: tx timeout"]
+        assert dmesg.check_errors(["timeout"]) == (False, ["[    1.000000] ice: tx timeout"])
+
+    def test_get_records(self, dmesg):
+        output = dedent(
+            """
+            [15222488.275756] ice 0000:4e:00.0 ens786: NIC Link is Down
+            [15222506.769174] ice 0000:4e:00.0 ens786: A parallel fault was detected."""
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        records = dmesg.get_records(level=DmesgLevelOptions.NONE)
+        assert [record.message for record in records] == [
+            "ice 0000:4e:00.0 ens786: NIC Link is Down",
+            "ice 0000:4e:00.0 ens786: A parallel fault was detected.",
+        ]
+        assert [record.timestamp for record in records] == [15222488.275756, 15222506.769174]
+
+    def test_get_buffer_size_data_with_timestamps(self, dmesg):
+        output = "[    5.123456] ix1: using 256 tx descriptors and 512 rx descriptors"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        result = dmesg.get_buffer_size_data("ix", "1")
+        assert result[0].groupdict() == dict(tx="256", rx="512")
+
+    def test_follow(self, dmesg, mocker):
+        follower = mocker.patch("mfd_dmesg.base.DmesgFollower")
+        assert dmesg.follow(level=DmesgLevelOptions.ERRORS) is follower.return_value.start.return_value
+        follower.assert_called_once_with(
+            connection=dmesg._connection, command="dmesg --follow --level=err", queue_size=1000
+        )
+
+    def test_follow_not_supported_by_dmesg(self, dmesg):
+        dmesg.capabilities.follow = False
+        with pytest.raises(DmesgException, match="Follow mode is not supported"):
+            dmesg.follow()
+
+    def test_snapshot_raw_mode_not_available(self, dmesg):
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCalledProcessError(returncode=1, cmd=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="[    1.000000] a", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="[    1.000000] a", stderr=""),
+        ]
+        dmesg.snapshot()
+        dmesg.snapshot()
+        assert dmesg.capabilities.raw is False
+        commands = [call.args[0] for call in dmesg._connection.execute_command.call_args_list]
+        assert commands == ["dmesg -r", "dmesg", "dmesg"]
+
     def test_get_messages_imc_acc_command_level_none(self, dmesg):
         dmesg._connection.execute_command.side_effect = [
             ConnectionCalledProcessError(returncode=0, cmd=""),
@@ -223,6 +451,27 @@ class TestDmesg:
             'dmesg | grep -v "Step" | grep -iE "error|fail" | grep \'ix1\'', shell=True, expected_return_codes={0, 1}
         )
 
+    def test_get_messages_imc_acc_detected_once(self, dmesg):
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCalledProcessError(returncode=1, cmd=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr=""),
+        ]
+        dmesg.get_messages(level=DmesgLevelOptions.ERRORS)
+        dmesg.get_messages(level=DmesgLevelOptions.WARNINGS)
+        assert dmesg.capabilities.acc_imc is True
+        assert dmesg._connection.execute_command.call_count == 3
+        dmesg._connection.execute_command.assert_called_with(
+            'dmesg | grep -v "Step" | grep -iE "warning" ', shell=True, expected_return_codes={0, 1}
+        )
+
+    def test_get_messages_level_supported(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stderr=""
+        )
+        dmesg.get_messages(level=DmesgLevelOptions.ERRORS)
+        assert dmesg.capabilities.acc_imc is False
+
     def test_get_messages_without_level(self, dmesg):
         output = dedent(
             """
@@ -267,6 +516,21 @@ class TestDmesg:
         )
         assert expected == dmesg.get_messages_additional()
 
+    @pytest.mark.parametrize(
+        "service_name, additional_greps, command",
+        [
+            ("ice", ["link.*up"], "dmesg | grep 'ice' | grep -i 'link.*up' | tail -n 1000"),
+            ("^ice", None, "dmesg | grep '^ice' | tail -n 1000"),
+            (None, ["[lL]ink", "reset"], "dmesg | grep -i '[lL]ink\\|reset' | tail -n 1000"),
+        ],
+    )
+    def test_get_messages_additional_regex_greps(self, dmesg, service_name, additional_greps, command):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stderr=""
+        )
+        dmesg.get_messages_additional(service_name=service_name, additional_greps=additional_greps)
+        assert dmesg._connection.execute_command.call_args.args[0] == command
+
     def test_verify_messages(self, dmesg):
         output = dedent(
             """
@@ -290,6 +554,66 @@ class TestDmesg:
         )
         assert expected == dmesg.verify_messages()
 
+    def test_verify_messages_whitelist(self, dmesg):
+        output = dedent(
+            """
+            [    4.660616] i8042: No controller found
+            [    4.694322] [drm] invalid EDID checksum
+            [    4.728454] ice 0000:4e:00.0: custom benign error
+            [   33.580364] ice 0000:4e:00.0: real error"""
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        assert dmesg.verify_messages(extra_whitelist=["custom benign"]) == {
+            "successful": False,
+            "error": "[   33.580364] ice 0000:4e:00.0: real error",
+        }
+
+    def test_verify_messages_whitelist_literal_and_regex(self, dmesg):
+        output = dedent(
+            """
+            [    4.728454] ice 0000:4e:00.0: Tx hang (queue 3)
+            [    4.728455] ice 0000:4e:00.0: ring [5] stalled?
+            [   33.580364] ice 0000:4e:00.0: real error"""
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        assert dmesg.verify_messages(extra_whitelist=["Tx hang (queue 3)", re.compile(r"ring \[\d+\]")]) == {
+            "successful": False,
+            "error": "[   33.580364] ice 0000:4e:00.0: real error",
+        }
+
+    def test_verify_messages_aggregate(self, dmesg):
+        output = dedent(
+            """
+            [   10.000001] ice 0000:4e:00.0: tx timeout on queue 3
+            [   10.500000] ice 0000:4e:00.1: tx timeout on queue 17
+            [   11.000000] ice 0000:4e:00.0: real error
+            [   12.250000] ice 0000:4e:00.0: tx timeout on queue 5"""
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        result = dmesg.verify_messages(aggregate=True)
+        assert result["successful"] is False
+        assert [(template.template, template.count) for template in result["templates"]] == [
+            ("ice <PCI>: tx timeout on queue <NUM>", 3),
+            ("ice <PCI>: real error", 1),
+        ]
+        assert result["error"] == (
+            "[3x 10.000001..12.250000] ice <PCI>: tx timeout on queue <NUM> "
+            "(e.g. [   10.000001] ice 0000:4e:00.0: tx timeout on queue 3)\n"
+            "[   11.000000] ice 0000:4e:00.0: real error"
+        )
+
+    def test_verify_messages_aggregate_no_errors(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stderr=""
+        )
+        assert dmesg.verify_messages(aggregate=True) == {"successful": True, "error": "", "templates": []}
+
     def test_clear_messages_fail(self, dmesg):
         output = dedent(
             """
@@ -309,7 +633,7 @@ class TestDmesg:
         )
         assert expected == dmesg.clear_messages()
         dmesg._connection.execute_command.assert_called_with(
-            "dmesg -c", shell=True, custom_exception=DmesgExecutionError
+            CLEAR_COMMAND, shell=True, custom_exception=DmesgExecutionError
         )
 
     def test_clear_messages(self, dmesg):
@@ -333,7 +657,7 @@ class TestDmesg:
             errors_filter=["ICE_ERR_HW_TABLE", "ICE_ERR_AQ_FW_CRITICAL"], ignore_filter=["ICE_ERR_HW_TABLE"]
         )
         dmesg._connection.execute_command.assert_called_with(
-            "dmesg -c", shell=True, custom_exception=DmesgExecutionError
+            CLEAR_COMMAND, shell=True, custom_exception=DmesgExecutionError
         )
 
     def test_clear_messages_after_error(self, dmesg, mocker):
@@ -358,7 +682,7 @@ class TestDmesg:
         )
         assert expected == dmesg.clear_messages_after_error(error_msg="Cannot set channels with ADQ configured")
         dmesg._connection.execute_command.assert_called_with(
-            "dmesg -c", shell=True, custom_exception=DmesgExecutionError
+            CLEAR_COMMAND, shell=True, custom_exception=DmesgExecutionError
         )
 
     def test_clear_messages_after_error_message_not_found(self, dmesg):
@@ -400,6 +724,55 @@ class TestDmesg:
         )
         assert expected == dmesg.check_errors(FAILS)
 
+    def test_check_errors_multiple_patterns(self, dmesg):
+        output = dedent(
+            """
+            [    4.660616] ice: tx timeout error
+            [    4.694322] ice: link up"""
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        assert dmesg.check_errors(["error", "timeout"]) == (
+            False,
+            ["[    4.660616] ice: tx timeout error", "[    4.660616] ice: tx timeout error"],
+        )
+
+    def test_check_errors_empty_pattern(self, dmesg):
+        output = "[    4.660616] ice: tx timeout\n[    4.694322] ice: link up"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        assert dmesg.check_errors([""]) == (False, output.splitlines())
+
+    def test_check_errors_remote_filter(self, dmesg):
+        output = "[    4.694322] error: Couldn't get UEFI db list\n"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr="stderr"
+        )
+        assert dmesg.check_errors(["error", "it's"], remote_filter=True) == (
+            False,
+            ["[    4.694322] error: Couldn't get UEFI db list"],
+        )
+        dmesg._connection.execute_command.assert_called_once_with(
+            "dmesg | grep -a -F -e error -e 'it'\"'\"'s'", shell=True, expected_return_codes={0, 1}
+        )
+
+    def test_check_errors_remote_filter_compressed(self, dmesg):
+        dmesg.compress_transfer = True
+        dmesg.capabilities.compression = True
+        output = "[    4.694322] error: Couldn't get UEFI db list\n__MFD_DMESG_RC=0\n"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=self._compressed(output), stderr=""
+        )
+        assert dmesg.check_errors(["error"], remote_filter=True) == (
+            False,
+            ["[    4.694322] error: Couldn't get UEFI db list"],
+        )
+        dmesg._connection.execute_command.assert_called_once_with(
+            '{ dmesg | grep -a -F -e error; echo "__MFD_DMESG_RC=$?"; } | gzip -c | base64', shell=True
+        )
+
     def test_check_no_errors(self, dmesg):
         output = dedent(
             """
@@ -429,6 +802,26 @@ class TestDmesg:
         )
         assert dmesg.check_str_present(service_name="ix1", lookout_str=lookout_str)
 
+    def test_check_str_present_remote_filter(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="command", stdout="", stderr="stderr"
+        )
+        assert not dmesg.check_str_present(service_name="ix1", lookout_str="link up", remote_filter=True)
+        dmesg._connection.execute_command.assert_called_once_with(
+            f"dmesg | awk -v last=500 -v service=ix1 -v then_text='link up' {shlex.quote(LAST_LINES_AWK)}",
+            shell=True,
+            expected_return_codes={0, 1},
+        )
+
+    def test_check_str_present_remote_filter_newline(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stderr="stderr"
+        )
+        assert not dmesg.check_str_present(service_name="ix1", lookout_str="link\nup", remote_filter=True)
+        dmesg._connection.execute_command.assert_called_once_with(
+            f"dmesg | awk -v last=500 -v service=ix1 {shlex.quote(LAST_LINES_AWK)}", shell=True
+        )
+
     def test_check_no_str_present(self, dmesg):
         output = dedent(
             """
@@ -456,6 +849,180 @@ class TestDmesg:
         )
         assert dmesg.check_new_errors()
 
+    def test_check_new_errors_kmsg_cursor(self, dmesg):
+        first = dedent(
+            """\
+            __MFD_DMESG_KMSG 12 11
+            [    4.660616] MODSIGN: Couldn't get UEFI db list
+            [    4.694322] vcpu0 disabled perfctr wrmsr: 0xc2 data 0xffff"""
+        )
+        second = dedent(
+            """\
+            3,15,33580364,-;cdc_ether 1-1.1.2:1.0 enp0s29u1u1u2: CDC: unexpected notification 20!
+            __MFD_DMESG_KMSG 16 15"""
+        )
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=first, stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=second, stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="__MFD_DMESG_KMSG 16 15\n", stderr=""),
+        ]
+        assert dmesg.check_new_errors() == {
+            "successful": False,
+            "error": "[    4.660616] MODSIGN: Couldn't get UEFI db list",
+        }
+        assert dmesg._connection.execute_command.call_args.args[0].endswith("; dmesg --level=err")
+        assert dmesg.check_new_errors() == {
+            "successful": False,
+            "error": "[   33.580364] cdc_ether 1-1.1.2:1.0 enp0s29u1u1u2: CDC: unexpected notification 20!",
+        }
+        assert dmesg.check_new_errors() == {"successful": True, "error": ""}
+        assert "h[2] + 0 > 15 && h[1] % 8 == 3" in dmesg._connection.execute_command.call_args[0][0]
+        assert dmesg._connection.execute_command.call_count == 3
+
+    def test_check_new_errors_kmsg_not_readable(self, dmesg):
+        output = "[    4.694322] MODSIGN: Couldn't get UEFI db list"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        assert dmesg.check_new_errors() == {"successful": False, "error": output}
+        assert dmesg.check_new_errors() == {"successful": True, "error": ""}
+        assert dmesg.capabilities.kmsg_readable is False
+        assert dmesg._connection.execute_command.call_args.args[0] == "dmesg --level=err "
+
+    def test_check_new_errors_kmsg_read_failed(self, dmesg):
+        first = "[    4.694322] MODSIGN: Couldn't get UEFI db list"
+        second = f"{first}\n[    5.000000] ice: reset failed"
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(
+                return_code=0, args="command", stdout=f"__MFD_DMESG_KMSG 0 -1\n{first}", stderr=""
+            ),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=second, stderr=""),
+        ]
+        assert dmesg.check_new_errors() == {"successful": False, "error": first}
+        assert dmesg.capabilities.kmsg_readable is False
+        assert dmesg.check_new_errors() == {"successful": False, "error": "[    5.000000] ice: reset failed"}
+
+    def test_get_records_json(self, dmesg, mocker):
+        mocker.patch.object(dmesg, "get_version", return_value="2.39.3")
+        output = '{"dmesg": [{"pri": 3, "time": 1.5, "msg": "ice: tx timeout"}, {"pri": 3, "msg": "i40e: reset"}]}'
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        records = dmesg.get_records(level=DmesgLevelOptions.ERRORS, structured=True)
+        assert [(record.text, record.level, record.timestamp) for record in records] == [
+            ("[    1.500000] ice: tx timeout", 3, 1.5),
+            ("i40e: reset", 3, None),
+        ]
+        dmesg._connection.execute_command.assert_called_once_with(
+            f"dmesg --json --level=err | {COMPACT_JSON}", shell=True
+        )
+
+    def test_get_records_json_service_name_filtered_on_host(self, dmesg, mocker):
+        mocker.patch.object(dmesg, "get_version", return_value="2.39.3")
+        output = "[    1.500000] ice: tx timeout"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        assert [record.text for record in dmesg.get_records(service_name="ice", structured=True)] == [output]
+        dmesg._connection.execute_command.assert_called_once_with(
+            "dmesg| grep 'ice'", shell=True, expected_return_codes={0, 1}
+        )
+
+    def test_get_records_json_fallback(self, dmesg, mocker):
+        mocker.patch.object(dmesg, "get_version", return_value="2.39.3")
+        output = "[    1.500000] ice: tx timeout"
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCalledProcessError(returncode=1, cmd="dmesg --json", output="", stderr="unrecognized option"),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=output, stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=output, stderr=""),
+        ]
+        assert [record.text for record in dmesg.get_records(structured=True)] == [output]
+        assert [record.text for record in dmesg.get_records(structured=True)] == [output]
+        assert dmesg._connection.execute_command.call_count == 3
+        assert dmesg._connection.execute_command.call_args.args[0] == "dmesg"
+
+    def test_get_records_json_empty_output(self, dmesg, mocker):
+        mocker.patch.object(dmesg, "get_version", return_value="2.39.3")
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr="unrecognized option"),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr=""),
+        ]
+        assert dmesg.get_records(structured=True) == []
+        assert dmesg._connection.execute_command.call_args.args[0] == "dmesg"
+
+    def test_get_records_json_not_supported(self, dmesg, mocker):
+        mocker.patch.object(dmesg, "get_version", return_value="2.31.1")
+        output = "[    1.500000] ice: tx timeout"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        assert [record.text for record in dmesg.get_records(structured=True)] == [output]
+        dmesg._connection.execute_command.assert_called_once_with("dmesg", shell=True)
+
+    def test_get_records_text_by_default(self, dmesg, mocker):
+        get_version = mocker.patch.object(dmesg, "get_version", return_value="2.39.3")
+        output = "[    1.500000] ice: tx timeout"
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        assert [record.text for record in dmesg.get_records()] == [output]
+        dmesg._connection.execute_command.assert_called_once_with("dmesg", shell=True)
+        get_version.assert_not_called()
+
+    def test_check_new_errors_after_clear(self, dmesg):
+        def execute_command(command, **kwargs):
+            if command == CLEAR_COMMAND:
+                stdout = "__MFD_DMESG_KMSG 42 41\n[    1.000000] ice: tx timeout"
+            elif "h[2] + 0 > 41" in command:
+                stdout = "42,43,3000000,-;ice: reset failed\n__MFD_DMESG_KMSG 44 43"
+            else:
+                stdout = ""
+            return ConnectionCompletedProcess(return_code=0, args=command, stdout=stdout, stderr="")
+
+        dmesg._connection.execute_command.side_effect = execute_command
+        assert dmesg.clear_messages() == ("[    1.000000] ice: tx timeout", [])
+        assert dmesg.check_new_errors() == {"successful": False, "error": "[    3.000000] ice: reset failed"}
+        assert dmesg.capabilities.kmsg_readable is True
+        assert dmesg._connection.execute_command.call_count == 2
+
+    def test_clear_messages_kmsg_not_readable(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="", stderr=""
+        )
+        dmesg.clear_messages()
+        dmesg.clear_messages()
+        assert dmesg.capabilities.kmsg_readable is False
+        assert dmesg._connection.execute_command.call_count == 2
+        dmesg._connection.execute_command.assert_called_with(
+            "dmesg -c", shell=True, custom_exception=DmesgExecutionError
+        )
+
+    def test_get_records_after(self, dmesg):
+        output = "4,16,1000000,-;ice: slow\n__MFD_DMESG_KMSG 17 16"
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout=output, stderr=""),
+        ]
+        (record,) = dmesg.get_records_after(15, level=DmesgLevelOptions.WARNINGS)
+        assert (record.sequence, record.level, record.message) == (16, 4, "ice: slow")
+        assert "h[2] + 0 > 15 && h[1] % 8 == 4" in dmesg._connection.execute_command.call_args.args[0]
+
+    def test_get_records_after_kmsg_read_failed(self, dmesg):
+        dmesg._connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr=""),
+            ConnectionCompletedProcess(return_code=1, args="command", stdout="__MFD_DMESG_KMSG 0 -1\n", stderr=""),
+        ]
+        with pytest.raises(DmesgException, match="Failed to read records"):
+            dmesg.get_records_after()
+        assert dmesg.capabilities.kmsg_readable is False
+
+    def test_get_records_after_kmsg_not_readable(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=1, args="command", stdout="", stderr=""
+        )
+        with pytest.raises(DmesgException):
+            dmesg.get_records_after()
+
     def test_check_time_format(self, dmesg):
         output = dedent(
             """2020-11-02T08:30:31.192Z cpu25:2729908)i40en: i40en_InitAdapterConfig:625: LLDP agent is successfully."""
@@ -508,12 +1075,206 @@ class TestDmesg:
         dmesg.get_messages.return_value = "fail"
         assert dmesg.verify_log("driver_name") == "fail"
 
+    def test_verify_logs_bad_word_case_insensitive(self, dmesg, mocker):
+        dmesg.get_messages = mocker.create_autospec(dmesg.get_messages)
+        dmesg.get_messages.return_value = "ok line\nLink FAIL"
+        assert dmesg.verify_log("driver_name") == "ok line\nLink FAIL"
+
     def test_verify_logs_bad_word_error(self, dmesg, mocker):
         dmesg.get_messages = mocker.create_autospec(dmesg.get_messages)
         dmesg.get_messages.return_value = "master of the universe"
         with pytest.raises(BadWordInLog, match="Word 'master' found in log line: 'master of the universe'"):
             dmesg.verify_log("driver_name")
 
+    WINDOW_OUTPUT = dedent(
+        """\
+        [    1.000000] ice 0000:4e:00.0: traffic start
+        [    2.000000] ice 0000:4e:00.0: link down
+        continuation
+        [    3.000000] i40e 0000:18:00.0: link up
+        [    4.000000] ice 0000:4e:00.0: traffic stop"""
+    )
+
+    def test_get_messages_time_window(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=self.WINDOW_OUTPUT, stderr=""
+        )
+        assert dmesg.get_messages(since=2, until=3.5) == (
+            "[    2.000000] ice 0000:4e:00.0: link down\ncontinuation\n[    3.000000] i40e 0000:18:00.0: link up"
+        )
+        assert dmesg.get_messages(since=3.5) == "[    4.000000] ice 0000:4e:00.0: traffic stop"
+        assert dmesg.get_messages(until=0.5) == ""
+        assert [record.timestamp for record in dmesg.get_records(until=1)] == [1.0]
+
+    def test_get_messages_time_window_remote(self, dmesg):
+        def execute_command(command, **kwargs):
+            stdout = "dmesg from util-linux 2.39.3" if command == "dmesg -V" else self.WINDOW_OUTPUT
+            return ConnectionCompletedProcess(return_code=0, args=command, stdout=stdout, stderr="")
+
+        dmesg._connection.execute_command.side_effect = execute_command
+        since = datetime.datetime.fromtimestamp(1700000000)
+        until = datetime.datetime.fromtimestamp(1700000100)
+        output = dmesg.get_messages(level=DmesgLevelOptions.ERRORS, service_name="i40e", since=since, until=until)
+        assert output == "[    3.000000] i40e 0000:18:00.0: link up"
+        dmesg._connection.execute_command.assert_called_with(
+            "TZ=UTC dmesg --level=err --since '2023-11-14 22:13:20' --until '2023-11-14 22:15:00'", shell=True
+        )
+
+    def test_get_messages_time_window_remote_trimmed(self, dmesg):
+        def execute_command(command, **kwargs):
+            if command == "dmesg -V":
+                stdout = "dmesg from util-linux 2.39.3"
+            elif command.startswith("cat /proc/uptime"):
+                stdout = "10.00 35.00\n1700000010.000000000\n"
+            else:
+                stdout = self.WINDOW_OUTPUT
+            return ConnectionCompletedProcess(return_code=0, args=command, stdout=stdout, stderr="")
+
+        dmesg._connection.execute_command.side_effect = execute_command
+        since = datetime.datetime.fromtimestamp(1700000002.5)
+        until = datetime.datetime.fromtimestamp(1700000003.5)
+        assert dmesg.get_messages(since=since, until=until) == "[    3.000000] i40e 0000:18:00.0: link up"
+        commands = [call.args[0] for call in dmesg._connection.execute_command.call_args_list]
+        assert "TZ=UTC dmesg --since '2023-11-14 22:13:22' --until '2023-11-14 22:13:24'" in commands
+
+    def test_get_messages_time_window_old_dmesg(self, dmesg):
+        def execute_command(command, **kwargs):
+            if command == "dmesg -V":
+                stdout = "dmesg from util-linux 2.32.1"
+            elif command.startswith("cat /proc/uptime"):
+                stdout = "10.00 35.00\n1700000010.000000000\n"
+            else:
+                stdout = self.WINDOW_OUTPUT
+            return ConnectionCompletedProcess(return_code=0, args=command, stdout=stdout, stderr="")
+
+        dmesg._connection.execute_command.side_effect = execute_command
+        since = datetime.datetime.fromtimestamp(1700000002.5)
+        assert dmesg.get_messages(since=since, until=3.5) == "[    3.000000] i40e 0000:18:00.0: link up"
+        assert dmesg.get_messages(since=since) == (
+            "[    3.000000] i40e 0000:18:00.0: link up\n[    4.000000] ice 0000:4e:00.0: traffic stop"
+        )
+        commands = [call.args[0] for call in dmesg._connection.execute_command.call_args_list]
+        assert commands.count("cat /proc/uptime; date +%s.%N") == 1
+        assert commands.count("dmesg -V") == 1
+
+    def test_get_messages_time_window_rejected_once(self, dmesg):
+        def execute_command(command, **kwargs):
+            if command == "dmesg -V":
+                stdout = "dmesg from util-linux 2.38.1"
+            elif command.startswith("cat /proc/uptime"):
+                stdout = "10.00 35.00\n1700000010.000000000\n"
+            elif "--since" in command:
+                if kwargs.get("expected_return_codes", frozenset({0})) is None:
+                    return ConnectionCompletedProcess(return_code=1, args=command, stdout="", stderr="")
+                raise ConnectionCalledProcessError(returncode=1, cmd=command, stderr="invalid time value")
+            else:
+                stdout = self.WINDOW_OUTPUT
+            return ConnectionCompletedProcess(return_code=0, args=command, stdout=stdout, stderr="")
+
+        dmesg._connection.execute_command.side_effect = execute_command
+        since = datetime.datetime.fromtimestamp(1700000002.5)
+        until = datetime.datetime.fromtimestamp(1700000003.5)
+        for _ in range(2):
+            assert dmesg.get_messages(since=since, until=until) == "[    3.000000] i40e 0000:18:00.0: link up"
+        commands = [call.args[0] for call in dmesg._connection.execute_command.call_args_list]
+        assert len([command for command in commands if "--since" in command]) == 2
+        assert dmesg.capabilities.time_window is False
+
+    def test_get_messages_time_window_level_rejected(self, dmesg):
+        def execute_command(command, **kwargs):
+            if command == "dmesg -V":
+                stdout = "dmesg from util-linux 2.38.1"
+            elif command.startswith("cat /proc/uptime"):
+                stdout = "10.00 35.00\n1700000010.000000000\n"
+            elif "--since" in command and "--level" in command:
+                raise ConnectionCalledProcessError(returncode=1, cmd=command, stderr="unknown level")
+            else:
+                stdout = self.WINDOW_OUTPUT
+            return ConnectionCompletedProcess(return_code=0, args=command, stdout=stdout, stderr="")
+
+        dmesg._connection.execute_command.side_effect = execute_command
+        since = datetime.datetime.fromtimestamp(1700000002.5)
+        until = datetime.datetime.fromtimestamp(1700000003.5)
+        output = dmesg.get_messages(level=DmesgLevelOptions.ERRORS, since=since, until=until)
+        assert output == "[    3.000000] i40e 0000:18:00.0: link up"
+        assert dmesg.capabilities.time_window is True
+        assert dmesg.get_messages(since=since, until=until) == "[    3.000000] i40e 0000:18:00.0: link up"
+        dmesg._connection.execute_command.assert_called_with(
+            "TZ=UTC dmesg --since '2023-11-14 22:13:22' --until '2023-11-14 22:13:24'", shell=True
+        )
+
+    def test_round_trip_budget(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="log", stderr=""
+        )
+        with dmesg.round_trip_budget(max_commands=2) as budget:
+            dmesg.get_messages()
+            with dmesg.round_trip_budget(max_commands=1) as inner:
+                dmesg.get_messages()
+        assert len(budget.commands) == 2
+        assert inner.commands == ["dmesg"]
+        dmesg.get_messages()
+        assert len(budget.commands) == 2
+
+    def test_round_trip_budget_exceeded(self, dmesg):
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="log", stderr=""
+        )
+        with pytest.raises(RoundTripBudgetExceeded, match="2 commands executed, budget was 1"):
+            with dmesg.round_trip_budget(max_commands=1):
+                dmesg.get_messages()
+                dmesg.get_messages()
+        with pytest.warns(RuntimeWarning):
+            with dmesg.round_trip_budget(max_commands=0, on_exceed="warn"):
+                dmesg.get_messages()
+        with pytest.raises(ValueError):
+            with dmesg.round_trip_budget(max_commands=0, on_exceed="ignore"):
+                pass
+
+    def test_round_trip_budget_does_not_mask_exception(self, dmesg):
+        dmesg._connection.execute_command.side_effect = ConnectionCalledProcessError(returncode=2, cmd="dmesg")
+        with pytest.raises(ConnectionCalledProcessError):
+            with dmesg.round_trip_budget(max_commands=0):
+                dmesg.get_messages()
+
+    def test_get_digest(self, dmesg):
+        output = (
+            '{"records":2,"levels":[0,0,0,1,0,0,1,0],"suppressed":[],'
+            '"errors":["[    2.500001] ice: tx timeout"],"matched":["[    2.500001] ice: tx timeout"]}\n'
+        )
+        dmesg._connection.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=output, stderr=""
+        )
+        digest = dmesg.get_digest(["timeout"])
+        assert (digest.records, digest.levels["err"]) == (2, 1)
+        dmesg._connection.execute_command.assert_called_once_with(
+            f"dmesg -r | {digest_awk(['timeout'])}",
+            shell=True,
+            custom_exception=DmesgExecutionError,
+        )
+        assert dmesg.verify_messages(digest=digest) == {"successful": False, "error": "[    2.500001] ice: tx timeout"}
+        assert dmesg.check_errors(["timeout"], digest=digest) == (False, ["[    2.500001] ice: tx timeout"])
+        assert dmesg._connection.execute_command.call_count == 1
+
+    def test_verify_messages_digest_whitelist(self, dmesg):
+        digest = DmesgDigest(
+            records=2,
+            levels={},
+            errors=["[    5.000000] drm: probed a monitor but no EDID", "[    6.000000] ice: user benign"],
+            matched=[],
+            suppressed={},
+        )
+        assert dmesg.verify_messages(extra_whitelist=["user benign"], digest=digest) == {
+            "successful": True,
+            "error": "",
+        }
+        dmesg._connection.execute_command.assert_not_called()
+
+    def test_check_errors_digest_not_collected(self, dmesg):
+        digest = DmesgDigest(records=0, levels={}, errors=[], matched=[], suppressed={}, error_list=("fail",))
+        with pytest.raises(ValueError):
+            dmesg.check_errors(FAILS, digest=digest)
+
 
 class TestDmesgFreeBSD:
     @pytest.fixture()
@@ -701,6 +1462,10 @@ class TestDmesgFreeBSD:
         )
         assert expected == dmesg.get_messages()
 
+    def test_follow_not_supported(self, dmesg):
+        with pytest.raises(DmesgException):
+            dmesg.follow()
+
     def test_get_messages_additional(self, dmesg):
         output = dedent(
             """
@@ -952,3 +1717,13 @@ class TestDmesgFreeBSD:
         dmesg.get_messages = mocker.create_autospec(dmesg.get_messages)
         dmesg.get_messages.return_value = ""
         assert dmesg.verify_log("driver_name") == ""
+
+
+    def test_get_messages_time_window_datetime(self, dmesg):
+        with pytest.raises(DmesgException, match="not supported on FreeBSD"):
+            dmesg.get_messages(since=datetime.datetime.now())
+        dmesg._connection.execute_command.assert_not_called()
+
+    def test_get_digest_not_supported(self, dmesg):
+        with pytest.raises(DmesgException):
+            dmesg.get_digest()
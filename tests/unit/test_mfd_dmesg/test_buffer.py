@@ -0,0 +1,52 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.buffer` module."""
+
+import pytest
+from mfd_connect.base import ConnectionCompletedProcess
+
+from mfd_dmesg.buffer import DmesgBuffer
+
+OUTPUT = b"\n  [    1.000000] ice: tx timeout\n[    2.000000] ice: NIC Link is Up\n[    3.000000] igb: TX Timeout\n\n"
+
+
+class TestDmesgBuffer:
+    def test_lines(self):
+        buffer = DmesgBuffer(OUTPUT)
+        assert len(buffer) == 3
+        assert list(buffer) == OUTPUT.decode().strip().splitlines()
+        assert buffer.text() == OUTPUT.decode().strip()
+        assert bytes(buffer.line_view(1)) == b"[    2.000000] ice: NIC Link is Up"
+        assert buffer.line(2) == "[    3.000000] igb: TX Timeout"
+        with pytest.raises(IndexError):
+            buffer.line(3)
+
+    @pytest.mark.parametrize("data", [b"", b" \n\n", b"single"])
+    def test_short_output(self, data):
+        buffer = DmesgBuffer(data)
+        assert list(buffer) == data.decode().strip().splitlines()
+        assert list(buffer.find_any(["single"])) == ([0] if data == b"single" else [])
+
+    def test_find_any(self):
+        buffer = DmesgBuffer(OUTPUT)
+        assert list(buffer.find_any(["timeout"])) == [0]
+        assert list(buffer.find_any(["timeout"], ignore_case=True)) == [0, 2]
+        assert list(buffer.find_any(["ice", "tx"])) == [0, 1]
+        assert list(buffer.find_any(["Up\n[", "absent"])) == []
+        assert [record.message for record in buffer.get_records(buffer.find_any([b"Link"]))] == ["ice: NIC Link is Up"]
+
+    def test_find_any_empty_needle(self):
+        buffer = DmesgBuffer(OUTPUT)
+        assert list(buffer.find_any(["absent", ""])) == [0, 1, 2]
+        assert list(DmesgBuffer(b"").find_any([""])) == []
+
+    def test_undecodable_bytes(self):
+        buffer = DmesgBuffer(b"ok\n\xff bad\n")
+        assert buffer.line(1) == "\\xff bad"
+        assert list(buffer.find_any(["bad"])) == [1]
+
+    def test_from_completed_process(self):
+        result = ConnectionCompletedProcess(args="dmesg", stdout="a\nb", stdout_bytes=b"a\nb\nc", return_code=0)
+        assert len(DmesgBuffer.from_completed_process(result)) == 3
+        result = ConnectionCompletedProcess(args="dmesg", stdout="a\nb", return_code=0)
+        assert len(DmesgBuffer.from_completed_process(result)) == 2
@@ -0,0 +1,48 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.capabilities` module."""
+
+import subprocess
+
+from mfd_dmesg.capabilities import (
+    PROBE_MARKER,
+    DmesgCapabilities,
+    build_probe_command,
+    get_version_numbers,
+    parse_probe,
+)
+
+
+class TestCapabilities:
+    def test_get_version_numbers(self):
+        assert get_version_numbers("2.39.3") == (2, 39)
+        assert get_version_numbers("2.38") == (2, 38)
+        assert get_version_numbers("NA") == ()
+        assert get_version_numbers(None) == ()
+
+    def test_acc_imc(self):
+        assert DmesgCapabilities().acc_imc is None
+        assert DmesgCapabilities(level=False).acc_imc is True
+        assert DmesgCapabilities(level=True).acc_imc is False
+
+    def test_build_probe_command(self):
+        command = build_probe_command("dmesg")
+        assert command.startswith("dmesg -V 2>&1; ")
+        assert "TZ=UTC dmesg --since '1970-01-01 00:00:00' --until '1970-01-01 00:00:00' >/dev/null 2>&1;" in command
+        assert command.count(PROBE_MARKER) == 7
+
+    def test_parse_probe(self):
+        output = f"dmesg from util-linux 2.39.3\n{PROBE_MARKER}level=0\n{PROBE_MARKER}json=1\n"
+        assert parse_probe(output) == DmesgCapabilities(version="2.39.3", level=True, json=False)
+
+    def test_parse_probe_no_version(self):
+        assert parse_probe("") == DmesgCapabilities(version="NA")
+
+    def test_probe_command_executed(self):
+        # every marker is printed even when the checked commands do not exist
+        output = subprocess.run(
+            build_probe_command("mfd-dmesg-not-existing"), shell=True, capture_output=True, text=True
+        ).stdout
+        capabilities = parse_probe(output)
+        assert capabilities.version == "NA"
+        assert capabilities.level is capabilities.raw is capabilities.json is capabilities.follow is False
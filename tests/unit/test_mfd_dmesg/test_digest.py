@@ -0,0 +1,67 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.digest` module."""
+
+import subprocess
+from textwrap import dedent
+
+import pytest
+
+from mfd_dmesg.analysis import filter_errors, find_errors
+from mfd_dmesg.digest import digest_awk, get_digest_whitelist, parse_digest
+from mfd_dmesg.records import parse_records
+
+RAW = dedent(
+    """\
+    <6>[    1.000000] ice 0000:4e:00.0: PTP init successful
+    <3>[    2.000000] ice 0000:4e:00.0: tx "timeout" on queue \\x09 back\\slash
+    continuation of the error
+    <3>[    3.000000] ice 0000:4e:00.1: Module is not present.
+    <11>[    4.000000] i8042: No controller found
+    <3>[    5.000000] drm: probed a monitor but no EDID
+    <4>[    6.000000] ice 0000:4e:00.0: warning: fail to read"""
+)
+
+
+def run_digest(output, error_list=None):
+    result = subprocess.run(digest_awk(error_list), shell=True, input=output, capture_output=True, text=True)
+    return parse_digest(result.stdout, error_list)
+
+
+class TestDigest:
+    def test_dmesg_raw(self):
+        digest = run_digest(RAW, ["timeout", "fail", "multi\nline"])
+        assert digest.records == 6
+        assert list(digest.levels.values()) == [0, 0, 0, 4, 1, 0, 1, 0]
+        assert digest.levels["err"] == 4
+        assert digest.errors == [
+            '[    2.000000] ice 0000:4e:00.0: tx "timeout" on queue \\x09 back\\slash',
+            "continuation of the error",
+            "[    5.000000] drm: probed a monitor but no EDID",
+        ]
+        assert digest.matched == [
+            '[    2.000000] ice 0000:4e:00.0: tx "timeout" on queue \\x09 back\\slash',
+            "[    6.000000] ice 0000:4e:00.0: warning: fail to read",
+        ]
+        assert digest.suppressed == {"Module is not present.": 1, "i8042: No controller found": 1}
+
+    def test_empty(self):
+        digest = run_digest("", [""])
+        assert (digest.records, digest.errors, digest.suppressed) == (0, [], {})
+
+    def test_same_as_full_output(self):
+        error_list = ["timeout", "fail", "EDID"]
+        digest = run_digest(RAW, error_list)
+        plain = parse_records(RAW)
+        expected_errors = filter_errors([record for record in plain if record.level in (3, None)])
+        assert filter_errors(digest.get_error_records()) == expected_errors
+        assert find_errors(digest.get_matched_records(error_list), error_list) == find_errors(plain, error_list)
+
+    def test_not_collected_errors(self):
+        with pytest.raises(ValueError):
+            run_digest(RAW, ["fail"]).get_matched_records(["fail", "timeout"])
+
+    def test_whitelist(self):
+        whitelist = get_digest_whitelist()
+        assert "Module is not present." in whitelist
+        assert "probed a monitor but no|invalid EDID" not in whitelist
@@ -0,0 +1,97 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.fleet` module."""
+
+import threading
+
+import pytest
+from mfd_connect import SolConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_dmesg import Dmesg, DmesgFleet
+from mfd_dmesg.exceptions import DmesgException, DmesgExecutionError
+
+
+class TestDmesgFleet:
+    @pytest.fixture()
+    def connections(self, mocker):
+        mocker.patch("mfd_dmesg.Dmesg.check_if_available", mocker.create_autospec(Dmesg.check_if_available))
+        mocker.patch("mfd_dmesg.Dmesg.get_version", mocker.create_autospec(Dmesg.get_version, return_value="2.31.1"))
+        mocker.patch(
+            "mfd_dmesg.Dmesg._get_tool_exec_factory",
+            mocker.create_autospec(Dmesg._get_tool_exec_factory, return_value="dmesg"),
+        )
+        connections = []
+        for ip in ["10.0.0.1", "10.0.0.2"]:
+            conn = mocker.create_autospec(SolConnection)
+            conn.ip = ip
+            conn.get_os_name.return_value = OSName.LINUX
+            conn.execute_command.return_value = ConnectionCompletedProcess(
+                return_code=0, args="command", stdout="", stderr=""
+            )
+            connections.append(conn)
+        return connections
+
+    def test_verify_messages(self, connections):
+        connections[1].execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout="[    4.694322] ice: real error", stderr=""
+        )
+        with DmesgFleet(connections=connections, max_workers=2) as fleet:
+            results = fleet.verify_messages()
+        assert fleet.hosts == ["10.0.0.1", "10.0.0.2"]
+        assert results["10.0.0.1"].result == {"successful": True, "error": ""}
+        assert results["10.0.0.2"].result == {"successful": False, "error": "[    4.694322] ice: real error"}
+        assert all(result.successful and result.duration >= 0 for result in results.values())
+
+    def test_host_failure_does_not_affect_others(self, connections):
+        connections[0].execute_command.side_effect = DmesgExecutionError(returncode=1, cmd="dmesg -c")
+        with DmesgFleet(connections=connections) as fleet:
+            results = fleet.clear_messages()
+        assert isinstance(results["10.0.0.1"].exception, DmesgException)
+        assert results["10.0.0.2"].successful
+        assert results["10.0.0.2"].result == ("", [])
+
+    def test_timeout(self, connections):
+        release = threading.Event()
+
+        def slow(*args, **kwargs):
+            release.wait(5)
+            return ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr="")
+
+        connections[0].execute_command.side_effect = slow
+        with DmesgFleet(connections=connections, timeout=0.2) as fleet:
+            results = fleet.check_errors(["error"])
+            release.set()
+        assert isinstance(results["10.0.0.1"].exception, TimeoutError)
+        assert results["10.0.0.2"].result == (True, [])
+
+    def test_busy_host_skipped_after_timeout(self, connections):
+        release = threading.Event()
+        calls = []
+
+        def slow(*args, **kwargs):
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+            return ConnectionCompletedProcess(return_code=0, args="command", stdout="", stderr="")
+
+        with DmesgFleet(connections=connections, timeout=0.2) as fleet:
+            fleet.get_dmesg("10.0.0.1")
+            connections[0].execute_command.side_effect = slow
+            assert isinstance(fleet.check_errors(["error"])["10.0.0.1"].exception, TimeoutError)
+            results = fleet.check_errors(["error"])
+            assert isinstance(results["10.0.0.1"].exception, TimeoutError)
+            assert "busy" in str(results["10.0.0.1"].exception)
+            assert results["10.0.0.2"].result == (True, [])
+            assert len(calls) == 1
+            release.set()
+            # wait until the hung operation finishes and releases the host
+            assert fleet._host_locks["10.0.0.1"].acquire(timeout=5)
+            fleet._host_locks["10.0.0.1"].release()
+            connections[0].execute_command.side_effect = None
+            assert fleet.check_errors(["error"])["10.0.0.1"].result == (True, [])
+
+    def test_duplicated_hosts(self, connections):
+        connections[1].ip = connections[0].ip
+        with DmesgFleet(connections=connections) as fleet:
+            assert fleet.hosts == ["10.0.0.1", "10.0.0.1#2"]
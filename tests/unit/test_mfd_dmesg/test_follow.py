@@ -0,0 +1,67 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.follow` module."""
+
+import threading
+
+import pytest
+from mfd_connect import SSHConnection
+from mfd_connect.process import RemoteProcess
+
+from mfd_dmesg import DmesgFollower
+from mfd_dmesg.exceptions import DmesgException
+
+
+class TestDmesgFollower:
+    @pytest.fixture()
+    def process(self, mocker):
+        process = mocker.create_autospec(RemoteProcess, instance=True)
+        process.running = True
+        return process
+
+    @pytest.fixture()
+    def connection(self, mocker, process):
+        conn = mocker.create_autospec(SSHConnection)
+        conn.start_process.return_value = process
+        return conn
+
+    def test_follow_yields_lines(self, connection, process):
+        process.get_stdout_iter.return_value = iter(["[    1.000000] first\n", "[    2.000000] second\n"])
+        with DmesgFollower(connection=connection, command="dmesg --follow") as follower:
+            assert list(follower) == ["[    1.000000] first", "[    2.000000] second"]
+        connection.start_process.assert_called_once_with("dmesg --follow", shell=True)
+
+    def test_follow_get_timeout(self, connection, process):
+        release = threading.Event()
+
+        def stdout_iter():
+            yield "line\n"
+            release.wait(5)
+
+        process.get_stdout_iter.return_value = stdout_iter()
+        follower = DmesgFollower(connection=connection, command="dmesg --follow").start()
+        assert follower.get(timeout=5) == "line"
+        assert follower.get(timeout=0.05) is None
+        release.set()
+        follower.stop()
+        process.kill.assert_called_once_with(wait=None)
+        assert not follower.running
+
+    def test_follow_bounded_queue_stop(self, connection, process):
+        process.get_stdout_iter.return_value = iter(f"line {i}\n" for i in range(100))
+        follower = DmesgFollower(connection=connection, command="dmesg --follow", queue_size=2, poll_interval=0.01)
+        follower.start()
+        assert follower.get(timeout=5) == "line 0"
+        follower.stop()
+        assert follower._queue.qsize() <= 2
+
+    def test_follow_start_twice(self, connection, process):
+        process.get_stdout_iter.return_value = iter([])
+        follower = DmesgFollower(connection=connection, command="dmesg --follow").start()
+        with pytest.raises(DmesgException):
+            follower.start()
+        follower.stop()
+
+    def test_follow_wrong_queue_size(self, connection):
+        with pytest.raises(ValueError):
+            DmesgFollower(connection=connection, command="dmesg --follow", queue_size=0)
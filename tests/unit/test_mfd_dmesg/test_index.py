@@ -0,0 +1,60 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.index` module."""
+
+import pytest
+from mfd_typing import OSName
+
+from mfd_dmesg import DmesgSnapshot
+from mfd_dmesg.index import TokenIndex
+
+LINES = [
+    "[    1.000000] ice 0000:4e:00.0: tx timeout on queue 3",
+    "[    2.000000] ice 0000:4e:00.0 eth0: NIC Link is Up",
+    "[    3.000000] igb 0000:01:00.0: Detected Tx Unit Hang",
+    "[    4.000000] ice: timeouts exceeded",
+    "[    5.000000] ---- cut here ----",
+]
+
+
+class TestTokenIndex:
+    @pytest.mark.parametrize(
+        "substring",
+        [
+            "tx timeout",
+            "timeout",
+            "imeou",
+            "0000:4e:00.0",
+            "4e:00",
+            "Link is Up",
+            "ice: time",
+            "Tx",
+            "not present",
+            "----",
+            " ",
+            "",
+        ],
+    )
+    def test_search_same_as_linear_scan(self, substring):
+        assert TokenIndex(LINES).search(substring) == [i for i, line in enumerate(LINES) if substring in line]
+
+    def test_candidates(self):
+        index = TokenIndex(LINES)
+        assert index.candidates("tx timeout") == {0}
+        assert index.candidates("timeout") == {0, 3}
+        assert index.candidates("----") is None
+        assert index.candidates("missing") == frozenset()
+
+
+class TestIndexedSnapshot:
+    def test_queries_same_as_not_indexed(self):
+        output = "\n".join(LINES)
+        indexed = DmesgSnapshot(output, os_name=OSName.LINUX, indexed=True)
+        plain = DmesgSnapshot(output, os_name=OSName.LINUX)
+        assert indexed.indexed and not plain.indexed
+        error_list = ["timeout", "Hang", "timeout", "----"]
+        assert indexed.check_errors(error_list) == plain.check_errors(error_list)
+        assert indexed.search("0000:4e") == plain.search("0000:4e")
+        assert indexed.get_messages(service_name="ice") == plain.get_messages(service_name="ice")
+        for lookout_str in ["Link is Up", "Hang", "absent"]:
+            assert indexed.check_str_present("ice", lookout_str) == plain.check_str_present("ice", lookout_str)
@@ -0,0 +1,115 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.matcher` module."""
+
+import re
+
+import pytest
+
+from mfd_dmesg.constants import FAILS, KNOWN_ERRORS
+from mfd_dmesg.matcher import PatternHit, compile_patterns, get_whitelist_matcher, is_regex_pattern, scan
+
+
+class TestPatternSet:
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("probed a monitor but no|invalid EDID", True),
+            ("Module is not present.", False),
+            ("Port Number: ", False),
+            ("unbalanced (", False),
+        ],
+    )
+    def test_is_regex_pattern(self, pattern, expected):
+        assert is_regex_pattern(pattern) is expected
+
+    def test_search_literals(self):
+        patterns = compile_patterns(("fail", "a.b"))
+        assert patterns.search("link fail detected")
+        assert patterns.search("value a.b")
+        assert not patterns.search("value axb")
+
+    def test_search_regex(self):
+        patterns = compile_patterns(("probed a monitor but no|invalid EDID",))
+        assert patterns.search("[drm] invalid EDID checksum")
+        assert patterns.search("[drm] probed a monitor but no modes")
+
+    def test_search_empty(self):
+        assert not compile_patterns(()).search("anything")
+
+    def test_compile_patterns_cached(self):
+        assert compile_patterns(("a", "b")) is compile_patterns(("a", "b"))
+
+    def test_compile_patterns_options_cached_separately(self):
+        assert compile_patterns(("a",), literal=True) is not compile_patterns(("a",))
+        assert compile_patterns(["a", "b", "a"]).patterns == ("a", "b")
+
+    def test_literal_mode(self):
+        patterns = compile_patterns(["err(1)", "a|b"], literal=True)
+        assert patterns.search("ice: err(1) occurred")
+        assert patterns.search("value a|b")
+        assert not patterns.search("value a")
+
+    def test_find_all(self):
+        patterns = compile_patterns(FAILS, literal=True)
+        assert patterns.find_all("tx timeout error") == ["error", "timeout"]
+        assert patterns.find_all("link up") == []
+
+    def test_find_all_ignore_case(self):
+        patterns = compile_patterns(KNOWN_ERRORS, literal=True, ignore_case=True)
+        assert patterns.find_all("ice: Module is not present.") == ["module is not present"]
+
+    def test_scan(self):
+        pattern_sets = {
+            "error": compile_patterns(["fail", "error"], literal=True),
+            "ignore": compile_patterns(["known"], literal=True),
+        }
+        lines = ["link up", "known fail", "error and fail"]
+        assert list(scan(lines, pattern_sets)) == [
+            PatternHit(1, "known fail", {"error": ["fail"], "ignore": ["known"]}),
+            PatternHit(2, "error and fail", {"error": ["fail", "error"]}),
+        ]
+
+    def test_whitelist_matcher(self):
+        assert get_whitelist_matcher().search("[    1.000000] i8042: No controller found")
+        assert not get_whitelist_matcher().search("[    1.000000] ice: custom benign")
+        assert get_whitelist_matcher(["custom benign"]).search("[    1.000000] ice: custom benign")
+        assert get_whitelist_matcher(["custom benign"]) is get_whitelist_matcher(("custom benign",))
+
+    @pytest.mark.parametrize("entry", ["Tx hang (queue 3)", "ring [5] stalled?", "a|b"])
+    def test_whitelist_matcher_user_entries_literal(self, entry):
+        assert get_whitelist_matcher([entry]).search(f"[    1.000000] ice: {entry}")
+        assert not get_whitelist_matcher(["a|b"]).search("[    1.000000] ice: a")
+
+    def test_whitelist_matcher_user_regex(self):
+        matcher = get_whitelist_matcher([re.compile(r"ring \[\d+\] stalled")])
+        assert matcher.search("[    1.000000] ice: ring [5] stalled?")
+        assert not matcher.search("[    1.000000] ice: ring [x] stalled?")
+
+    def test_whitelist_matcher_builtin_regex(self):
+        assert get_whitelist_matcher(["custom"]).search("[    1.000000] [drm] invalid EDID checksum")
+
+    def test_compiled_pattern_flags(self):
+        patterns = compile_patterns([re.compile("tx HANG", re.IGNORECASE), "Link"], literal=True)
+        assert patterns.search("ice: Tx hang")
+        assert not patterns.search("ice: link up")
+        assert patterns.find_all("ice: tx hang, Link down") == [re.compile("tx HANG", re.IGNORECASE), "Link"]
+
+    def test_whitelist_matcher_user_regex_inline_flags(self):
+        matcher = get_whitelist_matcher([re.compile(r"(?i)tx hang")])
+        assert matcher.search("[    1.000000] ice: TX HANG on queue 3")
+        assert not matcher.search("[    1.000000] ice: tx timeout")
+
+    def test_whitelist_matcher_user_regex_same_group_name(self):
+        matcher = get_whitelist_matcher([re.compile(r"(?P<queue>\d+) hang"), re.compile(r"queue (?P<queue>\d+)")])
+        assert matcher.search("[    1.000000] ice: 3 hang")
+        assert matcher.search("[    1.000000] ice: queue 3")
+        assert not matcher.search("[    1.000000] ice: tx timeout")
+
+    def test_whitelist_matcher_user_regex_backreference(self):
+        patterns = [re.compile(r"(x)y"), re.compile(r"(a)\1")]
+        matcher = get_whitelist_matcher(patterns)
+        assert matcher.search("aa")
+        assert matcher.search("xy")
+        assert not matcher.search("ab")
+        assert matcher.find_all("aa xy") == patterns
@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.records` module."""
+
+from textwrap import dedent
+
+import pytest
+
+from mfd_dmesg.records import DmesgRecord, parse_json_records, parse_kmsg_record, parse_record, parse_records
+
+
+class TestDmesgRecord:
+    def test_parse_plain_line(self):
+        record = parse_record("[15222488.275756] ice 0000:4e:00.0 ens786: NIC Link is Down")
+        assert record.text == "[15222488.275756] ice 0000:4e:00.0 ens786: NIC Link is Down"
+        assert record.message == "ice 0000:4e:00.0 ens786: NIC Link is Down"
+        assert record.timestamp == 15222488.275756
+        assert record.level is None
+        assert record.facility is None
+        assert record.subsystem == "ice"
+        assert record.device == "0000:4e:00.0"
+
+    def test_parse_raw_line(self):
+        record = parse_record("<3>[    4.694322] MODSIGN: Couldn't get UEFI db list")
+        assert record.text == "[    4.694322] MODSIGN: Couldn't get UEFI db list"
+        assert record.message == "MODSIGN: Couldn't get UEFI db list"
+        assert (record.level, record.facility) == (3, 0)
+        assert record.subsystem == "MODSIGN"
+        assert record.device is None
+
+    def test_parse_decoded_line(self):
+        record = parse_record("kern  :warn  : [   33.580364] cdc_ether 1-1.1.2:1.0 enp0s29u1u1u2: CDC: notification")
+        assert record.text == "[   33.580364] cdc_ether 1-1.1.2:1.0 enp0s29u1u1u2: CDC: notification"
+        assert (record.level, record.facility) == (4, 0)
+        assert record.subsystem == "cdc_ether"
+        assert record.device == "1-1.1.2:1.0"
+
+    @pytest.mark.parametrize(
+        "line, subsystem",
+        [
+            ("ix1: using 256 tx descriptors and 512 rx descriptors", "ix1"),
+            ("Couldn't get size: 0x800000000000000e", None),
+            ("", None),
+        ],
+    )
+    def test_parse_line_without_timestamp(self, line, subsystem):
+        record = parse_record(line)
+        assert record.text == record.message == line
+        assert record.timestamp is None
+        assert record.subsystem == subsystem
+
+    def test_parse_records(self):
+        output = dedent(
+            """\
+            [    4.660616] Couldn't get size: 0x800000000000000e
+            [    4.694322] MODSIGN: Couldn't get UEFI db list"""
+        )
+        records = parse_records(output)
+        assert [record.text for record in records] == output.splitlines()
+        assert [record.timestamp for record in records] == [4.660616, 4.694322]
+
+    def test_parse_kmsg_record(self):
+        record = parse_kmsg_record("11,1234,4660616,-;ice 0000:4e:00.0: Failed; to init")
+        assert record.text == "[    4.660616] ice 0000:4e:00.0: Failed; to init"
+        assert record.message == "ice 0000:4e:00.0: Failed; to init"
+        assert (record.level, record.facility, record.sequence) == (3, 1, 1234)
+        assert record.timestamp == 4.660616
+
+    def test_parse_kmsg_continuation_line(self):
+        assert parse_kmsg_record(" SUBSYSTEM=pci") is None
+
+    def test_parse_json_records(self):
+        output = dedent(
+            """\
+            {
+               "dmesg": [
+                  {
+                     "pri": 6,
+                     "time":     4.660616,
+                     "msg": "Linux version \\"6.8\\""
+                  },{
+                     "pri": 11,
+                     "time": 123456.789012,
+                     "caller": "T1",
+                     "msg": "ice 0000:4e:00.0: Failed; to init"
+                  },{
+                     "pri": 4,
+                     "msg": "no timestamp"
+                  }
+               ]
+            }
+            """
+        )
+        first, second, third = parse_json_records(output)
+        assert first.text == '[    4.660616] Linux version "6.8"'
+        assert (first.level, first.facility, first.timestamp, first.caller) == (6, 0, 4.660616, None)
+        assert second.text == "[123456.789012] ice 0000:4e:00.0: Failed; to init"
+        assert (second.level, second.facility, second.caller, second.subsystem) == (3, 1, "T1", "ice")
+        assert (third.text, third.timestamp, third.level) == ("no timestamp", None, 4)
+
+    @pytest.mark.parametrize("output", ["", '{"dmesg": []}\n'])
+    def test_parse_json_records_empty(self, output):
+        assert parse_json_records(output) == []
+
+    @pytest.mark.parametrize("output", ["[    4.660616] Linux version", '{"dmesg": [{"pri": 6, "msg": "x"}'])
+    def test_parse_json_records_invalid(self, output):
+        with pytest.raises(ValueError):
+            parse_json_records(output)
+
+    def test_record_slots(self):
+        with pytest.raises(AttributeError):
+            DmesgRecord("line").other = 1
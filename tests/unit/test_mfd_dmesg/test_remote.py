@@ -0,0 +1,111 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.remote` module."""
+
+import shlex
+import subprocess
+
+import pytest
+
+from mfd_dmesg.remote import fixed_strings_grep, is_basic_regex, kmsg_awk, last_lines_awk, parse_kmsg_trailer
+
+
+class TestRemoteFilters:
+    def test_fixed_strings_grep(self):
+        assert fixed_strings_grep(["error", "it's", "error"]) == "grep -a -F -e error -e 'it'\"'\"'s'"
+
+    @pytest.mark.parametrize("patterns", [[], ["multi\nline"]])
+    def test_fixed_strings_grep_not_possible(self, patterns):
+        assert fixed_strings_grep(patterns) is None
+
+    def test_fixed_strings_grep_same_as_local_filtering(self):
+        patterns = ["it's", "a|b", "$(echo x)", "-v", "back\\slash", "[x]"]
+        lines = ["it's here", "a|b literal", "ab", "$(echo x) literal", "-v flag", "back\\slash", "[x] y", "x"]
+        command = f"printf '%s\\n' {' '.join(shlex.quote(line) for line in lines)} | {fixed_strings_grep(patterns)}"
+        output = subprocess.run(command, shell=True, capture_output=True, text=True).stdout
+        assert output.splitlines() == [line for line in lines if any(pattern in line for pattern in patterns)]
+
+    def test_last_lines_awk_not_possible(self):
+        assert last_lines_awk(10, service_name="multi\nline") is None
+        assert last_lines_awk(10, then_any=["multi\rline"]) is None
+
+    def test_last_lines_awk_single_line(self):
+        # shells like csh do not allow newlines inside of quotes nor environment assignments before command
+        command = last_lines_awk(10, service_name="ice", any_ignore_case=["a", "b"], then_any=["c"])
+        assert "\n" not in command
+        assert command.startswith("awk -v ")
+
+    @pytest.mark.parametrize(
+        "lines, service_name, any_ignore_case, then_any",
+        [
+            (2, None, None, None),
+            (0, None, None, None),
+            (10, "ice", None, None),
+            (2, "ice", ["IT'S", "$(echo x)"], None),
+            (10, None, ["", "nothing"], None),
+            (10, "", ["a|b", "[X]"], ["back\\slash", "-v"]),
+            (1, "ice", None, ["it's"]),
+            (10, "back\\slash", ["\\n", "SLASH"], ["\\"]),
+        ],
+    )
+    def test_last_lines_awk_same_as_local_filtering(self, lines, service_name, any_ignore_case, then_any):
+        input_lines = [
+            "ice it's here",
+            "ice a|b literal",
+            "i40e ab",
+            "ice $(echo x) literal",
+            "-v flag",
+            "ice back\\slash",
+            "[x] y",
+            "ice x",
+        ]
+        command = f"printf '%s\\n' {' '.join(shlex.quote(line) for line in input_lines)} | "
+        command += last_lines_awk(lines, service_name=service_name, any_ignore_case=any_ignore_case, then_any=then_any)
+        output = subprocess.run(command, shell=True, capture_output=True, text=True).stdout
+        expected = [line for line in input_lines if service_name is None or service_name in line]
+        if any_ignore_case and "" not in any_ignore_case:
+            expected = [line for line in expected if any(grep.lower() in line.lower() for grep in any_ignore_case)]
+        expected = expected[-lines:] if lines > 0 else []
+        if then_any:
+            expected = [line for line in expected if any(string in line for string in then_any)]
+        assert output.splitlines() == expected
+
+    @pytest.mark.parametrize(
+        "pattern", ["link.*up", "^ice", "[lL]ink", "up$", "link\\|reset", "ice", "a|b", "it's", "(x)", "x+?{1}"]
+    )
+    def test_is_basic_regex_same_as_grep(self, pattern):
+        lines = ["ice link is up", "ice Link down", "ice linkXup", "i40e a|b (x) x+?{1}", "ice reset", "it's"]
+        command = f"printf '%s\\n' {' '.join(shlex.quote(line) for line in lines)} | grep -e {shlex.quote(pattern)}"
+        output = subprocess.run(command, shell=True, capture_output=True, text=True).stdout
+        literal = [line for line in lines if pattern in line]
+        if not is_basic_regex(pattern):
+            assert output.splitlines() == literal
+        else:
+            assert output.splitlines() != literal
+
+    @pytest.mark.parametrize(
+        "output, after_sequence, level, expected",
+        [
+            (
+                "6,10,100,-;ice up\n SUBSYSTEM=pci\n3,11,200,c;ice fail\n",
+                None,
+                None,
+                ["6,10,100,-;ice up", "3,11,200,c;ice fail"],
+            ),
+            ("6,10,100,-;ice up\n3,11,200,c;ice fail\n", 10, None, ["3,11,200,c;ice fail"]),
+            ("6,10,100,-;ice up\n11,11,200,c;ice fail\n", None, 3, ["11,11,200,c;ice fail"]),
+        ],
+    )
+    def test_kmsg_awk(self, output, after_sequence, level, expected):
+        command = kmsg_awk(after_sequence=after_sequence, level=level)
+        result = subprocess.run(command, shell=True, input=output, capture_output=True, text=True).stdout.splitlines()
+        assert result[:-1] == expected
+        assert parse_kmsg_trailer(result[-1]) == (2, 11)
+
+    def test_kmsg_awk_nothing_read(self):
+        output = subprocess.run(kmsg_awk(print_records=False), shell=True, input="", capture_output=True, text=True)
+        assert parse_kmsg_trailer(output.stdout.strip()) == (0, -1)
+
+    @pytest.mark.parametrize("line", ["", "[    1.000000] ice: up", "__MFD_DMESG_KMSG x 1", "__MFD_DMESG_KMSG 1"])
+    def test_parse_kmsg_trailer_not_trailer(self, line):
+        assert parse_kmsg_trailer(line) is None
@@ -0,0 +1,132 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.replay` module."""
+
+import gzip
+from pathlib import PurePosixPath
+
+import pytest
+from mfd_connect import SolConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSBitness, OSName, OSType
+from mfd_typing.cpu_values import CPUArchitecture
+
+from mfd_dmesg import Dmesg, RecordingConnection, ReplayConnection
+from mfd_dmesg.exceptions import DmesgExecutionError, ReplayError
+
+OUTPUTS = {
+    "dmesg -V": b"dmesg from util-linux 2.39.3\n",
+    "dmesg": b"[    1.000000] ice 0000:4e:00.0: PTP init successful\n[    2.000000] caf\xe9\n",
+}
+
+
+@pytest.fixture()
+def connection(mocker):
+    connection = mocker.create_autospec(SolConnection)
+    connection.get_os_name.return_value = OSName.LINUX
+    connection.get_os_type.return_value = OSType.POSIX
+    connection.get_os_bitness.return_value = OSBitness.OS_64BIT
+    connection.get_cpu_architecture.side_effect = NotImplementedError
+
+    def execute_command(command, **kwargs):
+        stdout = OUTPUTS.get(command, b"")
+        return ConnectionCompletedProcess(
+            args=command,
+            stdout=stdout.decode(errors="backslashreplace"),
+            stderr="" if command in OUTPUTS else "not found",
+            stdout_bytes=stdout,
+            stderr_bytes=b"" if command in OUTPUTS else b"not found",
+            return_code=0 if command in OUTPUTS else 127,
+        )
+
+    connection.execute_command.side_effect = execute_command
+    return connection
+
+
+@pytest.fixture()
+def recording(connection, tmp_path):
+    path = tmp_path / "recording.jsonl.gz"
+    with RecordingConnection(connection, path) as recorder:
+        recorder.execute_command("dmesg -V")
+        recorder.execute_command("dmesg")
+        recorder.execute_command("dmesg")
+        with pytest.raises(ConnectionCalledProcessError):
+            recorder.execute_command("missing")
+    return path
+
+
+class TestReplay:
+    def test_replay_in_recorded_order(self, recording):
+        replay = ReplayConnection(recording, time_scale=0)
+        assert replay.get_os_name() == OSName.LINUX
+        result = replay.execute_command("dmesg")
+        assert result.stdout_bytes == OUTPUTS["dmesg"]
+        assert result.stdout.endswith("caf\\xe9\n")
+        assert replay.execute_command("dmesg -V").stdout == "dmesg from util-linux 2.39.3\n"
+        assert replay.execute_command("dmesg").stdout_bytes == OUTPUTS["dmesg"]
+        with pytest.raises(ReplayError):
+            replay.execute_command("dmesg")
+        assert replay.executed == ["dmesg", "dmesg -V", "dmesg"]
+
+    def test_return_code(self, recording):
+        replay = ReplayConnection(recording, time_scale=0)
+        with pytest.raises(ConnectionCalledProcessError):
+            replay.execute_command("missing")
+        replay.rewind()
+        assert replay.execute_command("missing", expected_return_codes=None).return_code == 127
+        replay.rewind()
+        with pytest.raises(DmesgExecutionError):
+            replay.execute_command("missing", custom_exception=DmesgExecutionError)
+
+    def test_not_recorded_command(self, recording):
+        with pytest.raises(ReplayError):
+            ReplayConnection(recording, time_scale=0).execute_command("dmesg -c")
+
+    def test_cycle(self, recording):
+        replay = ReplayConnection(recording, time_scale=0, cycle=True)
+        for _ in range(5):
+            assert replay.execute_command("dmesg -V").return_code == 0
+
+    def test_time_scale(self, recording, mocker):
+        sleep = mocker.patch("mfd_dmesg.replay.time.sleep")
+        ReplayConnection(recording, time_scale=2).execute_command("dmesg")
+        sleep.assert_called_once()
+        ReplayConnection(recording, time_scale=0).execute_command("dmesg")
+        sleep.assert_called_once()
+
+    def test_unsupported_file(self, tmp_path):
+        path = tmp_path / "recording.jsonl.gz"
+        with gzip.open(path, "wt") as file:
+            file.write('{"version": 100}\n')
+        with pytest.raises(ReplayError):
+            ReplayConnection(path)
+
+    def test_dmesg_on_replay(self, connection, tmp_path, mocker):
+        mocker.patch(
+            "mfd_dmesg.Dmesg._get_tool_exec_factory",
+            mocker.create_autospec(Dmesg._get_tool_exec_factory, return_value="dmesg"),
+        )
+        path = tmp_path / "recording.jsonl.gz"
+        with RecordingConnection(connection, path) as recorder:
+            recorded = Dmesg(connection=recorder).get_messages()
+        assert Dmesg(connection=ReplayConnection(path, time_scale=0)).get_messages() == recorded
+
+    def test_replay_host_information(self, recording):
+        replay = ReplayConnection(recording, time_scale=0)
+        assert replay.get_os_type() == OSType.POSIX
+        assert replay.get_os_bitness() == OSBitness.OS_64BIT
+        assert replay.path is PurePosixPath
+        with pytest.raises(ReplayError, match="cpu_architecture"):
+            replay.get_cpu_architecture()
+        with pytest.raises(ReplayError):
+            replay.restart_platform()
+        replay.wait_for_host()
+
+    def test_replay_host_information_recorded(self, connection, tmp_path):
+        connection.get_cpu_architecture.side_effect = None
+        connection.get_cpu_architecture.return_value = CPUArchitecture.ARM64
+        path = tmp_path / "recording.jsonl.gz"
+        with RecordingConnection(connection, path):
+            pass
+        assert ReplayConnection(path).get_cpu_architecture() == CPUArchitecture.ARM64
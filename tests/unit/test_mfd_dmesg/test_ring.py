@@ -0,0 +1,84 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.ring` module."""
+
+import pytest
+
+from mfd_dmesg import Dmesg, DmesgRingBuffer
+from mfd_dmesg.exceptions import DmesgException
+from mfd_dmesg.records import parse_kmsg_record, parse_record
+
+
+def line(timestamp: float, message: str = "ice: message") -> str:
+    return f"[{timestamp:12.6f}] {message}"
+
+
+class TestDmesgRingBuffer:
+    def test_evicts_oldest_by_count(self):
+        ring = DmesgRingBuffer(max_records=3)
+        ring.extend(line(i) for i in range(5))
+        assert len(ring) == 3
+        assert [record.timestamp for record in ring] == [2, 3, 4]
+        assert ring.evicted == 2
+
+    def test_evicts_oldest_by_bytes(self):
+        ring = DmesgRingBuffer(max_bytes=2 * len(line(0)))
+        ring.extend(line(i) for i in range(4))
+        assert [record.timestamp for record in ring] == [2, 3]
+        assert ring.size == 2 * len(line(0))
+        ring.append(line(4, "x" * 100))
+        assert [record.timestamp for record in ring] == [4]
+
+    def test_pinned(self):
+        ring = DmesgRingBuffer(max_records=2, pin_patterns=["Call Trace"], max_pinned=2)
+        ring.append(line(0, "Call Trace:"))
+        ring.append(line(1), pin=True)
+        ring.extend(line(i) for i in range(2, 5))
+        ring.append(line(5, "Call Trace:"))
+        assert [record.timestamp for record in ring.pinned] == [0, 1, 5]
+        ring.extend(line(i, "Call Trace:") for i in range(6, 9))
+        assert [record.timestamp for record in ring.pinned] == [5, 6, 7, 8]
+
+    def test_time_slicing(self):
+        ring = DmesgRingBuffer(max_records=100)
+        assert ring.last(10) == []
+        ring.append("line without timestamp")
+        for i in range(0, 200, 2):
+            ring.append(line(i))
+            ring.append("continuation")
+        assert [record.timestamp for record in ring.last(5)] == [194, None, 196, None, 198, None]
+        assert len(ring.since(150)) == 50
+        assert ring.since(1000) == []
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            DmesgRingBuffer(max_records=0)
+
+    def test_update_kmsg(self, mocker):
+        dmesg = mocker.create_autospec(Dmesg, instance=True)
+        dmesg.get_records_after.side_effect = [
+            [parse_kmsg_record("3,10,1000000,-;first"), parse_kmsg_record("6,11,2000000,-;second")],
+            [parse_kmsg_record("6,12,3000000,-;third")],
+        ]
+        ring = DmesgRingBuffer(dmesg)
+        assert ring.update() == 2
+        assert ring.update() == 1
+        assert dmesg.get_records_after.call_args_list == [mocker.call(None), mocker.call(11)]
+        assert [record.sequence for record in ring] == [10, 11, 12]
+
+    def test_update_without_kmsg(self, mocker):
+        dmesg = mocker.create_autospec(Dmesg, instance=True)
+        dmesg.get_records_after.side_effect = DmesgException("not readable")
+        dmesg.get_records.side_effect = [
+            [parse_record(line(1)), parse_record(line(2))],
+            [parse_record(line(1)), parse_record(line(2)), parse_record("continuation"), parse_record(line(3))],
+        ]
+        ring = DmesgRingBuffer(dmesg)
+        assert ring.update() == 2
+        assert ring.update() == 1
+        dmesg.get_records_after.assert_called_once()
+        assert [record.timestamp for record in ring] == [1, 2, 3]
+
+    def test_update_without_dmesg(self):
+        with pytest.raises(DmesgException):
+            DmesgRingBuffer().update()
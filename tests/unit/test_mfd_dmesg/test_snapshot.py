@@ -0,0 +1,114 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.snapshot` module."""
+
+from textwrap import dedent
+
+import pytest
+from mfd_connect import SolConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSName
+
+from mfd_dmesg import Dmesg, DmesgLevelOptions, DmesgSnapshot, OSPackageInfo
+from mfd_dmesg.exceptions import BadWordInLog
+
+RAW_OUTPUT = dedent(
+    """\
+    <6>[    0.000000] Linux version 5.15.0
+    <6>[    1.000000] ice: The DDP package was successfully loaded: ICE OS Default Package version 1.3.30.0
+    <6>[    2.000000] ix1: using 512 tx descriptors and 256 rx descriptors
+    <3>[    3.000000] ice 0000:4e:00.0: tx timeout
+    <3>[    4.000000] igb: Failed to set PTP clock index parameter
+    <4>[    5.000000] ice 0000:4e:00.0: link is slow
+    """
+)
+
+
+class TestDmesgSnapshot:
+    @pytest.fixture()
+    def snapshot(self):
+        return DmesgSnapshot(RAW_OUTPUT.strip(), os_name=OSName.LINUX, captured_at=100.0)
+
+    def test_output(self, snapshot):
+        assert len(snapshot) == 6
+        assert snapshot.has_levels
+        assert snapshot.captured_at == 100.0
+        assert snapshot.output.splitlines()[0] == "[    0.000000] Linux version 5.15.0"
+        with pytest.raises(AttributeError):
+            snapshot.output = ""
+
+    def test_get_messages(self, snapshot):
+        assert snapshot.get_messages(level=DmesgLevelOptions.ERRORS, service_name="ice") == (
+            "[    3.000000] ice 0000:4e:00.0: tx timeout"
+        )
+        warnings = snapshot.get_messages(level=DmesgLevelOptions.WARNINGS)
+        assert warnings == "[    5.000000] ice 0000:4e:00.0: link is slow"
+        assert snapshot.get_messages(level=DmesgLevelOptions.CRITICAL) == ""
+        assert snapshot.get_messages_additional(service_name="ice", lines=1) == (
+            "[    5.000000] ice 0000:4e:00.0: link is slow"
+        )
+        assert snapshot.get_messages_additional(additional_greps=["TX TIMEOUT", "version 5"]).count("\n") == 1
+
+    def test_time_window(self, snapshot):
+        assert snapshot.get_messages(since=2.5, until=4) == (
+            "[    3.000000] ice 0000:4e:00.0: tx timeout\n[    4.000000] igb: Failed to set PTP clock index parameter"
+        )
+        assert snapshot.get_messages(level=DmesgLevelOptions.ERRORS, service_name="ice", until=3) == (
+            "[    3.000000] ice 0000:4e:00.0: tx timeout"
+        )
+        assert [record.timestamp for record in snapshot.get_records(since=4.5)] == [5.0]
+        assert snapshot.get_records(since=6) == []
+
+    def test_queries(self, snapshot):
+        assert snapshot.get_os_package_info() == OSPackageInfo("DDP", "ICE OS Default Package", "1.3.30.0")
+        (buffer_size,) = snapshot.get_buffer_size_data("ix", "1")
+        assert buffer_size.group("tx") == "512"
+        assert snapshot.verify_messages() == {
+            "successful": False,
+            "error": "[    3.000000] ice 0000:4e:00.0: tx timeout",
+        }
+        assert snapshot.check_errors(["timeout"]) == (False, ["[    3.000000] ice 0000:4e:00.0: tx timeout"])
+        assert snapshot.check_str_present("ice", "link is slow")
+        assert not snapshot.check_str_present("igb", "link is slow")
+        assert snapshot.verify_log("ice") == ""
+
+    def test_verify_log_bad_word(self):
+        snapshot = DmesgSnapshot("<3>[    1.000000] ice: master device", os_name=OSName.LINUX)
+        with pytest.raises(BadWordInLog):
+            snapshot.verify_log("ice")
+
+    def test_plain_output_freebsd(self):
+        snapshot = DmesgSnapshot("ix0: Error in init\nix0: link up\nem0: error", os_name=OSName.FREEBSD)
+        assert not snapshot.has_levels
+        assert snapshot.verify_messages() == {"successful": False, "error": "ix0: Error in init\nem0: error"}
+        assert snapshot.verify_messages(aggregate=True)["error"] == "ix0: Error in init\nem0: error"
+        assert snapshot.get_messages(level=DmesgLevelOptions.ERRORS, service_name="ix0") == "ix0: Error in init"
+        assert snapshot.verify_log("ix0") == ""
+
+    def test_capture(self, mocker):
+        mocker.patch("mfd_dmesg.Dmesg.check_if_available", mocker.create_autospec(Dmesg.check_if_available))
+        mocker.patch("mfd_dmesg.Dmesg.get_version", mocker.create_autospec(Dmesg.get_version, return_value="2.31.1"))
+        mocker.patch(
+            "mfd_dmesg.Dmesg._get_tool_exec_factory",
+            mocker.create_autospec(Dmesg._get_tool_exec_factory, return_value="dmesg"),
+        )
+        conn = mocker.create_autospec(SolConnection)
+        conn.get_os_name.return_value = OSName.LINUX
+        dmesg = Dmesg(connection=conn)
+        conn.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=RAW_OUTPUT, stderr=""
+        )
+        snapshot = dmesg.snapshot()
+        conn.execute_command.assert_called_once_with("dmesg -r", shell=True, expected_return_codes={0, 1})
+        assert snapshot.check_errors(["timeout"])[0] is False
+        assert snapshot.get_messages(level=DmesgLevelOptions.WARNINGS) != ""
+        assert conn.execute_command.call_count == 1
+
+        conn.execute_command.side_effect = [
+            ConnectionCalledProcessError(returncode=1, cmd="dmesg -r"),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="ice: init failed\n", stderr=""),
+        ]
+        snapshot = dmesg.snapshot()
+        assert not snapshot.has_levels
+        assert snapshot.get_messages(level=DmesgLevelOptions.ERRORS) == "ice: init failed"
@@ -0,0 +1,119 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.stats` module."""
+
+import pytest
+from mfd_connect import SolConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSName
+
+from mfd_dmesg import Dmesg
+from mfd_dmesg.stats import CallStats, DmesgStats, received_bytes
+
+OUTPUT = "[    1.000000] ice 0000:4e:00.0: PTP init successful\n[    2.000000] ice: NIC Link is Up\n"
+
+
+@pytest.fixture()
+def dmesg(mocker):
+    mocker.patch("mfd_dmesg.Dmesg.check_if_available", mocker.create_autospec(Dmesg.check_if_available))
+    mocker.patch("mfd_dmesg.Dmesg.get_version", mocker.create_autospec(Dmesg.get_version, return_value="2.31.1"))
+    mocker.patch(
+        "mfd_dmesg.Dmesg._get_tool_exec_factory",
+        mocker.create_autospec(Dmesg._get_tool_exec_factory, return_value="dmesg"),
+    )
+    conn = mocker.create_autospec(SolConnection)
+    conn.get_os_name.return_value = OSName.LINUX
+    conn.execute_command.return_value = ConnectionCompletedProcess(
+        return_code=0, args="command", stdout=OUTPUT, stderr=""
+    )
+    dg = Dmesg(connection=conn, collect_stats=True)
+    mocker.stopall()
+    return dg
+
+
+class TestDmesgStats:
+    def test_disabled_by_default(self, mocker):
+        stats = DmesgStats()
+        assert not stats.enabled
+        function = mocker.Mock(return_value=1)
+        assert stats.measure("method", function, 2) == 1
+        function.assert_called_once_with(2)
+        assert stats.get("method").calls == 1
+        assert stats.get("other") == CallStats("other")
+
+    def test_accumulate_and_reset(self):
+        stats = DmesgStats(enabled=True)
+        stats.measure("method", lambda: None)
+        stats.measure("method", lambda: None)
+        stats.measure("other", lambda: None)
+        assert stats.get("method").calls == 2
+        assert stats.total.calls == 3
+        assert set(stats) == {"method", "other"}
+        stats.reset()
+        assert stats.as_dict() == {}
+
+    def test_nested_calls_accounted_to_outer(self):
+        stats = DmesgStats(enabled=True)
+        stats.measure("outer", lambda: stats.measure("inner", lambda: None))
+        assert list(stats) == ["outer"]
+
+    def test_callback_failure_is_ignored(self):
+        calls = []
+
+        def callback(call):
+            calls.append(call)
+            raise ValueError
+
+        stats = DmesgStats(enabled=True, callback=callback)
+        assert stats.measure("method", lambda: 5) == 5
+        assert [call.method for call in calls] == ["method"]
+
+    def test_received_bytes(self):
+        unicode_output = ConnectionCompletedProcess(return_code=0, args="", stdout="zażółć", stderr="ab")
+        assert received_bytes(unicode_output) == 12
+        assert received_bytes(ConnectionCompletedProcess(return_code=0, args="", stdout_bytes=b"abc", stderr="")) == 3
+        assert received_bytes(ConnectionCalledProcessError(returncode=1, cmd="", output="abc", stderr=None)) == 3
+
+
+class TestDmesgInstrumentation:
+    def test_public_method(self, dmesg):
+        dmesg.verify_messages()
+        stats = dmesg.stats.get("verify_messages")
+        assert stats.calls == 1
+        assert stats.commands == 1
+        assert stats.bytes_received == len(OUTPUT)
+        assert stats.remote_time >= 0 and stats.local_time >= 0
+        assert list(dmesg.stats) == ["verify_messages"]
+
+    def test_failed_command(self, dmesg):
+        dmesg._connection.execute_command.side_effect = ConnectionCalledProcessError(
+            returncode=1, cmd="dmesg", output="", stderr="error"
+        )
+        with pytest.raises(Exception):
+            dmesg.check_if_available()
+        assert dmesg.stats.get("check_if_available").commands == 1
+        assert dmesg.stats.get("check_if_available").bytes_received == 5
+
+    def test_disabled(self, dmesg):
+        dmesg.stats.enabled = False
+        dmesg.get_messages()
+        assert dmesg.stats.as_dict() == {}
+
+    def test_callback(self, mocker):
+        mocker.patch("mfd_dmesg.Dmesg.check_if_available", mocker.create_autospec(Dmesg.check_if_available))
+        mocker.patch("mfd_dmesg.Dmesg.get_version", mocker.create_autospec(Dmesg.get_version, return_value="2.31.1"))
+        mocker.patch(
+            "mfd_dmesg.Dmesg._get_tool_exec_factory",
+            mocker.create_autospec(Dmesg._get_tool_exec_factory, return_value="dmesg"),
+        )
+        conn = mocker.create_autospec(SolConnection)
+        conn.get_os_name.return_value = OSName.LINUX
+        conn.execute_command.return_value = ConnectionCompletedProcess(
+            return_code=0, args="command", stdout=OUTPUT, stderr=""
+        )
+        callback = mocker.Mock()
+        dg = Dmesg(connection=conn, stats_callback=callback)
+        dg.get_messages()
+        callback.assert_called_once()
+        assert callback.call_args.args[0].method == "get_messages"
@@ -0,0 +1,53 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_dmesg.templates` module."""
+
+import pytest
+
+from mfd_dmesg.records import parse_records
+from mfd_dmesg.templates import MessageTemplate, mine_templates, normalize
+
+
+class TestNormalize:
+    @pytest.mark.parametrize(
+        "message, template",
+        [
+            ("ice 0000:4e:00.0: tx timeout on queue 17", "ice <PCI>: tx timeout on queue <NUM>"),
+            ("i40e 18:00.1: MAC aa:bb:cc:dd:ee:ff added", "i40e <PCI>: MAC <MAC> added"),
+            ("addr 0x1fe0 at ffff888123456789 from 10.0.0.1", "addr <HEX> at <HEX> from <IP>"),
+            ("ice 0000:4e:00.1 eth0: renamed from eth4", "ice <PCI> eth0: renamed from eth4"),
+            ("NIC Link is Up 2.5 Gbps, offset -12", "NIC Link is Up <NUM> Gbps, offset <NUM>"),
+            ("firmware version 1.2.3", "firmware version 1.2.3"),
+        ],
+    )
+    def test_normalize(self, message, template):
+        assert normalize(message) == template
+
+
+class TestMineTemplates:
+    def test_mine_templates(self):
+        records = parse_records(
+            "[    1.000000] ice 0000:4e:00.0: Detected Tx Unit Hang queue 1\n"
+            "continuation without timestamp\n"
+            "[    2.000000] ice 0000:4e:00.1: Detected Tx Unit Hang queue 7\n"
+            "[    3.000000] ice 0000:4e:00.1: Detected Tx Unit Hang queue 9"
+        )
+        assert mine_templates(records) == [
+            MessageTemplate(
+                "ice <PCI>: Detected Tx Unit Hang queue <NUM>",
+                3,
+                1.0,
+                3.0,
+                "[    1.000000] ice 0000:4e:00.0: Detected Tx Unit Hang queue 1",
+            ),
+            MessageTemplate("continuation without timestamp", 1, None, None, "continuation without timestamp"),
+        ]
+
+    def test_first_timestamp_of_template_without_timestamp(self):
+        records = parse_records("queue 1 stuck\n[    5.000000] queue 2 stuck")
+        template = mine_templates(records)[0]
+        assert (template.count, template.first_timestamp, template.last_timestamp) == (2, 5.0, 5.0)
+        assert str(template) == "[2x 5.000000..5.000000] queue <NUM> stuck (e.g. queue 1 stuck)"
+
+    def test_single_message_str(self):
+        assert str(mine_templates(parse_records("[    1.000000] ice: error"))[0]) == "[    1.000000] ice: error"